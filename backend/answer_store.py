@@ -0,0 +1,59 @@
+# backend/answer_store.py
+#
+# Optional per-answer artifacts so confidence can be re-scored after the
+# formula changes (see backend/rescore_confidence.py).
+#
+# STORE_ANSWER_AUDIO:
+# none     → nothing is kept (default)
+# features → compressed confidence feature frames (~20 KB per answer minute)
+# audio    → Ogg/Opus of the decoded answer (~180 KB per answer minute)
+#
+# Artifacts go to GridFS as soon as the answer is scored; the session only
+# keeps a small reference, which ends up on the interview document.
+
+import io
+import os
+
+import numpy as np
+
+from backend.audio_decode import SAMPLE_RATE, decode_audio, encode_audio
+from backend.confidence_utils import frame_features, get_confidence_score, score_features, summarize_frames
+
+STORE_ANSWER_AUDIO = os.getenv("STORE_ANSWER_AUDIO", "none").lower()
+ARTIFACT_KINDS = ("features", "audio")
+
+
+def pack_features(frames):
+    buf = io.BytesIO()
+    arrays = {k: np.asarray(frames[k], dtype=np.float16) for k in ("rms", "zcr", "f0") if frames.get(k) is not None}
+    np.savez_compressed(buf, sr=frames["sr"], hop_s=frames["hop_s"], duration=frames["duration"], **arrays)
+    return buf.getvalue()
+
+
+def unpack_features(data):
+    with np.load(io.BytesIO(data)) as npz:
+        frames = {k: npz[k].astype(np.float32) for k in npz.files}
+    for k in ("sr", "hop_s", "duration"):
+        frames[k] = frames[k].item()
+    return frames
+
+
+def save_answer_artifact(pcm, sr=SAMPLE_RATE, kind=STORE_ANSWER_AUDIO):
+    """GridFS file id of the stored artifact, or None when storage is off or fails."""
+    if kind not in ARTIFACT_KINDS:
+        return None
+    from backend.database import answer_artifacts_fs
+
+    try:
+        data = pack_features(frame_features(pcm, sr)) if kind == "features" else encode_audio(pcm, sr)
+        return str(answer_artifacts_fs.put(data, kind=kind, sr=sr))
+    except Exception as e:
+        print(f"[Answer Store Error] {e}")
+        return None
+
+
+def score_artifact(kind, data):
+    """Confidence for a stored artifact with the current scorer."""
+    if kind == "features":
+        return score_features(summarize_frames(unpack_features(data)))
+    return get_confidence_score(decode_audio(data), SAMPLE_RATE)
@@ -1,39 +1,98 @@
 # app.py
-from fastapi import FastAPI, File, UploadFile, Form, Depends, HTTPException, Header, Request, APIRouter, Body
+from fastapi import FastAPI, File, UploadFile, Form, Depends, HTTPException, Header, Request, APIRouter, Body, WebSocket, WebSocketDisconnect
 from backend.models.user_model import UserSchema
 from backend.database import users_collection, interviews_collection
 from datetime import datetime
 from pydantic import BaseModel
 from backend.auth import get_current_user, get_current_user_full
 from fastapi.middleware.cors import CORSMiddleware
-from backend.interview_session import InterviewSession
-from backend.resume_parser import parse_resume_with_llm
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from backend.interview_session import InterviewSession, RESTART_QUESTION
+from backend.resume_cache import parse_resume_cached
 from backend.coding_session import CodingSession
-from backend.speech_to_text import transcribe
+from backend.speech_to_text import transcribe_speech, get_engine_pool
+from backend.vad import has_speech
+from backend import metrics
 from langchain_ollama import OllamaLLM  
 from uuid import uuid4
 from backend.interview_session import InterviewSession
 from backend.confidence_utils import get_confidence_score
+from backend.answer_store import STORE_ANSWER_AUDIO, save_answer_artifact
+from backend.audio_decode import decode_audio, SAMPLE_RATE
+from backend.streaming_stt import StreamingTranscriber
+from backend.speculation import SPECULATIVE_QUESTIONS, draft_matches
 from typing import Optional
 from bson import ObjectId
 from backend.routes import dashboard
+from backend.routes import metrics as metrics_routes
+from backend.executor import run_in_pool, stream_in_pool, shutdown_pools
 
+import asyncio
+import hashlib
 import json
 import numpy as np
 from backend.hr_session import HRInterviewSession
+from backend.session_store import create_session_store
 from backend.routes.user import router as user_router
 
 from langchain_core.prompts import PromptTemplate
-import tempfile
 import os
 import uvicorn
 
 app = FastAPI()
-user_sessions = {}
+session_store = create_session_store()
 
 router = APIRouter()
 app.include_router(user_router)
 app.include_router(dashboard.router)
+app.include_router(metrics_routes.router)
+
+
+@app.on_event("startup")
+async def _warm_stt_models():
+    # Load the Whisper pool before the first answer arrives
+    await run_in_pool("stt", get_engine_pool)
+
+
+# How often idle sessions are swept when no request happens to trigger eviction
+SESSION_SWEEP_INTERVAL_S = int(os.getenv("SESSION_SWEEP_INTERVAL_S", 60))
+
+
+_background_tasks = {}
+
+
+@app.on_event("startup")
+async def _start_session_sweeper():
+    async def sweep_forever():
+        while True:
+            await asyncio.sleep(SESSION_SWEEP_INTERVAL_S)
+            try:
+                # Spilling evicted sessions to the fallback store is blocking I/O
+                evicted = await run_in_pool("store", session_store.sweep)
+            except Exception as e:
+                print(f"[Session Sweep Error] {e}")
+                continue
+            if evicted:
+                print(f"🧹 Evicted {evicted} idle interview session(s)")
+
+    # The loop only keeps weak references to tasks, so hold on to it until shutdown
+    _background_tasks["session_sweeper"] = asyncio.create_task(sweep_forever())
+
+
+@app.on_event("shutdown")
+async def _stop_session_sweeper():
+    task = _background_tasks.pop("session_sweeper", None)
+    if task:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+
+@app.on_event("shutdown")
+def _shutdown_pools():
+    shutdown_pools()
 
 # CORS setup
 app.add_middleware(
@@ -124,16 +183,16 @@ async def setup_session(
 
     # Session setup logic
     if interview_type == "technical":
-        user_sessions[user] = InterviewSession(role=role, resume_obj=resume_text, rounds=rounds, session_id=session_id)
+        await run_in_pool("store", session_store.put, user, InterviewSession(role=role, resume_obj=resume_text, rounds=rounds, session_id=session_id))
 
     elif interview_type == "behavioral":
-        user_sessions[user] = HRInterviewSession(role=role, rounds=rounds, session_id=session_id)
+        await run_in_pool("store", session_store.put, user, HRInterviewSession(role=role, rounds=rounds, session_id=session_id))
 
     elif interview_type == "coding":
         # Skip coding round for frontend roles if desired
         if role.lower() == "frontend developer":
             raise HTTPException(status_code=400, detail="Frontend developers do not have coding rounds.")
-        user_sessions[user] = CodingSession(role=role, rounds=rounds)
+        await run_in_pool("store", session_store.put, user, CodingSession(role=role, rounds=rounds))
 
     elif interview_type == "full":
         session_data = {
@@ -147,7 +206,7 @@ async def setup_session(
         if role.lower() != "frontend developer":
             session_data["code"] = CodingSession(role=role, rounds=rounds)
 
-        user_sessions[user] = session_data
+        await run_in_pool("store", session_store.put, user, session_data)
 
     else:
         raise HTTPException(status_code=400, detail="Invalid interview type")
@@ -158,13 +217,9 @@ async def setup_session(
 
 @app.post("/api/parse-resume")
 async def parse_resume_endpoint(resume: UploadFile = File(...), user: str = Depends(get_current_user)):
-    # Save resume to temp file
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-        contents = await resume.read()
-        tmp.write(contents)
-        tmp_path = tmp.name
-
-    result = parse_resume_with_llm(tmp_path)
+    # Parsed from memory and cached by content hash; no temp file
+    contents = await resume.read()
+    result = await run_in_pool("llm", parse_resume_cached, contents)
 
     if "error" in result:
         raise HTTPException(status_code=400, detail="Resume parsing failed")
@@ -172,32 +227,70 @@ async def parse_resume_endpoint(resume: UploadFile = File(...), user: str = Depe
     return result
 
 
-@app.post("/api/audio")
-async def handle_audio(audio: UploadFile = File(...), focus_score: Optional[float] = Form(1.0), user: str = Depends(get_current_user)):
-    session_info = user_sessions.get(user)
-
-    if not session_info:
-        raise HTTPException(status_code=404, detail="No active session")
-
-    # Save audio
-    contents = await audio.read()
-    tmp_path = f"temp_{uuid4().hex}.webm"
-    
-
-    with open(tmp_path, "wb") as f:
-        f.write(contents)
-    if os.path.getsize(tmp_path) < 1000:  # roughly <1KB = empty/silent
-        os.remove(tmp_path)
-        # Return initial question instead of transcribing
-        session = user_sessions[user]
-        
-        first_question = session.ask_question()
-        return {"text": first_question, "answer": "", "confidence": 0.0}
-
-    answer = transcribe(tmp_path)
-    confidence = get_confidence_score(tmp_path)
-    os.remove(tmp_path)
-
+def _no_speech(pcm):
+    """Effectively empty answer (no voiced audio): Whisper is skipped and the answer is recorded as ""."""
+    if has_speech(pcm, SAMPLE_RATE):
+        return False
+    metrics.inc("vad.empty_answers")
+    return True
+
+
+async def _transcribe_and_score(pcm):
+    """Transcript and confidence of a decoded answer, computed concurrently; no Whisper pass when there is no speech."""
+    if _no_speech(pcm):
+        return "", await run_in_pool("audio", get_confidence_score, pcm, SAMPLE_RATE)
+    # Whisper only sees the speech segments; confidence keeps the pauses
+    return await asyncio.gather(
+        run_in_pool("stt", transcribe_speech, pcm),
+        run_in_pool("audio", get_confidence_score, pcm, SAMPLE_RATE),
+    )
+
+
+async def _silent_turn(session_info):
+    """Empty upload (the client's start/skip signal): serve the next question without recording an answer."""
+    session = session_info[session_info["current"]] if isinstance(session_info, dict) else session_info
+    question = await run_in_pool("llm", session.ask_question)
+    return {"text": question, "answer": "", "confidence": 0.0}
+
+
+async def _answer_and_ask(session, answer, draft=None, on_token=None):
+    """
+    Record `answer` (None: nothing to record) and get the session's next question.
+    With `on_token`, the question is streamed token by token (unless a speculative
+    draft is available, which is already complete) and the answer and question
+    are only recorded once every token was sent. `on_token(text, replace)` gets
+    replace=True when `text` supersedes everything streamed before it.
+    """
+    if on_token is None or draft is not None or not hasattr(session, "stream_question"):
+        if answer is not None:
+            # provide_answer embeds the question for topic dedup, so it runs off the loop too
+            await run_in_pool("llm", session.provide_answer, answer)
+        return await run_in_pool("llm", session.ask_question, draft)
+
+    parts = []
+    replace = False
+    async for token in stream_in_pool("llm", session.stream_question, answer):
+        if token is RESTART_QUESTION:
+            parts.clear()
+            replace = True
+            continue
+        parts.append(token)
+        await on_token(token, replace)
+        replace = False
+
+    # A cancelled turn never half-records: commit_turn either runs whole on the pool or not at all
+    question = "".join(parts).strip() or None
+    await run_in_pool("llm", session.commit_turn, answer, question)
+    return question
+
+
+async def _advance_interview(session_info, answer, confidence, focus_score, draft=None, on_token=None, pcm=None):
+    """
+    Record the answer and its metrics, then move the interview to the next question or round.
+    `draft` is an optional speculative plan from the streaming path; the session checks it against the final answer.
+    `on_token` streams the generated question as it is produced.
+    `pcm` is the decoded answer, kept as audio or feature frames when STORE_ANSWER_AUDIO is set.
+    """
     # Get the current session object
     if isinstance(session_info, dict):
         session = session_info.get(session_info.get("current"))
@@ -208,10 +301,32 @@ async def handle_audio(audio: UploadFile = File(...), focus_score: Optional[floa
     if not hasattr(session, "meta") or session.meta is None:
         session.meta = {}
 
-    # Add metrics
+    if pcm is None or STORE_ANSWER_AUDIO == "none":
+        saving = None
+    else:
+        # The GridFS write overlaps the LLM turn instead of adding to it
+        saving = asyncio.ensure_future(run_in_pool("decode", save_answer_artifact, pcm, SAMPLE_RATE))
+    try:
+        result = await _advance_rounds(session_info, answer, confidence, draft, on_token)
+    except BaseException:
+        if saving:
+            saving.cancel()
+        raise
+
+    # Add metrics only once the turn went through, so a retried turn is not counted twice
     session.meta.setdefault("confidence_scores", []).append(confidence)
     session.meta.setdefault("focus_scores", []).append(focus_score)
 
+    if saving is None:
+        return result
+    session.meta.setdefault("answer_artifacts", []).append(
+        {"kind": STORE_ANSWER_AUDIO, "file_id": await saving, "confidence": confidence}
+    )
+    return result
+
+
+async def _advance_rounds(session_info, answer, confidence, draft=None, on_token=None):
+    """The question/round part of _advance_interview; the answer's metrics are recorded after it."""
     # FULL INTERVIEW MODE
     if isinstance(session_info, dict):
         current_round = session_info["current"]
@@ -222,16 +337,14 @@ async def handle_audio(audio: UploadFile = File(...), focus_score: Optional[floa
             session.meta["greeting_sent"] = True
 
             if answer.strip():
-                session.provide_answer(answer)
-                next_q = session.ask_question()
+                next_q = await _answer_and_ask(session, answer, on_token=on_token)
                 return {"text": next_q, "answer": answer, "confidence": confidence}
             
-            first_question = session.ask_question()
+            first_question = await _answer_and_ask(session, None, on_token=on_token)
             return {"text": first_question, "answer": "", "confidence": confidence}
 
         # Process answer
-        session.provide_answer(answer)
-        next_q = session.ask_question()
+        next_q = await _answer_and_ask(session, answer, draft, on_token)
 
         if next_q:
             return {"text": next_q, "answer": answer, "confidence": confidence}
@@ -248,7 +361,7 @@ async def handle_audio(audio: UploadFile = File(...), focus_score: Optional[floa
                 session_info["current"] = "hr"
                 return {"text": "Okay. Now let's start the behavioral (HR) round. Tell me about your Strengths and Weaknesses?", "answer": answer, "confidence": confidence}
             else:
-                return {"text": "The interview is complete. Thank you!", "answer": answer, "confidence": confidence}
+                return {"text": "The interview is complete. Thank you!", "answer": answer, "confidence": confidence, "complete": True}
 
     # SINGLE ROUND MODE
     else:
@@ -258,62 +371,320 @@ async def handle_audio(audio: UploadFile = File(...), focus_score: Optional[floa
             session.meta["greeting_sent"] = True
 
             if answer.strip():
-                session.provide_answer(answer)
-                next_q = session.ask_question()
+                next_q = await _answer_and_ask(session, answer, on_token=on_token)
                 return {"text": next_q, "answer": answer, "confidence": confidence}
             
-            first_question = session.ask_question()
+            first_question = await _answer_and_ask(session, None, on_token=on_token)
             return {"text": first_question, "answer": "", "confidence": confidence}
 
-        session.provide_answer(answer)
-        next_q = session.ask_question()
+        next_q = await _answer_and_ask(session, answer, draft, on_token)
 
         if next_q:
             return {"text": next_q, "answer": answer, "confidence": confidence}
         else:
-            return {"text": "The interview is complete. Thank you!", "answer": answer, "confidence": confidence}
+            return {"text": "The interview is complete. Thank you!", "answer": answer, "confidence": confidence, "complete": True}
 
 
-@app.get("/api/feedback")
-def get_feedback(user: str = Depends(get_current_user)):
-    session_info = user_sessions.get(user)
+@app.post("/api/audio")
+async def handle_audio(audio: UploadFile = File(...), focus_score: Optional[float] = Form(1.0), user: str = Depends(get_current_user)):
+    session_info = await run_in_pool("store", session_store.get, user)
 
     if not session_info:
         raise HTTPException(status_code=404, detail="No active session")
 
-    feedback_data = {}
-    transcript_data = ""
+    contents = await audio.read()
+    if len(contents) < 1000:  # roughly <1KB = empty/silent
+        result = await _silent_turn(session_info)
+        await run_in_pool("store", session_store.put, user, session_info)
+        return result
+
+    # Decode the upload in memory once, then run Whisper and the confidence scorer on the same PCM concurrently
+    pcm = await run_in_pool("decode", decode_audio, contents)
+    answer, confidence = await _transcribe_and_score(pcm)
+
+    result = await _advance_interview(session_info, answer, confidence, focus_score, pcm=pcm)
+    await _finish_turn(user, session_info, result)
+    return result
+
+
+@app.post("/api/audio/stream")
+async def handle_audio_stream(audio: UploadFile = File(...), focus_score: Optional[float] = Form(1.0), user: str = Depends(get_current_user)):
+    """
+    Server-sent-events variant of /api/audio. Emits `answer` once the
+    transcript and confidence are known, `token` for every chunk of the next
+    question as Groq produces it, and `done` with the usual /api/audio payload.
+    """
+    session_info = await run_in_pool("store", session_store.get, user)
+
+    if not session_info:
+        raise HTTPException(status_code=404, detail="No active session")
+
+    contents = await audio.read()
+    events = asyncio.Queue()
+
+    async def on_token(token, replace=False):
+        await events.put(("token", {"text": token, "replace": replace}))
+
+    async def run_turn():
+        try:
+            if len(contents) < 1000:
+                result = await _silent_turn(session_info)
+            else:
+                pcm = await run_in_pool("decode", decode_audio, contents)
+                answer, confidence = await _transcribe_and_score(pcm)
+                await events.put(("answer", {"answer": answer, "confidence": confidence}))
+                result = await _advance_interview(session_info, answer, confidence, focus_score, on_token=on_token, pcm=pcm)
+            await _finish_turn(user, session_info, result)
+            await events.put(("done", result))
+        except Exception as e:
+            print(f"[Audio Stream Error] {e}")
+            await events.put(("error", {"detail": str(e)}))
+
+    async def event_stream():
+        turn = asyncio.create_task(run_turn())
+        try:
+            while True:
+                event, data = await events.get()
+                yield f"event: {event}\ndata: {json.dumps(data)}\n\n"
+                if event in ("done", "error"):
+                    break
+        finally:
+            # Client went away mid-stream: the question is not committed
+            if not turn.done():
+                turn.cancel()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# Minimum gap between partial transcripts; each partial re-runs Whisper on the open window
+STREAM_PARTIAL_INTERVAL_S = float(os.getenv("STREAM_PARTIAL_INTERVAL_S", 1.5))
+
+
+@app.websocket("/ws/audio")
+async def stream_audio(websocket: WebSocket):
+    """
+    Streaming variant of /api/audio.
+
+    Client → server: binary webm/opus chunks while recording, then
+    {"type": "end", "focus_score": 0.9} as a text frame.
+    Server → client: {"type": "partial", "text": ...} while recording, then
+    {"type": "token", "text": ...} chunks of the next question and one
+    {"type": "final", ...} with the same payload /api/audio returns.
+    Browsers cannot set headers on WebSockets, so the Clerk ids come as
+    user_id / user_email query parameters.
+
+    With speculation on (SPECULATIVE_QUESTIONS=1 or ?speculative=1), every
+    time the candidate pauses the next question is drafted from the partial
+    transcript; the draft is used if the final transcript still matches it.
+    """
+    try:
+        user = get_current_user(
+            x_user_id=websocket.query_params.get("user_id"),
+            x_user_email=websocket.query_params.get("user_email"),
+        )
+    except HTTPException:
+        await websocket.close(code=4401)
+        return
+
+    session_info = await run_in_pool("store", session_store.get, user)
+    if not session_info:
+        await websocket.close(code=4404)
+        return
+
+    await websocket.accept()
+    streamer = await run_in_pool("decode", StreamingTranscriber)
+    loop = asyncio.get_running_loop()
+    partial_task = None
+    last_partial = 0.0
+    focus_score = 1.0
+
+    speculative = SPECULATIVE_QUESTIONS or websocket.query_params.get("speculative") == "1"
+    speculation = {"task": None, "draft": None, "drafted_for": None}
+
+    def current_session():
+        return session_info.get(session_info.get("current")) if isinstance(session_info, dict) else session_info
+
+    async def draft_next(session, text):
+        speculation["draft"] = await run_in_pool("llm", session.draft_next_question, text)
+
+    def maybe_speculate(text):
+        # Draft only while the candidate is pausing (nothing open after the last committed segment)
+        session = current_session()
+        if not speculative or streamer.partial or not text or text == speculation["drafted_for"]:
+            return
+        if not hasattr(session, "draft_next_question") or not getattr(session, "history", None):
+            return
+        if speculation["task"] and not speculation["task"].done():
+            return
+        speculation["drafted_for"] = text
+        speculation["task"] = asyncio.create_task(draft_next(session, text))
+
+    async def emit_partial():
+        text = await run_in_pool("stt", streamer.step)
+        await websocket.send_json({"type": "partial", "text": text})
+        maybe_speculate(text)
+
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect()
+
+            if message.get("bytes"):
+                await run_in_pool("decode", streamer.feed, message["bytes"])
+
+                # At most one partial in flight; a slow Whisper pass just skips ticks
+                now = loop.time()
+                if (partial_task is None or partial_task.done()) and now - last_partial >= STREAM_PARTIAL_INTERVAL_S:
+                    last_partial = now
+                    partial_task = asyncio.create_task(emit_partial())
+
+            elif message.get("text"):
+                data = json.loads(message["text"])
+                if data.get("type") == "end":
+                    focus_score = float(data.get("focus_score", 1.0))
+                    break
+
+        if partial_task:
+            await partial_task
+
+        pcm = await run_in_pool("decode", streamer.close)
+        draft = None
+        if streamer.bytes_received < 1000:
+            result = await _silent_turn(session_info)
+        else:
+            if _no_speech(pcm):
+                answer, confidence = "", await run_in_pool("audio", get_confidence_score, pcm, SAMPLE_RATE)
+            else:
+                # Only the window after the last committed segment is left to transcribe
+                answer, confidence = await asyncio.gather(
+                    run_in_pool("stt", streamer.finish),
+                    run_in_pool("audio", get_confidence_score, pcm, SAMPLE_RATE),
+                )
+            # Wait for an in-flight draft only if it can still be used
+            if speculation["task"] and draft_matches(speculation["drafted_for"], answer):
+                try:
+                    await speculation["task"]
+                    draft = speculation["draft"]
+                except Exception as e:
+                    print(f"[Speculation Error] {e}")
+
+            async def send_token(token, replace=False):
+                await websocket.send_json({"type": "token", "text": token, "replace": replace})
+
+            result = await _advance_interview(session_info, answer, confidence, focus_score, draft, send_token, pcm)
+
+        await _finish_turn(user, session_info, result)
+
+        await websocket.send_json({"type": "final", **result})
+        await websocket.close()
+
+    except WebSocketDisconnect:
+        pass
+
+    except Exception as e:
+        # Decode, STT or LLM failure: tell the client why instead of dropping the socket
+        print(f"[Audio WS Error] {e}")
+        try:
+            await websocket.send_json({"type": "error", "detail": str(e)})
+            await websocket.close(code=1011)
+        except Exception:
+            pass
+
+    finally:
+        for task in (partial_task, speculation["task"]):
+            if task and not task.done():
+                task.cancel()
+        # No-op when ffmpeg already exited through close()
+        streamer.abort()
+
+
+FEEDBACK_SECTION_TIMEOUT_S = float(os.getenv("FEEDBACK_SECTION_TIMEOUT_S", 45))
+
+
+async def _section_feedback(name, session):
+    """One round's evaluation on the llm pool; a timeout or error yields a placeholder instead of failing the request."""
+    started = asyncio.get_running_loop().time()
+    try:
+        return await asyncio.wait_for(run_in_pool("llm", session.generate_feedback), FEEDBACK_SECTION_TIMEOUT_S)
+    except asyncio.TimeoutError:
+        print(f"[Feedback Error] {name} timed out after {FEEDBACK_SECTION_TIMEOUT_S}s")
+        metrics.inc("feedback.timeouts")
+        return {"error": "timeout", "summary": f"The {name} evaluation took too long. Please retry later."}
+    except Exception as e:
+        print(f"[Feedback Error] {name}: {e}")
+        metrics.inc("feedback.errors")
+        return {"error": str(e), "summary": f"The {name} evaluation failed. Please retry later."}
+    finally:
+        metrics.observe(f"feedback.{name}_s", asyncio.get_running_loop().time() - started)
+
+
+def _needs_interview_key(session_info):
+    """Coding-only sessions have no id of their own until _interview_key gives them one."""
+    return (
+        not isinstance(session_info, dict)
+        and not getattr(session_info, "session_id", None)
+        and "interview_key" not in session_info.meta
+    )
+
+
+def _interview_key(session_info):
+    """Stable id of this interview, used to find its stored feedback. A new key is persisted by the caller."""
+    if isinstance(session_info, dict):
+        return session_info["tech"].session_id
+    if getattr(session_info, "session_id", None):
+        return session_info.session_id
+    return session_info.meta.setdefault("interview_key", uuid4().hex)
+
+
+def _section_failed(result):
+    """A section result that must not be stored: placeholder, parse fallback or anything that is not a score dict."""
+    return not isinstance(result, dict) or "error" in result
+
+
+def _format_turn(item):
+    if "question" in item:
+        return f"Q: {item['question']}\nA: {item.get('answer')}"
+    # Coding rounds record the problem and the submitted code instead of a Q/A pair
+    return f"Problem: {item.get('problem', {}).get('title', '')}\nCode:\n{item.get('code', '')}"
 
+
+def _transcript(*histories):
+    return "\n".join(_format_turn(item) for history in histories for item in history)
+
+
+def _feedback_etag(payload):
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+async def _compute_feedback(user, session_info, interview_key):
+    """Evaluate the finished interview and store it on the interview document (once per interview)."""
     session = session_info if not isinstance(session_info, dict) else session_info.get(session_info["current"])
     if not hasattr(session, "meta") or session.meta is None:
         session.meta = {}
 
     if isinstance(session_info, dict) and session_info.get("mode") == "full":
-        tech_fb = session_info["tech"].generate_feedback()
-        hr_fb = session_info["hr"].generate_feedback()
-
-        feedback_data = {
-            "technical": tech_fb,
-            "behavioral": hr_fb
-        }
-
+        # Sections are independent LLM calls: run them together so the wait is the slowest one, not the sum
+        sections = {"technical": session_info["tech"], "behavioral": session_info["hr"]}
         if "code" in session_info:
-            code_fb = session_info["code"].generate_feedback()
-            feedback_data["coding"] = code_fb
+            sections["coding"] = session_info["code"]
+
+        results = await asyncio.gather(*(_section_feedback(name, s) for name, s in sections.items()))
+        feedback_data = dict(zip(sections, results))
+        failed = any(_section_failed(r) for r in results)
 
-        transcript_data = "\n".join([
-            f"Q: {q['question']}\nA: {q['answer']}"
-            for q in session_info["tech"].history + session_info["hr"].history
-        ])
+        transcript_data = _transcript(session_info["tech"].history, session_info["hr"].history)
 
     else:
-        summary = session.generate_feedback()
+        summary = await _section_feedback(getattr(session, "round_type", "interview").lower(), session)
         feedback_data = json.loads(summary) if isinstance(summary, str) else summary
+        failed = _section_failed(feedback_data)
 
-        transcript_data = "\n".join([
-            f"Q: {q['question']}\nA: {q['answer']}"
-            for q in session.history
-        ])
+        transcript_data = _transcript(session.history)
 
     # Collect average metrics
     if isinstance(session_info, dict):
@@ -324,36 +695,98 @@ def get_feedback(user: str = Depends(get_current_user)):
             all_focus += scores.get("focus_scores", [])
         avg_conf = float(np.mean(all_conf)) if all_conf else 0.0
         avg_focus = float(np.mean(all_focus)) if all_focus else 0.0
+        artifacts = [a for key in ["tech", "hr"] for a in getattr(session_info[key], "meta", {}).get("answer_artifacts", [])]
     else:
-        avg_conf = float(np.mean(session.meta.get("confidence_scores", [])))
-        avg_focus = float(np.mean(session.meta.get("focus_scores", [])))
-
-    # PREVENT DUPLICATE SAVES
-    if not session.meta.get("feedback_saved"):
-        interviews_collection.insert_one({
-            "userId": user,  # This is now clerkId
-            "role": session_info["tech"].role if isinstance(session_info, dict) else session.role,
-            "date": datetime.now().isoformat(),
-            "mode": session_info["mode"] if isinstance(session_info, dict) else getattr(session_info, "round_type", "custom"),
-            "transcript": transcript_data,
-            "feedback": feedback_data,
-            "average_confidence": avg_conf,
-            "average_focus": avg_focus
-        })
-        session.meta["feedback_saved"] = True
-    else:
-        print("🛑 Feedback already saved. Skipping DB insert.")
-
-    return {
-        **feedback_data,
+        avg_conf = float(np.mean(session.meta.get("confidence_scores", []))) if session.meta.get("confidence_scores") else 0.0
+        avg_focus = float(np.mean(session.meta.get("focus_scores", []))) if session.meta.get("focus_scores") else 0.0
+        artifacts = session.meta.get("answer_artifacts", [])
+
+    doc = {
+        "userId": user,  # This is now clerkId
+        "sessionId": interview_key,
+        "role": session_info["tech"].role if isinstance(session_info, dict) else session.role,
+        "date": datetime.now().isoformat(),
+        "mode": session_info["mode"] if isinstance(session_info, dict) else getattr(session_info, "round_type", "custom"),
+        "transcript": transcript_data,
+        "feedback": feedback_data,
         "average_confidence": avg_conf,
         "average_focus": avg_focus,
+        "answer_artifacts": artifacts,
     }
+    doc["feedback_etag"] = _feedback_etag([feedback_data, avg_conf, avg_focus])
+
+    # A failed section is served but not stored, so the next request tries again
+    if failed:
+        print("⚠️ Feedback incomplete. Not saving to DB.")
+        return doc
+
+    return await run_in_pool("store", _store_feedback, user, interview_key, doc)
+
+
+def _store_feedback(user, interview_key, doc):
+    # Upsert on (userId, sessionId): whichever worker finishes first wins, later ones read its copy
+    interviews_collection.update_one({"userId": user, "sessionId": interview_key}, {"$setOnInsert": doc}, upsert=True)
+    return interviews_collection.find_one({"userId": user, "sessionId": interview_key})
+
+
+_feedback_tasks = {}
+
+
+def _start_feedback(user, session_info):
+    """The in-flight feedback task for this interview, started if needed. Runs independently of any request."""
+    key = _interview_key(session_info)
+    task = _feedback_tasks.get((user, key))
+    if task is None:
+        task = asyncio.create_task(_compute_feedback(user, session_info, key))
+        _feedback_tasks[(user, key)] = task
+        task.add_done_callback(lambda t: _feedback_tasks.pop((user, key), None))
+    return task
+
+
+async def _finish_turn(user, session_info, result):
+    """Persist the session after a turn; the last turn kicks off feedback so it's ready before the candidate asks."""
+    if result.get("complete"):
+        # Started before the put, so an interview key assigned here is persisted with the session
+        _start_feedback(user, session_info)
+    await run_in_pool("store", session_store.put, user, session_info)
+
+
+@app.get("/api/feedback")
+async def get_feedback(request: Request, user: str = Depends(get_current_user)):
+    session_info = await run_in_pool("store", session_store.get, user)
+
+    if not session_info:
+        raise HTTPException(status_code=404, detail="No active session")
+
+    # A coding-only session gets its key on first use; store it so later requests find the same document
+    needs_key = _needs_interview_key(session_info)
+    key = _interview_key(session_info)
+    if needs_key:
+        await run_in_pool("store", session_store.put, user, session_info)
+
+    # Stored feedback costs one DB read; otherwise join (or start) the computation
+    doc = await run_in_pool("store", interviews_collection.find_one, {"userId": user, "sessionId": key})
+    if not doc or not doc.get("feedback_etag"):
+        doc = await asyncio.shield(_start_feedback(user, session_info))
+
+    etag = f'"{doc["feedback_etag"]}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    return JSONResponse(
+        {
+            **doc["feedback"],
+            "average_confidence": doc["average_confidence"],
+            "average_focus": doc["average_focus"],
+        },
+        headers=headers,
+    )
 
 
 @app.get("/api/coding-problem")
 def get_coding_problem(user: str = Depends(get_current_user)):
-    session_info = user_sessions.get(user)
+    session_info = session_store.get(user)
 
     if not session_info:
         raise HTTPException(status_code=404, detail="No active session found.")
@@ -375,6 +808,7 @@ def get_coding_problem(user: str = Depends(get_current_user)):
         raise HTTPException(status_code=400, detail="No coding session active.")
 
     problem = session.get_next_problem()
+    session_store.put(user, session_info)
     if not problem:
         raise HTTPException(status_code=204, detail="No more coding problems.")
 
@@ -386,7 +820,7 @@ async def submit_code(request: Request, user: str = Depends(get_current_user)):
     data = await request.json()
     code = data.get("code")
 
-    session_info = user_sessions.get(user)
+    session_info = await run_in_pool("store", session_store.get, user)
     if not session_info:
         raise HTTPException(status_code=404, detail="No active session")
 
@@ -396,9 +830,11 @@ async def submit_code(request: Request, user: str = Depends(get_current_user)):
 
         next_problem = session.get_next_problem()
         if next_problem:
+            await run_in_pool("store", session_store.put, user, session_info)
             return {"next": True, "problem": next_problem}
 
         session_info["current"] = "hr"
+        await run_in_pool("store", session_store.put, user, session_info)
         return {
             "next": False,
             "message": "Coding round complete. Moving to HR."
@@ -406,6 +842,7 @@ async def submit_code(request: Request, user: str = Depends(get_current_user)):
 
     elif isinstance(session_info, CodingSession):
         session_info.submit_solution(code)
+        await run_in_pool("store", session_store.put, user, session_info)
         return {"next": False, "message": "Thanks for your submission."}
 
     else:
@@ -417,7 +854,7 @@ from backend.llm_groq_config import code_llm
 
 @app.post("/api/code-explanation")
 async def handle_code_explanation(audio: UploadFile = File(...), user: str = Depends(get_current_user)):
-    session_info = user_sessions.get(user)
+    session_info = await run_in_pool("store", session_store.get, user)
 
     if not session_info:
         raise HTTPException(status_code=404, detail="No session")
@@ -430,12 +867,8 @@ async def handle_code_explanation(audio: UploadFile = File(...), user: str = Dep
         raise HTTPException(status_code=400, detail="Not in coding session")
 
     contents = await audio.read()
-    tmp_path = f"temp_explain_{uuid4().hex}.wav"
-    with open(tmp_path, "wb") as f:
-        f.write(contents)
-
-    user_text = transcribe(tmp_path)
-    os.remove(tmp_path)
+    pcm = await run_in_pool("decode", decode_audio, contents)
+    user_text = await run_in_pool("stt", transcribe_speech, pcm)
 
     session.explanation_history.append({"user": user_text})
 
@@ -453,9 +886,10 @@ async def handle_code_explanation(audio: UploadFile = File(...), user: str = Dep
         elif "ai" in msg:
             messages.append(AIMessage(content=msg["ai"]))
 
-    response = code_llm.invoke(messages).content
+    response = (await code_llm.ainvoke(messages)).content
 
     session.explanation_history.append({"ai": response})
+    await run_in_pool("store", session_store.put, user, session_info)
 
     return {
         "user_text": user_text,
@@ -482,7 +916,7 @@ def get_interview(interview_id: str, user: str = Depends(get_current_user)):
 
 @app.get("/api/history")
 def get_history(user: str = Depends(get_current_user)):
-    session = user_sessions.get(user)
+    session = session_store.get(user)
 
     if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
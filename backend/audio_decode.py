@@ -0,0 +1,49 @@
+# backend/audio_decode.py
+
+import subprocess
+
+import numpy as np
+
+# Whisper expects 16 kHz mono; decoding once at this rate serves every analysis
+SAMPLE_RATE = 16000
+
+
+def decode_audio(source, sr=SAMPLE_RATE):
+    """
+    Decode audio into a mono float32 PCM buffer in [-1, 1].
+    `source` is either the raw uploaded bytes (piped through ffmpeg stdin,
+    nothing touches disk) or a path to any ffmpeg-readable file.
+    """
+    from_memory = isinstance(source, (bytes, bytearray, memoryview))
+    cmd = [
+        "ffmpeg", "-nostdin", "-threads", "0",
+        "-i", "pipe:0" if from_memory else source,
+        "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(sr),
+        "pipe:1",
+    ]
+    # "-nostdin" only stops ffmpeg reading keyboard input; "pipe:0" still reads the upload
+    try:
+        out = subprocess.run(
+            cmd,
+            input=bytes(source) if from_memory else None,
+            capture_output=True,
+            check=True,
+        ).stdout
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"Failed to decode audio: {e.stderr.decode(errors='ignore')}") from e
+
+    return np.frombuffer(out, np.int16).astype(np.float32) / 32768.0
+
+
+def encode_audio(pcm, sr=SAMPLE_RATE, bitrate="24k"):
+    """Compress mono float32 PCM to Ogg/Opus bytes (speech stays intelligible at ~3 KB/s)."""
+    samples = (np.clip(np.asarray(pcm, dtype=np.float32), -1.0, 1.0) * 32767).astype(np.int16)
+    cmd = [
+        "ffmpeg", "-nostdin", "-f", "s16le", "-ac", "1", "-ar", str(sr), "-i", "pipe:0",
+        "-c:a", "libopus", "-b:a", bitrate, "-application", "voip", "-f", "ogg",
+        "pipe:1",
+    ]
+    try:
+        return subprocess.run(cmd, input=samples.tobytes(), capture_output=True, check=True).stdout
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"Failed to encode audio: {e.stderr.decode(errors='ignore')}") from e
@@ -1,7 +1,59 @@
+import json
+import os
+import urllib.request
+from urllib.parse import quote
+
 from fastapi import HTTPException, Header, Depends
-from backend.database import users_collection
+from pymongo import ReturnDocument
+from backend.database import EMAIL_COLLATION, users_collection
 from typing import Optional
 
+# Clerk Backend API secret; without it ingested profiles are never linked to a sign-in
+CLERK_SECRET_KEY = os.getenv("CLERK_SECRET_KEY")
+CLERK_API_URL = os.getenv("CLERK_API_URL", "https://api.clerk.com/v1")
+
+
+def _clerk_verified_emails(clerk_id):
+    """Lower-cased email addresses Clerk has verified for the user; empty when Clerk can't be asked."""
+    if not CLERK_SECRET_KEY:
+        return set()
+    request = urllib.request.Request(
+        f"{CLERK_API_URL}/users/{quote(clerk_id, safe='')}",
+        headers={"Authorization": f"Bearer {CLERK_SECRET_KEY}"},
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            clerk_user = json.load(response)
+    except (OSError, ValueError) as e:
+        print(f"[Clerk Error] {e}")
+        return set()
+    return {
+        address["email_address"].lower()
+        for address in clerk_user.get("email_addresses", [])
+        if (address.get("verification") or {}).get("status") == "verified"
+    }
+
+
+def _claim_ingested_profile(clerk_id, email):
+    """
+    Profiles loaded by backend/bulk_ingest.py without a clerkId are keyed by
+    email. Attach the Clerk id on first sign-in instead of creating a second
+    user, but only when Clerk confirms the address is verified for this
+    account: X-User-Email is supplied by the client.
+    """
+    unclaimed = {"email": email.lower(), "clerkId": {"$exists": False}}
+    if not users_collection.find_one(unclaimed, {"_id": 1}, collation=EMAIL_COLLATION):
+        return None
+    if email.lower() not in _clerk_verified_emails(clerk_id):
+        print(f"⚠️ Not linking ingested profile for {clerk_id}: email not verified by Clerk")
+        return None
+    return users_collection.find_one_and_update(
+        unclaimed,
+        {"$set": {"clerkId": clerk_id}},
+        collation=EMAIL_COLLATION,
+        return_document=ReturnDocument.AFTER,
+    )
+
 def get_current_user(x_user_id: Optional[str] = Header(None), x_user_email: Optional[str] = Header(None)):
     """
     Get or create user based on Clerk data sent from frontend.
@@ -16,13 +68,13 @@ def get_current_user(x_user_id: Optional[str] = Header(None), x_user_email: Opti
         )
     
     # Check if user exists in MongoDB
-    user = users_collection.find_one({"clerkId": x_user_id})
+    user = users_collection.find_one({"clerkId": x_user_id}) or _claim_ingested_profile(x_user_id, x_user_email)
     
     if not user:
         # First time user - create new document
         new_user = {
             "clerkId": x_user_id,
-            "email": x_user_email,
+            "email": x_user_email.lower(),
             "name": "",
             "phone": "",
             "linkedin": "",
@@ -53,13 +105,13 @@ def get_current_user_full(x_user_id: Optional[str] = Header(None), x_user_email:
             detail="Authentication required"
         )
     
-    user = users_collection.find_one({"clerkId": x_user_id})
+    user = users_collection.find_one({"clerkId": x_user_id}) or _claim_ingested_profile(x_user_id, x_user_email)
     
     if not user:
         # Create user if doesn't exist
         new_user = {
             "clerkId": x_user_id,
-            "email": x_user_email,
+            "email": x_user_email.lower(),
             "name": "",
             "phone": "",
             "linkedin": "",
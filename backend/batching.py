@@ -0,0 +1,78 @@
+# backend/batching.py
+
+import threading
+import time
+from concurrent.futures import Future
+
+from backend import metrics
+
+
+class MicroBatcher:
+    """
+    Collects single requests from many threads for up to `max_wait_ms` (or
+    until `max_batch_size` arrive) and runs them through `batch_fn` in one
+    call. `batch_fn` takes a list of items and returns a list of results in
+    the same order. submit() returns a concurrent.futures.Future.
+
+    Batch sizes and per-request wait times are recorded as
+    batch.<name>.size and batch.<name>.wait_ms histograms.
+    """
+
+    def __init__(self, batch_fn, name, max_batch_size=32, max_wait_ms=5):
+        self.batch_fn = batch_fn
+        self.name = name
+        self.max_batch_size = max_batch_size
+        self.max_wait_s = max_wait_ms / 1000
+        self._pending = []  # (item, future, enqueued_at)
+        self._cond = threading.Condition()
+        self._worker = None
+
+    def submit(self, item):
+        future = Future()
+        with self._cond:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name=f"{self.name}-batcher", daemon=True)
+                self._worker.start()
+            self._pending.append((item, future, time.monotonic()))
+            self._cond.notify()
+        return future
+
+    def __call__(self, item):
+        """Blocking convenience wrapper around submit()."""
+        return self.submit(item).result()
+
+    def _next_batch(self):
+        with self._cond:
+            while not self._pending:
+                self._cond.wait()
+
+            # The window opens with the oldest request, so nobody waits longer than max_wait
+            deadline = self._pending[0][2] + self.max_wait_s
+            while len(self._pending) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+
+            batch = self._pending[: self.max_batch_size]
+            del self._pending[: self.max_batch_size]
+            return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            started = time.monotonic()
+            metrics.observe(f"batch.{self.name}.size", len(batch))
+            for _, _, enqueued_at in batch:
+                metrics.observe(f"batch.{self.name}.wait_ms", (started - enqueued_at) * 1000)
+
+            try:
+                results = self.batch_fn([item for item, _, _ in batch])
+            except Exception as e:
+                for _, future, _ in batch:
+                    future.set_exception(e)
+                continue
+
+            metrics.observe(f"batch.{self.name}.run_ms", (time.monotonic() - started) * 1000)
+            for (_, future, _), result in zip(batch, results):
+                future.set_result(result)
@@ -0,0 +1,103 @@
+# backend/benchmarks/bench_confidence.py
+"""
+CPU time and score agreement of the confidence scorer against the previous
+librosa implementation (22.05 kHz resample + beat tracking).
+
+Runs on a directory of recorded answers, or on synthetic speech-like audio
+when no corpus is given.
+
+Usage:
+    python -m backend.benchmarks.bench_confidence --corpus fixtures/stt
+    python -m backend.benchmarks.bench_confidence --synthetic 10 --pitch
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+
+from backend.audio_decode import SAMPLE_RATE, decode_audio
+from backend.confidence_utils import extract_features, score_features
+
+AUDIO_SUFFIXES = {".webm", ".wav", ".mp3", ".m4a", ".ogg", ".flac"}
+
+
+def legacy_confidence_score(pcm, sr):
+    """The scorer as it was before the 16 kHz rewrite, kept for comparison."""
+    import librosa
+
+    y = librosa.resample(np.asarray(pcm, dtype=np.float32), orig_sr=sr, target_sr=22050)
+    sr = 22050
+    if librosa.get_duration(y=y, sr=sr) < 1.0:
+        return 0.2
+
+    rms = np.mean(librosa.feature.rms(y=y))
+    tempo, _ = librosa.beat.beat_track(y=y, sr=sr)
+    zcr = np.mean(librosa.feature.zero_crossing_rate(y))
+
+    rms_score = min(rms * 100, 1.0)
+    tempo_score = min(float(np.atleast_1d(tempo)[0]) / 150, 1.0)
+    zcr_score = min(zcr * 10, 1.0)
+    return round(0.4 * rms_score + 0.3 * tempo_score + 0.3 * zcr_score, 2)
+
+
+def synthetic_answer(seconds, seed=0, sr=SAMPLE_RATE):
+    """Harmonic voice with drifting pitch, ~4 syllables/s, short pauses and a noise floor."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * sr)) / sr
+    rate = rng.uniform(3.0, 5.0)
+    envelope = np.abs(np.sin(np.pi * rate * t)) ** 2
+    envelope *= (np.sin(2 * np.pi * 0.2 * t + rng.uniform(0, 6)) > -0.7)  # pauses
+    f0 = rng.uniform(100, 200) * (1 + 0.1 * np.sin(2 * np.pi * 0.5 * t))
+    phase = 2 * np.pi * np.cumsum(f0) / sr
+    voice = sum(np.sin(k * phase) / k for k in range(1, 10))
+    pcm = rng.uniform(0.05, 0.3) * envelope * voice + 0.003 * rng.standard_normal(len(t))
+    return pcm.astype(np.float32)
+
+
+def _cpu(fn, *args):
+    t0 = time.process_time()
+    result = fn(*args)
+    return result, time.process_time() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", help="directory of recorded answers")
+    parser.add_argument("--synthetic", type=int, default=10, help="synthetic answers when no corpus is given")
+    parser.add_argument("--pitch", action="store_true", help="include the optional pitch-variability feature")
+    args = parser.parse_args()
+
+    if args.corpus:
+        files = sorted(p for p in Path(args.corpus).iterdir() if p.suffix.lower() in AUDIO_SUFFIXES)
+        clips = [(p.name, decode_audio(str(p))) for p in files]
+    else:
+        clips = [(f"synthetic_{i:02d}", synthetic_answer(20 + 10 * (i % 4), seed=i)) for i in range(args.synthetic)]
+
+    audio_min = sum(len(pcm) for _, pcm in clips) / SAMPLE_RATE / 60
+    new_cpu = old_cpu = 0.0
+    diffs = []
+
+    # Warm both paths first so librosa's numba JIT compilation isn't counted as legacy CPU time
+    warmup = synthetic_answer(2, seed=99)
+    legacy_confidence_score(warmup, SAMPLE_RATE)
+    score_features(extract_features(warmup, SAMPLE_RATE, pitch=args.pitch))
+
+    print(f"{'clip':<22}{'legacy':>8}{'new':>8}")
+    for name, pcm in clips:
+        old, old_t = _cpu(legacy_confidence_score, pcm, SAMPLE_RATE)
+        new, new_t = _cpu(lambda p: score_features(extract_features(p, SAMPLE_RATE, pitch=args.pitch)), pcm)
+        old_cpu += old_t
+        new_cpu += new_t
+        diffs.append(abs(new - old))
+        print(f"{name:<22}{old:>8.2f}{new:>8.2f}")
+
+    print(f"\naudio: {audio_min:.1f} min")
+    print(f"CPU s per audio minute: legacy {old_cpu / audio_min:.3f}, new {new_cpu / audio_min:.3f} "
+          f"({old_cpu / max(new_cpu, 1e-9):.0f}x)")
+    print(f"score |diff|: mean {np.mean(diffs):.3f}, max {np.max(diffs):.3f}")
+
+
+if __name__ == "__main__":
+    main()
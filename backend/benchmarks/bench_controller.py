@@ -0,0 +1,100 @@
+# backend/benchmarks/bench_controller.py
+"""
+HR controller backends compared on controller_interview_data.jsonl:
+agreement with the dataset labels, agreement with the Groq controller, and
+p50/p95 decision latency, plus throughput with --concurrency parallel
+sessions (local backends micro-batch concurrent requests, see
+CONTROLLER_BATCH_SIZE / CONTROLLER_BATCH_WAIT_MS).
+
+The classifier is trained on the same file, so its dataset agreement is a
+training-set number; use --holdout to train it on part of the data only.
+Backends are called with the LLM fallback off, so a failing local backend
+is reported as unavailable instead of being timed as Groq calls.
+
+Usage:
+    python -m backend.benchmarks.bench_controller --backends llm,classifier --limit 50
+    python -m backend.benchmarks.bench_controller --backends local --concurrency 1,8,32
+"""
+
+import argparse
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from backend import controller_classifier
+from backend.controller_chain import get_controller_decision
+
+QUESTION = "Tell me about yourself."
+
+
+def _answer(instruction):
+    return instruction.split("User answer:", 1)[-1].strip()
+
+
+def _run(backend, examples):
+    decisions, latencies = [], []
+    for instruction, _ in examples:
+        t0 = time.perf_counter()
+        decisions.append(get_controller_decision(QUESTION, _answer(instruction), backend=backend, fallback=False))
+        latencies.append(time.perf_counter() - t0)
+    return decisions, latencies
+
+
+def _throughput(backend, examples, concurrency):
+    answers = [_answer(instruction) for instruction, _ in examples]
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        t0 = time.perf_counter()
+        list(pool.map(lambda a: get_controller_decision(QUESTION, a, backend=backend, fallback=False), answers))
+    return len(answers) / (time.perf_counter() - t0)
+
+
+def _agreement(a, b):
+    return sum(x == y for x, y in zip(a, b)) / len(a)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", default="llm,local,classifier")
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--concurrency", default="", help="comma-separated session counts for the throughput table")
+    parser.add_argument("--holdout", type=float, default=0.0, help="fraction held out from classifier training")
+    args = parser.parse_args()
+
+    examples = controller_classifier.load_controller_examples()
+    random.Random(0).shuffle(examples)
+    if args.holdout:
+        split = int(len(examples) * (1 - args.holdout))
+        controller_classifier._classifier = controller_classifier.train_classifier(examples[:split])
+        examples = examples[split:]
+    examples = examples[: args.limit]
+    labels = [label for _, label in examples]
+
+    results = {}
+    for backend in args.backends.split(","):
+        # Warm-up so model loading doesn't land in the latency numbers
+        try:
+            get_controller_decision(QUESTION, _answer(examples[0][0]), backend=backend, fallback=False)
+        except Exception as e:
+            print(f"{backend}: unavailable ({e})")
+            continue
+        results[backend] = _run(backend, examples)
+
+    print(f"{'backend':<12}{'vs data':>9}{'vs llm':>9}{'p50 (ms)':>10}{'p95 (ms)':>10}")
+    for backend, (decisions, latencies) in results.items():
+        vs_llm = f"{_agreement(decisions, results['llm'][0]):.2f}" if "llm" in results else "-"
+        print(
+            f"{backend:<12}{_agreement(decisions, labels):>9.2f}{vs_llm:>9}"
+            f"{np.percentile(latencies, 50) * 1000:>10.1f}{np.percentile(latencies, 95) * 1000:>10.1f}"
+        )
+
+    levels = [int(c) for c in args.concurrency.split(",") if c]
+    if levels:
+        print(f"\n{'backend':<12}" + "".join(f"{f'{c}x dec/s':>12}" for c in levels))
+        for backend in results:
+            print(f"{backend:<12}" + "".join(f"{_throughput(backend, examples, c):>12.1f}" for c in levels))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# backend/benchmarks/bench_stt.py
+"""
+Compare speech-to-text engines on a fixture corpus.
+
+The corpus is a directory of audio files, each with a reference transcript
+next to it using the same stem:
+
+    fixtures/stt/answer_01.webm
+    fixtures/stt/answer_01.txt
+
+Usage:
+    python -m backend.benchmarks.bench_stt --corpus fixtures/stt --engines whisper faster-whisper
+"""
+
+import argparse
+import re
+import time
+from pathlib import Path
+
+from backend.audio_decode import SAMPLE_RATE, decode_audio
+
+AUDIO_SUFFIXES = {".webm", ".wav", ".mp3", ".m4a", ".ogg", ".flac"}
+
+
+def _normalize(text):
+    return re.sub(r"[^a-z0-9' ]+", " ", text.lower()).split()
+
+
+def word_error_rate(reference, hypothesis):
+    ref, hyp = _normalize(reference), _normalize(hypothesis)
+    if not ref:
+        return 0.0 if not hyp else 1.0
+
+    # Word-level Levenshtein distance, one row at a time
+    prev = list(range(len(hyp) + 1))
+    for i, r in enumerate(ref, 1):
+        curr = [i] + [0] * len(hyp)
+        for j, h in enumerate(hyp, 1):
+            curr[j] = min(prev[j] + 1, curr[j - 1] + 1, prev[j - 1] + (r != h))
+        prev = curr
+    return prev[-1] / len(ref)
+
+
+def load_corpus(corpus_dir):
+    items = []
+    for audio_path in sorted(Path(corpus_dir).iterdir()):
+        ref_path = audio_path.with_suffix(".txt")
+        if audio_path.suffix.lower() in AUDIO_SUFFIXES and ref_path.exists():
+            pcm = decode_audio(str(audio_path))
+            items.append((audio_path.name, pcm, ref_path.read_text(encoding="utf-8")))
+    return items
+
+
+def bench_engine(name, model_size, corpus):
+    from backend.speech_to_text import create_engine
+
+    t0 = time.perf_counter()
+    engine = create_engine(name, model_size)
+    load_s = time.perf_counter() - t0
+
+    total_audio = total_compute = total_errors = total_words = 0.0
+    for _, pcm, reference in corpus:
+        t0 = time.perf_counter()
+        hypothesis = engine.transcribe(pcm)
+        total_compute += time.perf_counter() - t0
+        total_audio += len(pcm) / SAMPLE_RATE
+
+        words = len(_normalize(reference))
+        total_errors += word_error_rate(reference, hypothesis) * words
+        total_words += words
+
+    return {
+        "engine": name,
+        "load_s": load_s,
+        "wer": total_errors / total_words if total_words else 0.0,
+        "rtf": total_compute / total_audio if total_audio else 0.0,
+        "audio_s": total_audio,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", required=True, help="Directory of audio files with .txt references")
+    parser.add_argument("--engines", nargs="+", default=["whisper", "faster-whisper"])
+    parser.add_argument("--model-size", default="base")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus)
+    if not corpus:
+        print(f"❌ No audio/.txt pairs found in {args.corpus}")
+        return
+
+    print(f"📄 {len(corpus)} clips")
+    print(f"{'engine':<16}{'load (s)':>10}{'WER':>8}{'RTF':>8}")
+    for name in args.engines:
+        r = bench_engine(name, args.model_size, corpus)
+        print(f"{r['engine']:<16}{r['load_s']:>10.2f}{r['wer']:>8.3f}{r['rtf']:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
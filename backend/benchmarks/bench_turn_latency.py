@@ -0,0 +1,77 @@
+# backend/benchmarks/bench_turn_latency.py
+"""
+Turn latency of the combined (one structured call) path against the
+two-stage controller + generator path, against the live Groq API.
+
+Usage:
+    python -m backend.benchmarks.bench_turn_latency --turns 20
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from backend.combined_turn_chain import decide_and_generate_hr, decide_and_generate_technical
+from backend.controller_chain import get_controller_decision, get_tech_controller_decision
+from backend.hr_interview_chain import generate_hr_question
+from backend.memory_interview_chain import generate_technical_question
+
+ROLE = "Backend Developer"
+RESUME = "Skills: Python, FastAPI, PostgreSQL, Redis, Docker. Projects: payment service, chat app."
+SAMPLES = [
+    ("How would you design a rate limiter for an API?", "I'd use a token bucket in Redis keyed by user id."),
+    ("What is an index in a relational database?", "It makes lookups faster, like a book index."),
+    ("Tell me about a time you handled a conflict.", "Two teammates disagreed on the schema so I set up a call and we compared options."),
+    ("Explain how async IO works in Python.", "Um, it runs things at the same time I think."),
+]
+
+
+def _tech_two_stage(q, a):
+    decision = get_tech_controller_decision(q, a, ROLE, RESUME, [])
+    return generate_technical_question(ROLE, decision, q, a, RESUME, [])
+
+
+def _tech_combined(q, a):
+    return decide_and_generate_technical(q, a, ROLE, RESUME, [])
+
+
+def _hr_two_stage(q, a):
+    return generate_hr_question(ROLE, q, a, get_controller_decision(q, a))
+
+
+def _hr_combined(q, a):
+    return decide_and_generate_hr(ROLE, q, a)
+
+
+def _measure(fn, turns):
+    latencies, failures = [], 0
+    for i in range(turns):
+        q, a = SAMPLES[i % len(SAMPLES)]
+        t0 = time.perf_counter()
+        if not fn(q, a):
+            failures += 1
+        latencies.append(time.perf_counter() - t0)
+    return np.percentile(latencies, 50), np.percentile(latencies, 95), failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=20)
+    args = parser.parse_args()
+
+    paths = [
+        ("tech / two_stage", _tech_two_stage),
+        ("tech / combined", _tech_combined),
+        ("hr / two_stage", _hr_two_stage),
+        ("hr / combined", _hr_combined),
+    ]
+
+    print(f"{'path':<20}{'p50 (s)':>10}{'p95 (s)':>10}{'failed':>8}")
+    for name, fn in paths:
+        p50, p95, failures = _measure(fn, args.turns)
+        print(f"{name:<20}{p50:>10.3f}{p95:>10.3f}{failures:>8}")
+
+
+if __name__ == "__main__":
+    main()
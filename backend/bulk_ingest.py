@@ -0,0 +1,244 @@
+# backend/bulk_ingest.py
+"""
+Bulk resume onboarding for a candidate cohort.
+
+PDF text is extracted in a process pool, LLM parses run on a bounded thread
+pool with retry and exponential backoff, and profiles are upserted into
+users_collection with bulk_write. Every flushed PDF is appended to a
+checkpoint file, so re-running the same command skips finished work.
+
+Input is a directory of PDFs or a CSV manifest with a `path` column and
+optional `email`, `clerkId` and `role` columns. Rows are matched to existing
+users by clerkId, then email (manifest, else the parsed one). Rows without a
+clerkId become email-only profiles that are linked to the Clerk account the
+first time that email signs in (see backend/auth.py).
+
+Usage:
+    python -m backend.bulk_ingest resumes/ --concurrency 8
+    python -m backend.bulk_ingest cohort.csv --checkpoint cohort.progress.jsonl
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from backend.database import EMAIL_COLLATION, users_collection
+from backend.resume_cache import cached_parse, get_cached_entry, store_parse
+from backend.resume_parser import extract_sections_from_pdf, parse_resume_sections, sections_to_text
+
+PROFILE_FIELDS = ("name", "phone", "skills", "education", "experience", "projects")
+
+
+def load_jobs(source):
+    """List of {"path", "email", "clerkId", "role"} dicts from a directory or CSV manifest."""
+    if os.path.isdir(source):
+        return [
+            {"path": os.path.join(source, name)}
+            for name in sorted(os.listdir(source))
+            if name.lower().endswith(".pdf")
+        ]
+
+    base = os.path.dirname(os.path.abspath(source))
+    with open(source, newline="", encoding="utf-8") as f:
+        jobs = [{k: v.strip() for k, v in row.items() if v and v.strip()} for row in csv.DictReader(f)]
+    for job in jobs:
+        job["path"] = os.path.join(base, job["path"])
+    return jobs
+
+
+def load_checkpoint(path):
+    done = set()
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                entry = json.loads(line)
+                if entry["status"] == "done":
+                    done.add(entry["path"])
+    return done
+
+
+def _extract(path):
+    """Runs in a worker process: hash + sections for one PDF."""
+    with open(path, "rb") as f:
+        contents = f.read()
+    return hashlib.sha256(contents).hexdigest(), extract_sections_from_pdf(contents)
+
+
+def _parse_with_backoff(sections, retries, base_delay, parse_pool):
+    # The parser already retries bad JSON; this covers rate limits and transient API errors
+    for attempt in range(retries + 1):
+        parsed = parse_resume_sections(sections, pool=parse_pool)
+        if "error" not in parsed:
+            return parsed
+        if attempt < retries:
+            time.sleep(base_delay * 2 ** attempt + random.uniform(0, base_delay))
+    return parsed
+
+
+def _parse(job, digest, sections, retries, base_delay, parse_pool):
+    """
+    Runs on the LLM thread pool; reuses the resume cache when the same PDF was parsed before.
+    The per-section LLM calls go to `parse_pool`, so --concurrency bounds the calls in flight, not the resumes.
+    """
+    parsed = cached_parse(get_cached_entry(digest))
+    if parsed:
+        return parsed, True
+
+    parsed = _parse_with_backoff(sections, retries, base_delay, parse_pool)
+    if "error" not in parsed:
+        store_parse(digest, sections, parsed)
+    return parsed, False
+
+
+def _user_update(job, digest, parsed):
+    profile = {field: parsed[field] for field in PROFILE_FIELDS if parsed.get(field)}
+    if job.get("role"):
+        profile["role"] = job["role"]
+    profile.update({"resumeHash": digest, "updatedAt": datetime.utcnow()})
+
+    if job.get("clerkId"):
+        on_insert = {"email": (job.get("email") or parsed.get("email", "")).lower(), "createdAt": datetime.utcnow()}
+        on_insert = {k: v for k, v in on_insert.items() if k not in profile}
+        return UpdateOne({"clerkId": job["clerkId"]}, {"$set": profile, "$setOnInsert": on_insert}, upsert=True)
+
+    email = job.get("email") or parsed.get("email")
+    if not email:
+        return None
+    # Updates the signed-up user with this email; otherwise auth links the new profile on first sign-in
+    return UpdateOne(
+        {"email": email.lower()},
+        {"$set": profile, "$setOnInsert": {"createdAt": datetime.utcnow()}},
+        upsert=True,
+        collation=EMAIL_COLLATION,
+    )
+
+
+class Checkpoint:
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def record(self, entries):
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            for path, status, reason in entries:
+                f.write(json.dumps({"path": path, "status": status, "reason": reason}) + "\n")
+
+
+def ingest(jobs, checkpoint_path, processes, concurrency, batch_size, retries, base_delay):
+    done = load_checkpoint(checkpoint_path)
+    pending = [job for job in jobs if job["path"] not in done]
+    checkpoint = Checkpoint(checkpoint_path)
+    stats = Counter(total=len(jobs), skipped=len(jobs) - len(pending))
+    failures = Counter()
+    ops, flushed = [], []
+
+    def fail(path, reason):
+        stats["failed"] += 1
+        failures[reason] += 1
+        checkpoint.record([(path, "failed", reason)])
+
+    def flush():
+        if not ops:
+            return
+        errors = {}
+        try:
+            users_collection.bulk_write(ops, ordered=False)
+        except BulkWriteError as e:
+            # Unordered: every op except the reported ones was applied, so record those and keep going
+            errors = {err["index"]: err for err in e.details.get("writeErrors", [])}
+            print(f"⚠️ bulk_write: {len(errors)} of {len(ops)} writes failed")
+        for index, err in sorted(errors.items()):
+            print(f"   {flushed[index][0]}: {err.get('errmsg')}")
+            fail(flushed[index][0], f"write error {err.get('code')}")
+        checkpoint.record([entry for i, entry in enumerate(flushed) if i not in errors])
+        stats["written"] += len(ops) - len(errors)
+        ops.clear()
+        flushed.clear()
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=processes) as cpu_pool, \
+            ThreadPoolExecutor(max_workers=concurrency) as llm_pool, \
+            ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="resume-parse") as parse_pool:
+        extract_futures = {cpu_pool.submit(_extract, job["path"]): job for job in pending}
+        parse_futures = {}
+
+        for future in as_completed(extract_futures):
+            job = extract_futures[future]
+            try:
+                digest, sections = future.result()
+            except Exception as e:
+                fail(job["path"], f"read: {type(e).__name__}")
+                continue
+            if not sections_to_text(sections):
+                fail(job["path"], "no text extracted")
+                continue
+            parse_futures[llm_pool.submit(_parse, job, digest, sections, retries, base_delay, parse_pool)] = (job, digest)
+
+        for future in as_completed(parse_futures):
+            job, digest = parse_futures[future]
+            try:
+                parsed, from_cache = future.result()
+            except Exception as e:
+                fail(job["path"], f"parse: {type(e).__name__}")
+                continue
+            if "error" in parsed:
+                fail(job["path"], parsed["error"])
+                continue
+
+            op = _user_update(job, digest, parsed)
+            if op is None:
+                fail(job["path"], "no email or clerkId")
+                continue
+            stats["cache_hits"] += from_cache
+            ops.append(op)
+            flushed.append((job["path"], "done", None))
+            if len(ops) >= batch_size:
+                flush()
+        flush()
+
+    stats["elapsed_s"] = time.perf_counter() - started
+    return stats, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("source", help="directory of PDFs or CSV manifest")
+    parser.add_argument("--checkpoint", help="progress file (default: <source>.progress.jsonl)")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 2, help="text extraction processes")
+    parser.add_argument("--concurrency", type=int, default=8, help="resume parse LLM calls in flight")
+    parser.add_argument("--batch-size", type=int, default=50, help="users per bulk_write")
+    parser.add_argument("--retries", type=int, default=3)
+    parser.add_argument("--backoff", type=float, default=2.0, help="base backoff delay in seconds")
+    args = parser.parse_args()
+
+    checkpoint = args.checkpoint or os.path.abspath(args.source).rstrip(os.sep) + ".progress.jsonl"
+    jobs = load_jobs(args.source)
+    print(f"🔄 Ingesting {len(jobs)} resumes from {args.source}")
+
+    stats, failures = ingest(jobs, checkpoint, args.processes, args.concurrency, args.batch_size, args.retries, args.backoff)
+
+    processed = stats["written"] + stats["failed"]
+    rate = processed / stats["elapsed_s"] if stats["elapsed_s"] else 0.0
+    print("\n" + "=" * 50)
+    print(f"✅ written:    {stats['written']} ({stats['cache_hits']} from resume cache)")
+    print(f"⏭️  skipped:    {stats['skipped']} (already in checkpoint)")
+    print(f"❌ failed:     {stats['failed']}")
+    print(f"⏱️  elapsed:    {stats['elapsed_s']:.1f}s  ({rate:.2f} resumes/s)")
+    for reason, count in failures.most_common():
+        print(f"   {count:>4}  {reason}")
+    print(f"📄 checkpoint: {checkpoint}")
+
+
+if __name__ == "__main__":
+    main()
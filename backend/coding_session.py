@@ -37,3 +37,31 @@ class CodingSession:
 
     def generate_feedback(self):
         return generate_coding_feedback(self.history)
+
+    def to_dict(self):
+        """Plain-data snapshot used by the session store. Keeps the shuffled order so rounds resume identically."""
+        return {
+            "kind": "coding",
+            "role": self.role,
+            "rounds": self.rounds,
+            "current_round": self.current_round,
+            "history": self.history,
+            "explanation_history": self.explanation_history,
+            "meta": self.meta,
+            "problems": self.randomized_problems,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        # Skip __init__: the problem order was fixed when the session started
+        session = cls.__new__(cls)
+        session.role = data["role"]
+        session.rounds = data["rounds"]
+        session.current_round = data["current_round"]
+        session.history = data["history"]
+        session.explanation_history = data["explanation_history"]
+        session.meta = data.get("meta", {})
+        session.round_type = "Coding"
+        session.all_problems = data["problems"]
+        session.randomized_problems = data["problems"]
+        return session
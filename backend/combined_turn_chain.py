@@ -0,0 +1,136 @@
+# backend/combined_turn_chain.py
+#
+# One-call "decide and generate": the controller label and the next question
+# come back together as validated structured output, instead of a controller
+# round-trip followed by a generator round-trip.
+
+import os
+from typing import Literal
+
+from pydantic import BaseModel, Field
+from langchain_core.prompts import ChatPromptTemplate
+from backend.llm_groq_config import llm
+from backend.llm_cache import cached
+
+# two_stage → controller call, then generator call (default)
+# combined  → one structured call, falling back to two_stage if it fails validation;
+#             opt in with TURN_MODE=combined once bench_turn_latency backs it up
+TURN_MODE = os.getenv("TURN_MODE", "two_stage")
+
+
+class TechTurn(BaseModel):
+    decision: Literal[
+        "depth_probe",
+        "concept_clarification",
+        "edge_case",
+        "follow_up_question",
+        "topic_transition",
+    ] = Field(description="The controller action chosen for the next turn")
+    question: str = Field(description="Exactly one technical interview question obeying the decision")
+
+
+class HRTurn(BaseModel):
+    decision: Literal["probe", "clarify", "example", "next_topic", "behavior_check"] = Field(
+        description="The controller action chosen for the next turn"
+    )
+    question: str = Field(description="Exactly one HR interview question obeying the decision")
+
+
+tech_turn_prompt = ChatPromptTemplate.from_template("""
+You are running a technical interview for the role of {role}. For the next turn you must
+first decide the interviewer action, then write the question that carries it out.
+
+Actions:
+- depth_probe           → deeper sub-question within the SAME topic (answer good but shallow)
+- concept_clarification → ask to clarify vague, incorrect or incomplete parts of the answer
+- edge_case             → edge cases, tricky constraints or performance boundaries of the same topic
+- follow_up_question    → next logical follow-up in the SAME topic (answer solid)
+- topic_transition      → NEW topic from the resume skills or role; avoid recently covered topics
+
+If the previous question's topic appears in recently covered topics, prefer topic_transition.
+
+Previous question:
+\"\"\"{prev_question}\"\"\"
+
+Candidate answer:
+\"\"\"{candidate_answer}\"\"\"
+
+Resume excerpt (skills + experience):
+{resume_excerpt}
+
+Recently covered topic keywords:
+{recent_topics}
+
+The question must be a single question with no explanation.
+""")
+
+
+hr_turn_prompt = ChatPromptTemplate.from_template("""
+You are an HR interviewer for the role of {role}. For the next turn you must first decide
+the interviewer action, then write the question that carries it out.
+
+Actions:
+- probe          → deeper follow-up on the same topic
+- clarify        → the answer is vague or unclear; ask what part was unclear
+- example        → ask for a real incident
+- next_topic     → move to a new HR competency
+- behavior_check → ask a STAR-style behavioral question
+
+Previous question:
+\"\"\"{prev_question}\"\"\"
+
+Candidate answer:
+\"\"\"{last_answer}\"\"\"
+
+The question must be a single, natural, professional HR question with no explanation.
+""")
+
+_tech_turn_llm = llm.with_structured_output(TechTurn)
+_hr_turn_llm = llm.with_structured_output(HRTurn)
+
+# Empty answers give exactly repeating prompts, so only those turns are cached
+_turn_llms = {
+    TechTurn: (_tech_turn_llm, cached(_tech_turn_llm, site="empty_answer_turn", key_llm=llm)),
+    HRTurn: (_hr_turn_llm, cached(_hr_turn_llm, site="empty_answer_turn", key_llm=llm)),
+}
+
+
+def _turn_llm(schema, answer):
+    plain, cached_llm = _turn_llms[schema]
+    return cached_llm if not (answer or "").strip() else plain
+
+
+def decide_and_generate_technical(prev_question, candidate_answer, role, resume_excerpt, recent_topics):
+    """Returns {"decision", "question"} or None if the structured call failed."""
+    prompt = tech_turn_prompt.format(
+        role=role or "general",
+        prev_question=prev_question or "",
+        candidate_answer=candidate_answer or "",
+        resume_excerpt=resume_excerpt[:1200],
+        recent_topics=", ".join(recent_topics) if recent_topics else "none"
+    )
+    try:
+        turn = _turn_llm(TechTurn, candidate_answer).invoke(prompt)
+    except Exception as e:
+        print(f"[Combined Turn Error] {e}")
+        return None
+    if not turn or not turn.question.strip():
+        return None
+    return {"decision": turn.decision, "question": turn.question.strip()}
+
+
+def decide_and_generate_hr(role, prev_question, last_answer):
+    """Returns {"decision", "question"} or None if the structured call failed."""
+    prompt = hr_turn_prompt.format(
+        role=role,
+        prev_question=prev_question or "",
+        last_answer=last_answer or ""
+    )
+    try:
+        turn = _turn_llm(HRTurn, last_answer).invoke(prompt)
+    except Exception as e:
+        print(f"[Combined Turn Error] {e}")
+        return None
+    if not turn or not turn.question.strip():
+        return None
+    return {"decision": turn.decision, "question": turn.question.strip()}
@@ -1,30 +1,166 @@
 # backend/confidence_utils.py
+#
+# Speech-specific confidence scorer. Everything runs on the 16 kHz mono PCM the
+# rest of the audio pipeline already decodes: one framing pass (cumulative sums,
+# so O(samples)) yields per-frame RMS and zero-crossing rate, and the syllable
+# rate comes from peaks in that RMS envelope instead of a music beat tracker.
+# Scoring is split into extract_features() / score_features() so stored
+# features can be re-scored later without the audio.
+
+import os
 
-import librosa
 import numpy as np
 
-def get_confidence_score(audio_path: str) -> float:
-    try:
-        y, sr = librosa.load(audio_path)
+from backend.audio_decode import SAMPLE_RATE, decode_audio
+from backend.vad import NOISE_RATIO
+
+SCORING_SR = SAMPLE_RATE
+FRAME_S = 0.032
+HOP_S = 0.010
+
+# The original scorer measured ZCR per sample at librosa's 22.05 kHz; crossings
+# per second are rate-independent, so they are converted back to that scale
+LEGACY_SR = 22050
+# Syllables per second that count as fully fluent (conversational speech is ~4-5)
+SYLLABLE_RATE_REF = 5.0
+# Syllable nuclei closer than this are merged
+MIN_SYLLABLE_GAP_S = 0.1
+
+# Frames quieter than this never count as voiced when scoring, whatever the VAD floor is;
+# the score was calibrated with it
+ENERGY_FLOOR = 0.01
+
+# Pitch variability is optional: it costs an FFT per voiced frame
+CONFIDENCE_PITCH = os.getenv("CONFIDENCE_PITCH", "0") == "1"
+PITCH_MIN_HZ = 60
+PITCH_MAX_HZ = 400
+
+
+def frame_features(pcm, sr=SCORING_SR, pitch=CONFIDENCE_PITCH):
+    """
+    Per-frame arrays at HOP_S spacing: "rms", "zcr" (crossings per second) and,
+    with `pitch`, "f0" (Hz, NaN when unvoiced). These are what gets stored for
+    re-scoring.
+    """
+    y = np.asarray(pcm, dtype=np.float32)
+    frame_len = int(sr * FRAME_S)
+    hop = int(sr * HOP_S)
+    if len(y) < frame_len:
+        y = np.pad(y, (0, frame_len - len(y)))
+
+    starts = np.arange(0, len(y) - frame_len + 1, hop)
+    ends = starts + frame_len
+
+    # Frame sums from running totals: energy and sign changes in a single pass over the samples
+    energy = np.concatenate(([0.0], np.cumsum(y.astype(np.float64) ** 2)))
+    signs = np.signbit(y)
+    crossings = np.concatenate(([0], np.cumsum(signs[1:] != signs[:-1])))
+
+    frames = {
+        "sr": sr,
+        "hop_s": HOP_S,
+        "duration": len(pcm) / sr,
+        "rms": np.sqrt((energy[ends] - energy[starts]) / frame_len).astype(np.float32),
+        "zcr": ((crossings[ends - 1] - crossings[starts]) * (sr / (frame_len - 1))).astype(np.float32),
+    }
+    if pitch:
+        frames["f0"] = _frame_pitch(y, starts, frame_len, sr, frames["rms"])
+    return frames
+
+
+def _frame_pitch(y, starts, frame_len, sr, rms):
+    """Autocorrelation pitch of each voiced frame; NaN elsewhere."""
+    f0 = np.full(len(starts), np.nan, dtype=np.float32)
+    voiced = np.flatnonzero(rms > _speech_threshold(rms))
+    if voiced.size == 0:
+        return f0
+
+    frames = y[starts[voiced, None] + np.arange(frame_len)] * np.hanning(frame_len).astype(np.float32)
+    spectrum = np.fft.rfft(frames, n=2 * frame_len, axis=1)
+    ac = np.fft.irfft(spectrum * np.conj(spectrum), axis=1)[:, :frame_len]
 
-        duration = librosa.get_duration(y=y, sr=sr)
-        if duration < 1.0:
-            return 0.2  # very short response = low confidence
+    lo, hi = int(sr / PITCH_MAX_HZ), min(int(sr / PITCH_MIN_HZ), frame_len - 1)
+    lags = lo + np.argmax(ac[:, lo:hi], axis=1)
+    strength = ac[np.arange(len(lags)), lags] / np.maximum(ac[:, 0], 1e-12)
+    periodic = strength > 0.3
+    f0[voiced[periodic]] = sr / lags[periodic]
+    return f0
 
-        # Extract features
-        rms = np.mean(librosa.feature.rms(y=y))           # energy
-        tempo, _ = librosa.beat.beat_track(y=y, sr=sr)     # speaking speed
-        zcr = np.mean(librosa.feature.zero_crossing_rate(y))  # voice crispness
 
-        # Normalize + combine into score
-        rms_score = min(rms * 100, 1.0)
-        tempo_score = min(tempo / 150, 1.0)  # cap at reasonable tempo
-        zcr_score = min(zcr * 10, 1.0)
+def _speech_threshold(rms):
+    # Same adaptive rule as backend.vad, with the scorer's own floor
+    return max(ENERGY_FLOOR, float(np.percentile(rms, 10)) * NOISE_RATIO) if rms.size else ENERGY_FLOOR
 
+
+def _syllable_count(rms, hop_s):
+    """Local maxima of the smoothed energy envelope above the speech threshold."""
+    if rms.size < 3:
+        return 0
+    env = np.convolve(rms, np.ones(5) / 5, mode="same")
+    threshold = _speech_threshold(rms)
+    peaks = np.flatnonzero((env[1:-1] > env[:-2]) & (env[1:-1] >= env[2:]) & (env[1:-1] > threshold)) + 1
+
+    min_gap = int(MIN_SYLLABLE_GAP_S / hop_s)
+    count, last = 0, -min_gap
+    for p in peaks:
+        if p - last >= min_gap:
+            count += 1
+            last = p
+    return count
+
+
+def summarize_frames(frames):
+    """Collapse frame arrays into the scalar features score_features() uses."""
+    rms = np.asarray(frames["rms"], dtype=np.float32)
+    duration = frames["duration"]
+    features = {
+        "duration": duration,
+        "rms": float(rms.mean()) if rms.size else 0.0,
+        "zcr": float(np.mean(frames["zcr"])) if rms.size else 0.0,
+        "syllable_rate": _syllable_count(rms, frames["hop_s"]) / duration if duration else 0.0,
+    }
+    if frames.get("f0") is not None:
+        f0 = np.asarray(frames["f0"], dtype=np.float32)
+        f0 = f0[~np.isnan(f0)]
+        # Spread of pitch in semitones around the speaker's median
+        features["pitch_std"] = float(np.std(12 * np.log2(f0 / np.median(f0)))) if f0.size >= 10 else None
+    return features
+
+
+def extract_features(pcm, sr=SCORING_SR, pitch=CONFIDENCE_PITCH):
+    return summarize_frames(frame_features(pcm, sr, pitch))
+
+
+def score_features(features) -> float:
+    if features["duration"] < 1.0:
+        return 0.2  # very short response = low confidence
+
+    # Normalize + combine into score
+    rms_score = min(features["rms"] * 100, 1.0)                       # energy
+    rate_score = min(features["syllable_rate"] / SYLLABLE_RATE_REF, 1.0)  # speaking speed
+    zcr_score = min(features["zcr"] / LEGACY_SR * 10, 1.0)               # voice crispness
+
+    if features.get("pitch_std") is not None:
+        pitch_score = min(features["pitch_std"] / 4.0, 1.0)  # flat delivery scores low
+        confidence = 0.35 * rms_score + 0.25 * rate_score + 0.25 * zcr_score + 0.15 * pitch_score
+    else:
         # Weighted average
-        confidence = 0.4 * rms_score + 0.3 * tempo_score + 0.3 * zcr_score
+        confidence = 0.4 * rms_score + 0.3 * rate_score + 0.3 * zcr_score
 
-        return round(confidence, 2)
+    return round(confidence, 2)
+
+
+def get_confidence_score(audio, sr=None) -> float:
+    """
+    Score a spoken answer. `audio` is either a file path or a mono float32
+    PCM buffer already decoded at `sr` Hz (see backend.audio_decode).
+    """
+    try:
+        if isinstance(audio, str):
+            y, sr = decode_audio(audio), SCORING_SR
+        else:
+            y, sr = np.asarray(audio, dtype=np.float32), sr or SCORING_SR
+        return score_features(extract_features(y, sr))
     except Exception as e:
         print(f"[Confidence Error] {e}")
         return 0.5  # fallback
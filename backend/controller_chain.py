@@ -1,7 +1,28 @@
 # backend/controller_chain.py
 
+import os
+
 from langchain_core.prompts import ChatPromptTemplate
 from backend.llm_groq_config import llm
+from backend.llm_cache import cached
+
+# HR controller backend:
+# llm        → Groq call (default)
+# local      → fine-tuned causal LM from CONTROLLER_MODEL_PATH (backend/controller_model.py)
+# classifier → embedding + logistic regression distilled from controller_interview_data.jsonl
+CONTROLLER_BACKEND = os.getenv("CONTROLLER_BACKEND", "llm").lower()
+
+if CONTROLLER_BACKEND == "classifier":
+    from backend.controller_classifier import check_dataset
+    try:
+        check_dataset()
+    except (OSError, ValueError) as e:
+        print(f"⚠️ Controller classifier not selected, using the LLM controller: {e}")
+        CONTROLLER_BACKEND = "llm"
+HR_LABELS = ["probe", "clarify", "example", "next_topic", "behavior_check"]
+
+# Controller prompts repeat exactly for silent/empty answers and the fixed opening questions
+controller_llm = cached(llm, site="controller")
 
 controller_prompt = ChatPromptTemplate.from_template("""
 You are the decision-making controller in an HR interview system.
@@ -97,13 +118,33 @@ def get_tech_controller_decision(prev_question, candidate_answer, role, resume_e
         recent_topics=", ".join(recent_topics) if recent_topics else "none"
     )
 
-    resp = llm.invoke(prompt).content
+    resp = controller_llm.invoke(prompt).content
     return _sanitize_label(resp)
 
 
-def get_controller_decision(question: str, answer: str):
-    result = llm.invoke(
+def _llm_controller_decision(question, answer):
+    result = controller_llm.invoke(
         controller_prompt.format(question=question, answer=answer)
     ).content.strip().lower()
-    valid = ["probe", "clarify", "example", "next_topic", "behavior_check"]
-    return result if result in valid else "probe"
+    return result if result in HR_LABELS else "probe"
+
+
+def get_controller_decision(question: str, answer: str, backend=None, fallback=True):
+    """
+    HR controller label from `backend` (CONTROLLER_BACKEND by default). A failing
+    local backend falls back to the LLM unless `fallback` is False, when the error is raised.
+    """
+    backend = backend or CONTROLLER_BACKEND
+    # The local backends were trained on the answer alone, so the question is only used by the LLM
+    try:
+        if backend == "local":
+            from backend.controller_model import get_controller_decision as local_decision
+            return local_decision(answer)
+        if backend == "classifier":
+            from backend.controller_classifier import get_controller_decision as classifier_decision
+            return classifier_decision(answer)
+    except Exception as e:
+        if not fallback:
+            raise
+        print(f"[Controller Error] {backend} backend failed, using LLM: {e}")
+    return _llm_controller_decision(question, answer)
@@ -0,0 +1,115 @@
+# backend/controller_classifier.py
+#
+# Tiny distilled HR controller: sentence embeddings + logistic regression,
+# trained from controller_interview_data.jsonl. Trains on first use and
+# caches the fitted model next to the data. The bundled file only holds a
+# handful of examples, so the backend refuses to train until the dataset
+# reaches CONTROLLER_CLASSIFIER_MIN_EXAMPLES.
+
+import json
+import os
+import pickle
+import threading
+
+import numpy as np
+
+from backend.batching import MicroBatcher
+from backend.controller_model import CONTROLLER_BATCH_SIZE, CONTROLLER_BATCH_WAIT_MS
+from backend.embedding_service import get_embedding_service
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+CONTROLLER_DATA_PATH = os.getenv("CONTROLLER_DATA_PATH", os.path.join(BACKEND_DIR, "controller_interview_data.jsonl"))
+CONTROLLER_CLASSIFIER_PATH = os.getenv("CONTROLLER_CLASSIFIER_PATH", os.path.join(BACKEND_DIR, "controller_classifier.pkl"))
+
+# Fewer labelled examples than this and the fit is not trusted; the classifier backend is not selected
+CONTROLLER_CLASSIFIER_MIN_EXAMPLES = int(os.getenv("CONTROLLER_CLASSIFIER_MIN_EXAMPLES", 200))
+
+_classifier = None
+_load_lock = threading.Lock()
+
+
+def load_controller_examples(path=CONTROLLER_DATA_PATH):
+    """
+    (instruction, label) pairs. The file holds pretty-printed JSON objects
+    one after another rather than strict one-per-line JSONL.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+
+    decoder = json.JSONDecoder()
+    examples, pos = [], 0
+    while True:
+        while pos < len(text) and text[pos].isspace():
+            pos += 1
+        if pos >= len(text):
+            break
+        obj, pos = decoder.raw_decode(text, pos)
+        examples.append((obj["instruction"], obj["response"].strip().lower()))
+    return examples
+
+
+def check_dataset(examples=None):
+    """Raise ValueError when the dataset is too small to train a classifier worth serving."""
+    examples = load_controller_examples() if examples is None else examples
+    if len(examples) < CONTROLLER_CLASSIFIER_MIN_EXAMPLES:
+        raise ValueError(
+            f"{len(examples)} labelled examples, need at least {CONTROLLER_CLASSIFIER_MIN_EXAMPLES} "
+            f"(CONTROLLER_CLASSIFIER_MIN_EXAMPLES)"
+        )
+    if len({label for _, label in examples}) < 2:
+        raise ValueError("the dataset has a single label")
+
+
+def _prompt(user_answer):
+    # Same framing as the training instructions
+    return f"User answer: {user_answer}"
+
+
+def train_classifier(examples=None):
+    from sklearn.linear_model import LogisticRegression
+
+    examples = examples or load_controller_examples()
+    check_dataset(examples)
+    texts, labels = zip(*examples)
+    features = get_embedding_service().embed_many(list(texts))
+
+    classifier = LogisticRegression(max_iter=1000, class_weight="balanced")
+    classifier.fit(features, labels)
+    return classifier
+
+
+def _load():
+    global _classifier
+    with _load_lock:
+        if _classifier is None:
+            data_mtime = os.path.getmtime(CONTROLLER_DATA_PATH)
+            if os.path.exists(CONTROLLER_CLASSIFIER_PATH) and os.path.getmtime(CONTROLLER_CLASSIFIER_PATH) >= data_mtime:
+                with open(CONTROLLER_CLASSIFIER_PATH, "rb") as f:
+                    _classifier = pickle.load(f)
+            else:
+                print("Training controller classifier…")
+                _classifier = train_classifier()
+                with open(CONTROLLER_CLASSIFIER_PATH, "wb") as f:
+                    pickle.dump(_classifier, f)
+    return _classifier
+
+
+def predict_decisions(user_answers):
+    """Labels and their probabilities for several answers in one pass."""
+    classifier = _load()
+    features = get_embedding_service().embed_many([_prompt(a or "") for a in user_answers])
+    probs = classifier.predict_proba(features)
+    best = np.argmax(probs, axis=1)
+    return [(classifier.classes_[i], float(probs[row, i])) for row, i in enumerate(best)]
+
+
+_batcher = MicroBatcher(predict_decisions, name="controller_classifier", max_batch_size=CONTROLLER_BATCH_SIZE, max_wait_ms=CONTROLLER_BATCH_WAIT_MS)
+
+
+def submit_decision(user_answer):
+    """Future resolving to (label, probability); batched with other sessions' requests."""
+    return _batcher.submit(user_answer)
+
+
+def get_controller_decision(user_answer):
+    return submit_decision(user_answer).result()[0]
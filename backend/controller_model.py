@@ -1,36 +1,137 @@
-from transformers import AutoModelForCausalLM, AutoTokenizer
-import torch
+# backend/controller_model.py
+#
+# Local fine-tuned causal LM (see finetune_controller.ipynb) for the HR
+# controller decision. Nothing is loaded until the first decision.
 
-# Load controller model
-DEVICE = "cuda" if torch.cuda.is_available() else "cpu"
+import os
+import threading
+
+from backend.batching import MicroBatcher
+
+CONTROLLER_MODEL_PATH = os.getenv("CONTROLLER_MODEL_PATH", "./controller-phi2")
+CONTROLLER_BATCH_SIZE = int(os.getenv("CONTROLLER_BATCH_SIZE", 16))
+CONTROLLER_BATCH_WAIT_MS = float(os.getenv("CONTROLLER_BATCH_WAIT_MS", 5))
+LABELS = ["probe", "clarify", "next_topic", "example", "behavior_check"]
+
+_tokenizer = None
+_model = None
+_device = None
+_label_batch = None
+_load_lock = threading.Lock()
+
+
+def _load():
+    global _tokenizer, _model, _device
+    with _load_lock:
+        if _model is None:
+            import torch
+            from transformers import AutoModelForCausalLM, AutoTokenizer
+
+            _device = "cuda" if torch.cuda.is_available() else "cpu"
+            print("Loading controller model…")
+            tokenizer = AutoTokenizer.from_pretrained(CONTROLLER_MODEL_PATH)
+            if tokenizer.pad_token is None:
+                tokenizer.pad_token = tokenizer.eos_token
+            # Left padding keeps every prompt's last token at the end of the row for batched scoring
+            tokenizer.padding_side = "left"
+            model = AutoModelForCausalLM.from_pretrained(CONTROLLER_MODEL_PATH).to(_device)
+            model.eval()
+            _tokenizer, _model = tokenizer, model
+    return _tokenizer, _model
+
+
+def _prompt(user_answer):
+    # finetune_controller.ipynb wraps the dataset instruction (already "User answer: …")
+    # in another "User answer:" prefix, so inference mirrors that exactly
+    return f"User answer: User answer: {user_answer}\nAction:"
+
+
+def _label_ids():
+    """Right-padded token ids of each label continuation plus their mask, built once per load."""
+    global _label_batch
+    if _label_batch is None:
+        import torch
+
+        tokenizer, _ = _load()
+        ids = [tokenizer(" " + label, add_special_tokens=False)["input_ids"] for label in LABELS]
+        width = max(len(i) for i in ids)
+        _label_batch = (
+            torch.tensor([i + [tokenizer.pad_token_id] * (width - len(i)) for i in ids], device=_device),
+            torch.tensor([[1] * len(i) + [0] * (width - len(i)) for i in ids], device=_device),
+        )
+    return _label_batch
+
+
+def _repeat_cache(past, repeats):
+    if hasattr(past, "batch_repeat_interleave"):
+        past.batch_repeat_interleave(repeats)
+        return past
+    return tuple(tuple(t.repeat_interleave(repeats, dim=0) for t in layer) for layer in past)
+
+
+def score_decisions(user_answers):
+    """
+    Score all five labels for several answers and return (label, probability)
+    per answer. Each label's log-likelihood is summed over its tokens; the
+    prompts run through the model once and their KV cache is reused for the
+    label continuations of every answer in the batch.
+    """
+    import torch
+
+    tokenizer, model = _load()
+    label_ids, label_mask = _label_ids()
+    n_labels, width = label_ids.shape
+
+    inputs = tokenizer([_prompt(a) for a in user_answers], return_tensors="pt", padding=True).to(_device)
+    prompt_mask = inputs["attention_mask"]
+    # Left padding shifts every row, so positions have to be counted from the first real token
+    position_ids = (prompt_mask.cumsum(-1) - 1).clamp(min=0)
+
+    with torch.no_grad():
+        out = model(input_ids=inputs["input_ids"], attention_mask=prompt_mask, position_ids=position_ids, use_cache=True)
+
+        # First label token comes straight from the prompt's last position
+        first = torch.log_softmax(out.logits[:, -1].float(), dim=-1)
+        scores = first[:, label_ids[:, 0]]  # (batch, labels)
+
+        if width > 1:
+            batch = len(user_answers)
+            cont_ids = label_ids.repeat(batch, 1)
+            cont_mask = label_mask.repeat(batch, 1)
+            start = prompt_mask.sum(-1, keepdim=True).repeat_interleave(n_labels, dim=0)
+            cont_out = model(
+                input_ids=cont_ids,
+                attention_mask=torch.cat([prompt_mask.repeat_interleave(n_labels, dim=0), cont_mask], dim=-1),
+                position_ids=start + torch.arange(width, device=_device),
+                past_key_values=_repeat_cache(out.past_key_values, n_labels),
+                use_cache=False,
+            )
+            # Logits at step j predict label token j + 1
+            logprobs = torch.log_softmax(cont_out.logits[:, :-1].float(), dim=-1)
+            rest = logprobs.gather(-1, cont_ids[:, 1:].unsqueeze(-1)).squeeze(-1) * cont_mask[:, 1:]
+            scores = scores + rest.sum(-1).view(batch, n_labels)
+
+    probs = torch.softmax(scores, dim=-1)
+    best = probs.argmax(-1)
+    return [(LABELS[i], float(probs[row, i])) for row, i in enumerate(best.tolist())]
+
+
+def get_controller_decisions(user_answers):
+    return [label for label, _ in score_decisions(user_answers)]
+
+
+# Concurrent sessions share one scoring pass per batch window
+_batcher = MicroBatcher(score_decisions, name="controller_model", max_batch_size=CONTROLLER_BATCH_SIZE, max_wait_ms=CONTROLLER_BATCH_WAIT_MS)
+
+
+def submit_decision(user_answer):
+    """Future resolving to (label, probability); batched with other sessions' requests."""
+    return _batcher.submit(user_answer)
 
-print("Loading controller model…")
-tokenizer = AutoTokenizer.from_pretrained("./controller-phi2")
-model = AutoModelForCausalLM.from_pretrained("./controller-phi2").to(DEVICE)
 
 # Function to get controller decision
 def get_controller_decision(user_answer: str):
-    prompt = f"User answer: {user_answer}\nAction:"
-    inputs = tokenizer(prompt, return_tensors="pt").to(DEVICE)
-
-    outputs = model.generate(
-        **inputs,
-        max_new_tokens=1,
-        do_sample=False,
-        temperature=0.0,
-        num_beams=1,
-        pad_token_id=tokenizer.pad_token_id,
-        eos_token_id=tokenizer.eos_token_id
-    )
-
-    decoded = tokenizer.decode(outputs[0], skip_special_tokens=True).lower()
-
-    # Extract decision keyword
-    for d in ["probe", "clarify", "next_topic", "example", "behavior_check"]:
-        if d in decoded:
-            return d
-
-    return "probe"
+    return submit_decision(user_answer).result()[0]
 
 
 # Interactive testing loop
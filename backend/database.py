@@ -1,5 +1,7 @@
 # backend/database.py
 from pymongo import MongoClient
+from pymongo.collation import Collation
+import gridfs
 import os
 from dotenv import load_dotenv
 
@@ -19,6 +21,13 @@ db = client[DB_NAME]
 # Collections
 users_collection = db["users"]
 interviews_collection = db["interviews"]
+resume_cache_collection = db["resume_cache"]  # keyed by sha256 of the uploaded PDF
+
+# Emails are matched case-insensitively: older sign-ups stored them as typed
+EMAIL_COLLATION = Collation(locale="en", strength=2)
+
+# Stored answer audio / confidence feature frames (see backend/answer_store.py)
+answer_artifacts_fs = gridfs.GridFS(db, collection="answer_artifacts")
 
 def get_db():
     return db
\ No newline at end of file
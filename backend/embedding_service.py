@@ -0,0 +1,73 @@
+# backend/embedding_service.py
+#
+# One sentence-transformer per process, shared by every interview session.
+# The model loads on first use, not at import or /api/setup time, and encode
+# requests from concurrent sessions are micro-batched into one forward pass.
+
+import os
+import threading
+import time
+
+import numpy as np
+
+from backend import metrics
+from backend.batching import MicroBatcher
+
+EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2")
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", 32))
+EMBEDDING_BATCH_WAIT_MS = float(os.getenv("EMBEDDING_BATCH_WAIT_MS", 5))
+
+
+class EmbeddingService:
+    def __init__(self, model_name=EMBEDDING_MODEL, max_batch_size=EMBEDDING_BATCH_SIZE, max_wait_ms=EMBEDDING_BATCH_WAIT_MS):
+        self.model_name = model_name
+        self._model = None
+        self._load_lock = threading.Lock()
+        self._batcher = MicroBatcher(self._encode_batch, name="embeddings", max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+
+    @property
+    def model(self):
+        if self._model is None:
+            with self._load_lock:
+                if self._model is None:
+                    self._model = self._load()
+        return self._model
+
+    def _load(self):
+        from sentence_transformers import SentenceTransformer
+
+        started = time.perf_counter()
+        model = SentenceTransformer(self.model_name, device="cpu")
+        metrics.set_gauge("embeddings.load_s", round(time.perf_counter() - started, 3))
+        metrics.set_gauge("embeddings.model_bytes", sum(p.numel() * p.element_size() for p in model.parameters()))
+        print(f"✅ Loaded embedding model {self.model_name}")
+        return model
+
+    def _encode_batch(self, texts):
+        vectors = self.model.encode(texts, batch_size=len(texts), normalize_embeddings=True, convert_to_numpy=True)
+        metrics.inc("embeddings.encoded", len(texts))
+        return list(vectors.astype(np.float32))
+
+    @property
+    def dimension(self):
+        return self.model.get_sentence_embedding_dimension()
+
+    def embed(self, text):
+        """Unit-norm float32 vector for one text; batched with concurrent callers."""
+        return self._batcher(text)
+
+    def embed_many(self, texts):
+        futures = [self._batcher.submit(text) for text in texts]
+        return np.stack([f.result() for f in futures]) if futures else np.zeros((0, self.dimension), np.float32)
+
+
+_services = {}
+_services_lock = threading.Lock()
+
+
+def get_embedding_service(model_name=EMBEDDING_MODEL):
+    """Process-wide service per model name; cheap to call, nothing loads until the first encode."""
+    with _services_lock:
+        if model_name not in _services:
+            _services[model_name] = EmbeddingService(model_name)
+        return _services[model_name]
@@ -0,0 +1,126 @@
+# backend/executor.py
+
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from backend import metrics
+
+CPU_COUNT = os.cpu_count() or 2
+
+# Pool sizes are bounded so a burst of answers queues instead of oversubscribing the box
+POOL_SIZES = {
+    "decode": int(os.getenv("DECODE_WORKERS", CPU_COUNT)),             # ffmpeg subprocesses
+    "stt": int(os.getenv("STT_WORKERS", max(1, CPU_COUNT // 2))),      # Whisper (torch releases the GIL)
+    "audio": int(os.getenv("AUDIO_WORKERS", CPU_COUNT)),               # confidence feature extraction
+    "llm": int(os.getenv("LLM_WORKERS", 16)),                          # blocking Groq round-trips
+    "store": int(os.getenv("STORE_WORKERS", 8)),                       # session store and MongoDB round-trips
+    "resume": int(os.getenv("RESUME_PARSE_WORKERS", 8)),               # resume chunk parses, shared by every upload
+}
+PROCESS_POOLS = {"audio"}
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def _timed_call(fn, args, kwargs):
+    # Runs inside the worker (thread or process); wall clock so it is comparable across processes
+    started = time.time()
+    result = fn(*args, **kwargs)
+    return result, started, time.time()
+
+
+def get_pool(name):
+    """Create pools lazily so importing this module never spawns workers."""
+    with _pools_lock:
+        pool = _pools.get(name)
+        if pool is None:
+            workers = POOL_SIZES[name]
+            if name in PROCESS_POOLS:
+                # spawn: forking a process that already holds torch threads can deadlock
+                pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            else:
+                pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"{name}-pool")
+            _pools[name] = pool
+        return pool
+
+
+async def run_in_pool(name, fn, *args, **kwargs):
+    """
+    Run a blocking callable on the named pool without blocking the event loop.
+    Records queue depth, queue wait and run time for the pool.
+    """
+    pool = get_pool(name)
+    loop = asyncio.get_running_loop()
+    submitted = time.time()
+
+    metrics.add_gauge(f"pool.{name}.in_flight", 1)
+    try:
+        result, started, finished = await loop.run_in_executor(pool, _timed_call, fn, args, kwargs)
+    except Exception:
+        metrics.inc(f"pool.{name}.errors")
+        raise
+    finally:
+        metrics.add_gauge(f"pool.{name}.in_flight", -1)
+
+    metrics.inc(f"pool.{name}.completed")
+    metrics.observe(f"pool.{name}.queue_wait_s", max(0.0, started - submitted))
+    metrics.observe(f"pool.{name}.run_s", finished - started)
+    return result
+
+
+async def stream_in_pool(name, gen_fn, *args, **kwargs):
+    """
+    Drive a blocking generator on the named pool and yield its items on the
+    event loop as they are produced. Stopping early closes the generator.
+    """
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+    stopped = threading.Event()
+    done = object()
+
+    def produce():
+        gen = gen_fn(*args, **kwargs)
+        try:
+            for item in gen:
+                if stopped.is_set():
+                    break
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+        finally:
+            gen.close()
+            loop.call_soon_threadsafe(queue.put_nowait, done)
+
+    producer = asyncio.ensure_future(run_in_pool(name, produce))
+    try:
+        while True:
+            item = await queue.get()
+            if item is done:
+                break
+            yield item
+        await producer  # surfaces exceptions raised by the generator
+    finally:
+        stopped.set()
+
+
+def pool_stats():
+    """Queue depth per pool: anything in flight beyond the worker count is waiting."""
+    gauges = metrics.snapshot()["gauges"]
+    stats = {}
+    for name, workers in POOL_SIZES.items():
+        in_flight = gauges.get(f"pool.{name}.in_flight", 0)
+        stats[name] = {
+            "workers": workers,
+            "in_flight": in_flight,
+            "queue_depth": max(0, in_flight - workers),
+        }
+    return stats
+
+
+def shutdown_pools():
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.shutdown(wait=False, cancel_futures=True)
+        _pools.clear()
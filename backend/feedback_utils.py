@@ -2,6 +2,7 @@ from langchain_ollama import OllamaLLM
 from langchain_core.prompts import PromptTemplate
 import json
 from backend.llm_groq_config import llm , code_llm
+# The zeroed fallbacks below carry an "error" key so callers know not to store them
 # You can tune these as needed
 #llm = OllamaLLM(model='mistral', temperature=0.7)
 #code_llm = OllamaLLM(model='codellama')
@@ -32,7 +33,7 @@ Categories:
 
 Respond **only** with a well-formatted JSON object like this:
 
-{
+{{
   "relevance": 85,
   "clarity": 78,
   "depth": 70,
@@ -40,7 +41,7 @@ Respond **only** with a well-formatted JSON object like this:
   "communication": 82,
   "overall": 80,
   "summary": "Your answers were clear and relevant with strong communication, though real-world depth could be improved."
-}
+}}
 
 """
     )
@@ -59,11 +60,68 @@ Respond **only** with a well-formatted JSON object like this:
             "examples": 0,
             "communication": 0,
             "overall": 0,
-            "summary": "Feedback generation failed. Please retry or check LLM response."
+            "summary": "Feedback generation failed. Please retry or check LLM response.",
+            "error": "unparseable_response",
         }
 
     return feedback
 
+def generate_technical_feedback(history):
+    transcript = "\n".join(
+        [f"Q: {item['question']}\nA: {item['answer']}" for item in history if item['answer']]
+    )
+
+    prompt = PromptTemplate(
+        input_variables=["transcript"],
+        template="""
+You are a senior technical interviewer. Evaluate the following technical interview transcript:
+
+{transcript}
+
+Based on the candidate's responses, score them across the following categories — each **out of 100**, where:
+- 0 = extremely poor
+- 100 = exceptional
+
+Categories:
+- Technical accuracy
+- Depth of understanding
+- Problem-solving approach
+- Clarity of explanation
+- Communication & confidence
+- Overall impression
+
+Respond **only** with a well-formatted JSON object like this:
+
+{{
+  "accuracy": 80,
+  "depth": 72,
+  "problem_solving": 75,
+  "clarity": 78,
+  "communication": 82,
+  "overall": 77,
+  "summary": "You explained core concepts correctly and clearly, but deeper trade-offs and edge cases need more attention."
+}}
+
+"""
+    )
+
+    chain = prompt | llm
+    raw_output = chain.invoke({"transcript": transcript}).content
+
+    try:
+        return json.loads(raw_output)
+    except Exception:
+        return {
+            "accuracy": 0,
+            "depth": 0,
+            "problem_solving": 0,
+            "clarity": 0,
+            "communication": 0,
+            "overall": 0,
+            "summary": "Feedback generation failed. Please retry or check LLM response.",
+            "error": "unparseable_response",
+        }
+
 def generate_coding_feedback(history):
     # Take last submitted solution
     latest = history[-1] if history else {}
@@ -122,5 +180,6 @@ Respond only with a JSON object like:
             "edge_cases": 0,
             "efficiency": 0,
             "overall": 0,
-            "summary": "Feedback generation failed. Please retry or check the submitted code."
+            "summary": "Feedback generation failed. Please retry or check the submitted code.",
+            "error": "unparseable_response",
         }
@@ -2,6 +2,10 @@
 
 from langchain_core.prompts import ChatPromptTemplate
 from backend.llm_groq_config import llm
+from backend.llm_cache import cached
+
+# Only empty answers are cached: with nothing to react to, the prompt repeats exactly
+empty_answer_llm = cached(llm, site="empty_answer")
 
 hr_question_prompt = ChatPromptTemplate.from_template("""
 You are an HR interviewer for the role of {role}.
@@ -27,8 +31,12 @@ Rules:
 - Natural, professional tone
 """)
 
+def _question_llm(last_answer):
+    return empty_answer_llm if not (last_answer or "").strip() else llm
+
+
 def generate_hr_question(role, prev_question, last_answer, decision):
-    return llm.invoke(
+    return _question_llm(last_answer).invoke(
         hr_question_prompt.format(
             role=role,
             prev_question=prev_question,
@@ -36,3 +44,16 @@ def generate_hr_question(role, prev_question, last_answer, decision):
             decision=decision
         )
     ).content
+
+
+def stream_hr_question(role, prev_question, last_answer, decision):
+    """Yield the question text chunk by chunk as Groq produces it."""
+    prompt = hr_question_prompt.format(
+        role=role,
+        prev_question=prev_question,
+        last_answer=last_answer,
+        decision=decision
+    )
+    for chunk in _question_llm(last_answer).stream(prompt):
+        if chunk.content:
+            yield chunk.content
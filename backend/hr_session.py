@@ -1,8 +1,10 @@
 # backend/hr_session.py
 
-from backend.hr_interview_chain import generate_hr_question
-from backend.controller_chain import get_controller_decision
+from backend.hr_interview_chain import generate_hr_question, stream_hr_question
+from backend.controller_chain import CONTROLLER_BACKEND, get_controller_decision
 from backend.feedback_utils import generate_hr_feedback
+from backend.combined_turn_chain import TURN_MODE, decide_and_generate_hr
+from backend.speculation import use_draft
 
 class HRInterviewSession:
     def __init__(self, role, session_id, rounds=5):
@@ -17,7 +19,37 @@ class HRInterviewSession:
             "answer": None
         }]
 
-    def ask_question(self):
+    def _plan_next(self, answer):
+        """Controller decision + next question for `answer` to the last question. Does not touch history."""
+        # Use previous question + answer for controller logic
+        prev_question = self.history[-1]["question"]
+
+        # Single structured call when enabled; the two-stage path below is the fallback.
+        # A local controller backend already makes the decision cheap, so it always goes two-stage.
+        if TURN_MODE == "combined" and CONTROLLER_BACKEND == "llm":
+            plan = decide_and_generate_hr(self.role, prev_question, answer)
+            if plan:
+                return plan
+
+        decision = get_controller_decision(prev_question, answer)
+
+        # Generate next HR question
+        question = generate_hr_question(
+            role=self.role,
+            prev_question=prev_question,
+            last_answer=answer,
+            decision=decision
+        )
+
+        return {"decision": decision, "question": question}
+
+    def draft_next_question(self, partial_answer):
+        """Speculatively plan the next turn from a partial transcript."""
+        if self.current_round == 0 or self.current_round >= self.rounds:
+            return None
+        return {**self._plan_next(partial_answer), "answer": partial_answer, "round": self.current_round}
+
+    def ask_question(self, draft=None):
         """Return the next HR question."""
 
         if self.current_round >= self.rounds:
@@ -28,24 +60,46 @@ class HRInterviewSession:
             self.current_round += 1
             return self.history[0]["question"]
 
-        # Use previous question + answer for controller logic
-        prev_question = self.history[-1]["question"]
         prev_answer = self.history[-1]["answer"]
+        if use_draft(draft, prev_answer, self.current_round):
+            plan = draft
+        else:
+            plan = self._plan_next(prev_answer)
 
-        decision = get_controller_decision(prev_question, prev_answer)
-
-        # Generate next HR question
-        question = generate_hr_question(
-            role=self.role,
-            prev_question=prev_question,
-            last_answer=prev_answer,
-            decision=decision
-        )
-
+        question = plan["question"]
         self.history.append({"question": question, "answer": None})
         self.current_round += 1
         return question
 
+    def stream_question(self, answer):
+        """Same turn as provide_answer(answer) + ask_question, yielding tokens; the caller records both with commit_turn."""
+        if self.current_round >= self.rounds:
+            return
+
+        if self.current_round == 0:
+            yield self.history[0]["question"]
+            return
+
+        # The combined call returns the question in one piece, so it is planned exactly like ask_question
+        if TURN_MODE == "combined" and CONTROLLER_BACKEND == "llm":
+            yield self._plan_next(answer)["question"]
+            return
+
+        prev_question = self.history[-1]["question"]
+        decision = get_controller_decision(prev_question, answer)
+
+        yield from stream_hr_question(self.role, prev_question, answer, decision)
+
+    def commit_turn(self, answer, question):
+        """Record the answer (unless None) and the streamed question (unless None), and advance the round."""
+        if answer is not None:
+            self.provide_answer(answer)
+        if question is None:
+            return
+        if self.current_round > 0:
+            self.history.append({"question": question, "answer": None})
+        self.current_round += 1
+
     def provide_answer(self, answer):
         """Store answer."""
         if self.history:
@@ -53,3 +107,23 @@ class HRInterviewSession:
 
     def generate_feedback(self):
         return generate_hr_feedback(self.history)
+
+    def to_dict(self):
+        """Plain-data snapshot used by the session store."""
+        return {
+            "kind": "hr",
+            "role": self.role,
+            "session_id": self.session_id,
+            "rounds": self.rounds,
+            "current_round": self.current_round,
+            "history": self.history,
+            "meta": getattr(self, "meta", None) or {},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        session = cls(role=data["role"], session_id=data["session_id"], rounds=data["rounds"])
+        session.current_round = data["current_round"]
+        session.history = data["history"]
+        session.meta = data.get("meta", {})
+        return session
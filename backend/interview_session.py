@@ -1,9 +1,20 @@
 # interviewsession.py
 
 import json
-from backend.vector_memory import VectorMemory
+from collections import Counter, deque
+from backend import metrics
+from backend.vector_memory import VectorMemory, extract_keywords
 from backend.controller_chain import get_tech_controller_decision
-from backend.memory_interview_chain import generate_technical_question
+from backend.memory_interview_chain import generate_technical_question, stream_technical_question
+from backend.combined_turn_chain import TURN_MODE, decide_and_generate_technical
+from backend.speculation import use_draft
+from backend.feedback_utils import generate_technical_feedback
+
+# Questions whose keywords count as "recently covered"
+RECENT_TOPIC_WINDOW = 5
+
+# Yielded by stream_question when the question streamed so far is discarded; the replacement follows
+RESTART_QUESTION = object()
 
 class InterviewSession:
     def __init__(self, resume_path=None, resume_obj=None, role='', rounds=3, session_id='default_user'):
@@ -23,25 +34,99 @@ class InterviewSession:
         self.session_id = session_id
         self.vector_memory = VectorMemory()
 
-        self.history = [{
-            'question': "Can you briefly describe one technical project from your resume and the technologies you used?",
-            'answer': None
-        }]
+        self.history = []
+        self._reset_topic_window()
+        self._append_question("Can you briefly describe one technical project from your resume and the technologies you used?")
+
+    def _reset_topic_window(self):
+        # Keyword tuples of the last RECENT_TOPIC_WINDOW questions, plus how often each keyword occurs in them
+        self._topic_window = deque()
+        self._topic_counts = Counter()
+
+    def _push_topics(self, keywords):
+        if len(self._topic_window) == RECENT_TOPIC_WINDOW:
+            for keyword in self._topic_window.popleft():
+                self._topic_counts[keyword] -= 1
+                if not self._topic_counts[keyword]:
+                    del self._topic_counts[keyword]
+        self._topic_window.append(keywords)
+        self._topic_counts.update(keywords)
+
+    def _append_question(self, question):
+        """Add a question to history with its keywords computed once (top 3 per question)."""
+        keywords = list(extract_keywords(question)[:3])
+        self.history.append({'question': question, 'answer': None, 'keywords': keywords})
+        self._push_topics(keywords)
+
+    def _extract_recent_topics(self):
+        """
+        Keywords of the last RECENT_TOPIC_WINDOW questions, most frequent first,
+        ties broken by recency. Bounded by the window size, not the interview length.
+        """
+        by_recency = []
+        for keywords in reversed(self._topic_window):
+            for keyword in keywords:
+                if keyword not in by_recency:
+                    by_recency.append(keyword)
+        return sorted(by_recency, key=lambda keyword: -self._topic_counts[keyword])
+
+    def _turn_context(self, answer):
+        """Inputs shared by the controller and the question generator."""
+        return {
+            'prev_question': self.history[-1]['question'],
+            'candidate_answer': answer or "",
+            'role': self.role,
+            'resume_excerpt': self.resume_str[:1500],
+            'recent_topics': self._extract_recent_topics(),  # topic repetition avoidance
+        }
+
+    def _plan_next(self, answer):
+        """Controller decision + next question for `answer` to the last question. Does not touch history."""
+        context = self._turn_context(answer)
+
+        # Single structured call when enabled; the two-stage path below is the fallback
+        if TURN_MODE == "combined":
+            plan = decide_and_generate_technical(**context)
+            if plan:
+                return plan
 
-    def _extract_recent_topics(self, limit=5):
+        # Stage 1: Controller decides action
+        decision = get_tech_controller_decision(**context)
+
+        # Stage 2: Generator produces the actual next question
+        next_q = generate_technical_question(decision=decision, **context)
+
+        return {'decision': decision, 'question': next_q}
+
+    def _plan_next_varied(self, answer):
+        """_plan_next, but a question that repeats an earlier one is regenerated once as a topic transition."""
+        plan = self._plan_next(answer)
+        if self._repeats_topic(plan['question']):
+            metrics.inc("topics.duplicate_rejected")
+            context = self._turn_context(answer)
+            plan = {
+                'decision': 'topic_transition',
+                'question': generate_technical_question(decision='topic_transition', **context),
+            }
+        return plan
+
+    def _repeats_topic(self, question):
+        """Topic dedup against every question asked so far, including the one whose answer is not recorded yet."""
+        answering = self.history[-1]['question']
+        pairs = self.vector_memory.qa_pairs
+        pending = () if pairs and pairs[-1]['question'] == answering else (answering,)
+        return self.vector_memory.is_duplicate_topic(question, pending=pending)
+
+    def draft_next_question(self, partial_answer):
         """
-        Extract topic keywords from last 'limit' questions using VectorMemory._extract_keywords.
+        Speculatively plan the next turn from a partial transcript while the
+        candidate is still speaking. Returns None when there is nothing to plan.
         """
-        recent = []
-        for entry in self.history[-limit:]:
-            q = entry.get("question", "")
-            if q:
-                keywords = list(self.vector_memory._extract_keywords(q))
-                if keywords:
-                    recent.extend(keywords[:3])  # take top 3 keywords per question
-        return list(set(recent))  # dedupe
-
-    def ask_question(self):
+        if self.current_round == 0 or self.current_round >= self.rounds:
+            return None
+        return {**self._plan_next_varied(partial_answer), 'answer': partial_answer, 'round': self.current_round}
+
+    def ask_question(self, draft=None):
         if self.current_round >= self.rounds:
             return None
 
@@ -50,38 +135,67 @@ class InterviewSession:
             self.current_round += 1
             return self.history[0]['question']
 
-        # Previous Q/A
-        prev_question = self.history[-1]['question']
+        # Reuse the speculative draft if the final answer did not change its meaning
         prev_answer = self.history[-1]['answer'] or ""
+        if use_draft(draft, prev_answer, self.current_round):
+            plan = draft
+        else:
+            plan = self._plan_next_varied(prev_answer)
+
+        next_q = plan['question']
+        self._append_question(next_q)
+        self.current_round += 1
+        return next_q
+
+    def stream_question(self, answer):
+        """
+        Same turn as provide_answer(answer) + ask_question, but yields the next
+        question token by token as the generator produces it. The session is
+        not changed here: the caller passes the answer and the full question to
+        commit_turn once every token has been delivered, so an abandoned stream
+        leaves the session as it was. A streamed question that repeats an
+        earlier topic is discarded: RESTART_QUESTION is yielded, then its replacement.
+        """
+        if self.current_round >= self.rounds:
+            return
 
-        # Extract resume excerpt
-        resume_excerpt = self.resume_str[:1500]
+        if self.current_round == 0:
+            yield self.history[0]['question']
+            return
 
-        # Topic repetition avoidance
-        recent_topics = self._extract_recent_topics()
+        # The combined call returns the question in one piece, so it is planned exactly like ask_question
+        if TURN_MODE == "combined":
+            yield self._plan_next_varied(answer)['question']
+            return
 
-        # Stage 1: Controller decides action
-        decision = get_tech_controller_decision(
-            prev_question=prev_question,
-            candidate_answer=prev_answer,
-            role=self.role,
-            resume_excerpt=resume_excerpt,
-            recent_topics=recent_topics
-        )
+        context = self._turn_context(answer)
 
-        # Stage 2: Generator produces the actual next question
-        next_q = generate_technical_question(
-            role=self.role,
-            decision=decision,
-            prev_question=prev_question,
-            candidate_answer=prev_answer,
-            resume_excerpt=resume_excerpt,
-            recent_topics=recent_topics
-        )
-
-        self.history.append({'question': next_q, 'answer': None})
+        # The label has to be known before the first question token
+        decision = get_tech_controller_decision(**context)
+
+        parts = []
+        for token in stream_technical_question(decision=decision, **context):
+            parts.append(token)
+            yield token
+
+        if self._repeats_topic("".join(parts)):
+            metrics.inc("topics.duplicate_rejected")
+            yield RESTART_QUESTION
+            yield generate_technical_question(decision='topic_transition', **context)
+
+    def commit_turn(self, answer, question):
+        """
+        Record the answer and the question produced by stream_question, and advance
+        the round. `answer` is None when there was nothing to record, `question`
+        is None when the round has no questions left.
+        """
+        if answer is not None:
+            self.provide_answer(answer)
+        if question is None:
+            return
+        if self.current_round > 0:
+            self._append_question(question)
         self.current_round += 1
-        return next_q
 
     def provide_answer(self, answer):
         if self.history:
@@ -92,5 +206,40 @@ class InterviewSession:
     def is_complete(self):
         return self.current_round >= self.rounds
 
+    def generate_feedback(self):
+        return generate_technical_feedback(self.history)
+
     def summary(self):
         return self.history
+
+    def to_dict(self):
+        """Plain-data snapshot used by the session store."""
+        return {
+            'kind': 'technical',
+            'resume': self.resume,
+            'role': self.role,
+            'rounds': self.rounds,
+            'current_round': self.current_round,
+            'session_id': self.session_id,
+            'history': self.history,
+            'meta': getattr(self, 'meta', None) or {},
+            'vector_memory': self.vector_memory.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        # Skip __init__ so the vector memory is restored instead of rebuilt
+        session = cls.__new__(cls)
+        session.resume = data['resume']
+        session.resume_str = json.dumps(session.resume)
+        session.role = data['role']
+        session.rounds = data['rounds']
+        session.session_id = data['session_id']
+        session.current_round = data['current_round']
+        session.history = data['history']
+        session._reset_topic_window()
+        for entry in session.history[-RECENT_TOPIC_WINDOW:]:
+            session._push_topics(entry.get('keywords') or list(extract_keywords(entry['question'])[:3]))
+        session.meta = data.get('meta', {})
+        session.vector_memory = VectorMemory.from_dict(data['vector_memory'])
+        return session
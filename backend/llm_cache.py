@@ -0,0 +1,239 @@
+# backend/llm_cache.py
+#
+# Response cache for exact-repeat LLM prompts. Call sites opt in by wrapping
+# their LLM with cached(llm, site=...); everything else keeps calling Groq.
+# Keys combine the site, model, sampling params and a hash of the normalized
+# prompt. Entries live in an in-process LRU, optionally backed by SQLite so
+# they survive restarts and are shared by workers on the same host.
+
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from backend import metrics
+
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "1") == "1"
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", 2048))
+LLM_CACHE_SQLITE_PATH = os.getenv("LLM_CACHE_SQLITE_PATH", "")
+LLM_CACHE_TTL_SECONDS = float(os.getenv("LLM_CACHE_TTL_SECONDS", 86400))
+
+SAMPLING_PARAMS = ("temperature", "top_p", "max_tokens", "stop", "n", "seed", "model_kwargs")
+
+_MISSING = object()
+
+
+class LLMCacheStore:
+    """LRU of key → (value, expires_at) with an optional SQLite tier underneath."""
+
+    def __init__(self, max_entries=LLM_CACHE_MAX_ENTRIES, sqlite_path=LLM_CACHE_SQLITE_PATH, clock=time.time):
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if sqlite_path:
+            self._db = sqlite3.connect(sqlite_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, value BLOB, expires_at REAL)"
+            )
+            self._db.commit()
+
+    def get(self, key):
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    return value
+                del self._entries[key]
+
+            if self._db is None:
+                return _MISSING
+            row = self._db.execute("SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return _MISSING
+            if row[1] <= now:
+                self._db.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._db.commit()
+                return _MISSING
+
+            value = pickle.loads(row[0])
+            self._remember(key, value, row[1])
+            return value
+
+    def put(self, key, value, ttl):
+        expires_at = self.clock() + ttl
+        with self._lock:
+            self._remember(key, value, expires_at)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, pickle.dumps(value), expires_at),
+                )
+                self._db.commit()
+
+    def _remember(self, key, value, expires_at):
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM llm_cache")
+                self._db.commit()
+
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+
+def get_cache_store():
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = LLMCacheStore()
+        return _default_store
+
+
+_site_counts = {}
+_site_counts_lock = threading.Lock()
+
+
+def _record(site, hit):
+    metrics.inc(f"llm_cache.{site}.{'hits' if hit else 'misses'}")
+    with _site_counts_lock:
+        hits, total = _site_counts.get(site, (0, 0))
+        hits, total = hits + hit, total + 1
+        _site_counts[site] = (hits, total)
+    metrics.set_gauge(f"llm_cache.{site}.hit_rate", round(hits / total, 3))
+
+
+def cache_stats():
+    """Per-site hits, misses and hit rate since startup."""
+    with _site_counts_lock:
+        return {
+            site: {"hits": hits, "misses": total - hits, "hit_rate": round(hits / total, 3)}
+            for site, (hits, total) in _site_counts.items()
+        }
+
+
+def _normalize(text):
+    return " ".join(str(text).split())
+
+
+def normalize_prompt(prompt):
+    """Canonical JSON-able form of a string, PromptValue, message list or chain input dict."""
+    if hasattr(prompt, "to_messages"):
+        prompt = prompt.to_messages()
+    if isinstance(prompt, str):
+        return _normalize(prompt)
+    if isinstance(prompt, dict):
+        return {k: normalize_prompt(v) for k, v in sorted(prompt.items())}
+    if isinstance(prompt, (list, tuple)):
+        return [normalize_prompt(m) for m in prompt]
+    if hasattr(prompt, "content"):
+        return [getattr(prompt, "type", "message"), _normalize(prompt.content)]
+    return _normalize(prompt)
+
+
+def _model_name(llm):
+    return getattr(llm, "model_name", None) or getattr(llm, "model", None) or type(llm).__name__
+
+
+def _sampling_params(llm):
+    return {p: getattr(llm, p) for p in SAMPLING_PARAMS if getattr(llm, p, None) is not None}
+
+
+def cache_key(site, model, params, prompt):
+    prompt_hash = hashlib.sha256(
+        json.dumps(normalize_prompt(prompt), sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+    return json.dumps([site, model, params, prompt_hash], sort_keys=True, default=str)
+
+
+class CachedLLM:
+    """
+    Wraps an LLM (or any runnable with invoke/ainvoke/stream) for one call
+    site. `key_llm` supplies the model name and sampling params when the
+    wrapped object is a derived runnable such as with_structured_output().
+    Results failing `validate` are returned but not stored. Anything other
+    than invoke/ainvoke/stream passes straight through to the wrapped LLM.
+    """
+
+    def __init__(self, llm, site, ttl=None, key_llm=None, validate=None, store=None):
+        self.llm = llm
+        self.site = site
+        self.ttl = LLM_CACHE_TTL_SECONDS if ttl is None else ttl
+        self.validate = validate
+        self._store = store
+        key_llm = key_llm or llm
+        self.model = _model_name(key_llm)
+        self.params = _sampling_params(key_llm)
+
+    @property
+    def store(self):
+        return self._store or get_cache_store()
+
+    def _key(self, prompt, kwargs):
+        return cache_key(self.site, self.model, {**self.params, **kwargs}, prompt)
+
+    def _lookup(self, key):
+        if not LLM_CACHE_ENABLED:
+            return _MISSING
+        value = self.store.get(key)
+        _record(self.site, value is not _MISSING)
+        return value
+
+    def _save(self, key, value):
+        if LLM_CACHE_ENABLED and (self.validate is None or self.validate(value)):
+            self.store.put(key, value, self.ttl)
+
+    def invoke(self, prompt, **kwargs):
+        key = self._key(prompt, kwargs)
+        value = self._lookup(key)
+        if value is _MISSING:
+            value = self.llm.invoke(prompt, **kwargs)
+            self._save(key, value)
+        return value
+
+    async def ainvoke(self, prompt, **kwargs):
+        key = self._key(prompt, kwargs)
+        value = self._lookup(key)
+        if value is _MISSING:
+            value = await self.llm.ainvoke(prompt, **kwargs)
+            self._save(key, value)
+        return value
+
+    def stream(self, prompt, **kwargs):
+        """A hit is yielded as one chunk; a miss streams normally and stores the joined chunks."""
+        key = self._key(prompt, kwargs)
+        value = self._lookup(key)
+        if value is not _MISSING:
+            yield value
+            return
+
+        total = None
+        for chunk in self.llm.stream(prompt, **kwargs):
+            total = chunk if total is None else total + chunk
+            yield chunk
+        if total is not None:
+            self._save(key, total)
+
+    def __getattr__(self, name):
+        if name == "llm":
+            raise AttributeError(name)
+        return getattr(self.llm, name)
+
+
+def cached(llm, site, ttl=None, key_llm=None, validate=None):
+    return CachedLLM(llm, site, ttl=ttl, key_llm=key_llm, validate=validate)
@@ -2,13 +2,16 @@
 
 import json
 
-from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
-from langchain_core.runnables.history import RunnableWithMessageHistory
-from langchain_community.chat_message_histories import ChatMessageHistory
-# backend/technical_question_chain.py
-
 from langchain_core.prompts import ChatPromptTemplate
 from backend.llm_groq_config import llm
+from backend.llm_cache import cached
+
+# Only empty answers are cached: with nothing to react to, the prompt repeats exactly
+empty_answer_llm = cached(llm, site="empty_answer")
+
+
+def _question_llm(candidate_answer):
+    return empty_answer_llm if not (candidate_answer or "").strip() else llm
 
 _question_prompt = ChatPromptTemplate.from_template("""
 You are an interviewer generating the next technical question for the candidate.
@@ -47,13 +50,13 @@ Rules per decision:
 Output ONLY the question. No explanations, no multiple questions.
 """)
 
-def generate_technical_question(role,
-                                decision,
-                                prev_question,
-                                candidate_answer,
-                                resume_excerpt,
-                                recent_topics):
-    prompt = _question_prompt.format(
+def _question_prompt_text(role,
+                          decision,
+                          prev_question,
+                          candidate_answer,
+                          resume_excerpt,
+                          recent_topics):
+    return _question_prompt.format(
         role=role or "general",
         decision=decision,
         prev_question=prev_question or "",
@@ -62,18 +65,30 @@ def generate_technical_question(role,
         recent_topics=", ".join(recent_topics) if recent_topics else "none"
     )
 
-    resp = llm.invoke(prompt).content.strip()
+
+def generate_technical_question(role,
+                                decision,
+                                prev_question,
+                                candidate_answer,
+                                resume_excerpt,
+                                recent_topics):
+    prompt = _question_prompt_text(role, decision, prev_question, candidate_answer, resume_excerpt, recent_topics)
+
+    resp = _question_llm(candidate_answer).invoke(prompt).content.strip()
     
     # return only the first question-like sentence if model misbehaves
     return resp
 
 
+def stream_technical_question(role,
+                              decision,
+                              prev_question,
+                              candidate_answer,
+                              resume_excerpt,
+                              recent_topics):
+    """Yield the question text chunk by chunk as Groq produces it."""
+    prompt = _question_prompt_text(role, decision, prev_question, candidate_answer, resume_excerpt, recent_topics)
 
-# Memory session store
-session_store = {}
-
-def get_session_history(session_id):
-    if session_id not in session_store:
-        session_store[session_id] = ChatMessageHistory()
-    return session_store[session_id]
-
+    for chunk in _question_llm(candidate_answer).stream(prompt):
+        if chunk.content:
+            yield chunk.content
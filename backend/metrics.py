@@ -0,0 +1,61 @@
+# backend/metrics.py
+
+import threading
+from collections import defaultdict, deque
+
+import numpy as np
+
+# Keep only the most recent samples per histogram so memory stays bounded
+HISTOGRAM_WINDOW = 2048
+
+_lock = threading.Lock()
+_counters = defaultdict(float)
+_gauges = {}
+_histograms = defaultdict(lambda: deque(maxlen=HISTOGRAM_WINDOW))
+
+
+def inc(name, value=1):
+    with _lock:
+        _counters[name] += value
+
+
+def add_gauge(name, delta):
+    with _lock:
+        _gauges[name] = _gauges.get(name, 0) + delta
+
+
+def set_gauge(name, value):
+    with _lock:
+        _gauges[name] = value
+
+
+def observe(name, value):
+    with _lock:
+        _histograms[name].append(value)
+
+
+def _summarize(samples):
+    if not samples:
+        return {"count": 0}
+    arr = np.asarray(samples, dtype=np.float64)
+    return {
+        "count": int(arr.size),
+        "mean": round(float(arr.mean()), 4),
+        "p50": round(float(np.percentile(arr, 50)), 4),
+        "p95": round(float(np.percentile(arr, 95)), 4),
+        "max": round(float(arr.max()), 4),
+    }
+
+
+def snapshot():
+    """Return a JSON-serializable view of every counter, gauge and histogram."""
+    with _lock:
+        counters = dict(_counters)
+        gauges = dict(_gauges)
+        histograms = {name: list(samples) for name, samples in _histograms.items()}
+
+    return {
+        "counters": counters,
+        "gauges": gauges,
+        "histograms": {name: _summarize(samples) for name, samples in histograms.items()},
+    }
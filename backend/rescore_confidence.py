@@ -0,0 +1,112 @@
+# backend/rescore_confidence.py
+"""
+Re-score stored interviews with the current confidence scorer.
+
+Interviews saved while STORE_ANSWER_AUDIO was set carry `answer_artifacts`
+(GridFS ids of answer audio or feature frames). Each interview is re-scored
+in a worker process; answers without a stored artifact keep their original
+score. The new average_confidence values are written with bulk updates.
+
+Usage:
+    python -m backend.rescore_confidence --dry-run
+    python -m backend.rescore_confidence --since 2026-01-01 --workers 8
+"""
+
+import argparse
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+import numpy as np
+from bson import ObjectId
+from pymongo import UpdateOne
+
+from backend.database import interviews_collection
+
+
+def _rescore_interview(interview_id, artifacts):
+    """Runs in a worker process with its own Mongo client."""
+    from backend.answer_store import score_artifact
+    from backend.database import answer_artifacts_fs
+
+    scores, rescored = [], 0
+    for artifact in artifacts:
+        if not artifact:
+            continue
+        if artifact.get("file_id"):
+            try:
+                data = answer_artifacts_fs.get(ObjectId(artifact["file_id"])).read()
+                scores.append(score_artifact(artifact["kind"], data))
+                rescored += 1
+                continue
+            except Exception as e:
+                print(f"[Rescore Error] {interview_id} {artifact['file_id']}: {e}")
+        scores.append(artifact.get("confidence", 0.0))
+    return interview_id, scores, rescored
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--since", help="only interviews on or after this ISO date")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--batch-size", type=int, default=200, help="interviews per bulk_write")
+    parser.add_argument("--dry-run", action="store_true", help="report score changes without writing")
+    args = parser.parse_args()
+
+    # At least one stored artifact; on an array, "answer_artifacts.file_id": {"$ne": None} would instead
+    # drop every interview with a single answer whose upload failed
+    query = {"answer_artifacts": {"$elemMatch": {"file_id": {"$ne": None}}}}
+    if args.since:
+        query["date"] = {"$gte": args.since}
+    cursor = interviews_collection.find(query, {"answer_artifacts": 1, "average_confidence": 1})
+
+    started = time.perf_counter()
+    ops, deltas, answers, updated, failed = [], [], 0, 0, 0
+
+    def flush():
+        nonlocal updated
+        if ops and not args.dry_run:
+            interviews_collection.bulk_write(ops, ordered=False)
+        updated += len(ops)
+        ops.clear()
+
+    # Spawned workers open their own Mongo connections instead of inheriting this one
+    with ProcessPoolExecutor(max_workers=args.workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        previous, futures = {}, []
+        for doc in cursor:
+            previous[doc["_id"]] = doc.get("average_confidence", 0.0)
+            futures.append(pool.submit(_rescore_interview, doc["_id"], doc["answer_artifacts"]))
+
+        for future in as_completed(futures):
+            try:
+                interview_id, scores, rescored = future.result()
+            except Exception as e:
+                print(f"[Rescore Error] {e}")
+                failed += 1
+                continue
+
+            average = float(np.mean(scores)) if scores else 0.0
+            answers += rescored
+            deltas.append(average - previous[interview_id])
+            ops.append(UpdateOne(
+                {"_id": interview_id},
+                {"$set": {"average_confidence": average, "confidence_rescored_at": datetime.utcnow()}},
+            ))
+            if len(ops) >= args.batch_size:
+                flush()
+        flush()
+
+    elapsed = time.perf_counter() - started
+    print("\n" + "=" * 50)
+    print(f"✅ {'would update' if args.dry_run else 'updated'} {updated} interviews ({answers} answers re-scored) in {elapsed:.1f}s")
+    if failed:
+        print(f"❌ failed: {failed}")
+    if deltas:
+        deltas = np.asarray(deltas)
+        print(f"📊 average_confidence change: mean {deltas.mean():+.3f}, |max| {np.abs(deltas).max():.3f}")
+
+
+if __name__ == "__main__":
+    main()
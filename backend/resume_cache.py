@@ -0,0 +1,71 @@
+# backend/resume_cache.py
+#
+# Content-addressed resume parsing: the sha256 of the uploaded PDF keys the
+# extracted text and parsed JSON in Mongo, so re-uploading the same file is a
+# single lookup instead of PDF extraction plus up to three LLM calls.
+
+import hashlib
+from datetime import datetime
+
+from backend import metrics
+from backend.database import resume_cache_collection
+from backend.resume_parser import extract_sections_from_pdf, parse_resume_sections, sections_to_text
+
+# Bump when the parse prompt or output schema changes so older entries are re-parsed
+RESUME_PARSER_VERSION = 3
+
+
+def resume_digest(contents):
+    return hashlib.sha256(contents).hexdigest()
+
+
+def get_cached_entry(digest):
+    return resume_cache_collection.find_one({"_id": digest})
+
+
+def cached_parse(entry):
+    """The parsed resume from a cache entry, or None if missing or from an older parser."""
+    if entry and entry.get("version") == RESUME_PARSER_VERSION and entry.get("parsed"):
+        return entry["parsed"]
+    return None
+
+
+def store_parse(digest, sections, parsed):
+    try:
+        resume_cache_collection.update_one(
+            {"_id": digest},
+            {"$set": {
+                "text": sections_to_text(sections),
+                "sections": sections,
+                "parsed": parsed,
+                "version": RESUME_PARSER_VERSION,
+                "updatedAt": datetime.utcnow(),
+            }},
+            upsert=True,
+        )
+    except Exception as e:
+        print(f"[Resume Cache Error] {e}")
+
+
+def parse_resume_cached(contents):
+    """Parsed resume JSON for the PDF bytes, from cache when the same file was seen before."""
+    digest = resume_digest(contents)
+    entry = get_cached_entry(digest)
+
+    parsed = cached_parse(entry)
+    if parsed:
+        metrics.inc("resume_cache.hit")
+        return parsed
+    metrics.inc("resume_cache.miss")
+
+    # A stale entry still saves the PDF extraction
+    sections = entry.get("sections") if entry else None
+    if not sections:
+        sections = extract_sections_from_pdf(contents)
+        if not sections_to_text(sections):
+            return {"error": "Could not extract text from PDF"}
+
+    parsed = parse_resume_sections(sections)
+    if "error" not in parsed:
+        store_parse(digest, sections, parsed)
+    return parsed
@@ -1,19 +1,25 @@
 import fitz  # PyMuPDF
 import json
 import re
+from statistics import median
 from langchain_ollama import OllamaLLM
 from langchain_core.prompts import PromptTemplate
+from langchain_core.runnables import RunnableLambda
 from backend.llm_groq_config import llm
+from backend.llm_cache import cached
+from backend.executor import get_pool
 
 
 # Step 1: Extract text from PDF
-def extract_text_from_pdf(file_path):
+def extract_text_from_pdf(source):
     """
-    Extract text from PDF using PyMuPDF
+    Extract text from PDF using PyMuPDF. `source` is a file path or the raw
+    PDF bytes (read straight from memory, no temp file).
     """
     text = ""
     try:
-        with fitz.open(file_path) as pdf:
+        pdf = fitz.open(stream=source, filetype="pdf") if isinstance(source, (bytes, bytearray)) else fitz.open(source)
+        with pdf:
             for page in pdf:
                 text += page.get_text()
         return text.strip()
@@ -22,6 +28,67 @@ def extract_text_from_pdf(file_path):
         return ""
 
 
+# Step 1b: Split the PDF into sections using its heading layout
+SECTION_ALIASES = {
+    "education": {"education", "academic background", "academics", "qualifications", "educational qualifications"},
+    "experience": {"experience", "work experience", "professional experience", "employment", "employment history",
+                   "work history", "internships", "internship", "internship experience"},
+    "projects": {"projects", "personal projects", "academic projects", "key projects", "project experience"},
+    "skills": {"skills", "technical skills", "core skills", "key skills", "skills and tools", "technologies", "tech stack"},
+    # Recognized only so they end the previous section; not parsed on their own
+    "other": {"summary", "profile", "objective", "career objective", "about me", "certifications", "certificates",
+              "achievements", "awards", "honors", "interests", "hobbies", "languages", "activities",
+              "extracurricular activities", "publications", "positions of responsibility", "references", "contact"},
+}
+HEADING_LOOKUP = {alias: name for name, aliases in SECTION_ALIASES.items() for alias in aliases}
+
+
+def _heading_name(text):
+    key = re.sub(r"[^a-z ]", "", text.lower().replace("&", "and"))
+    return HEADING_LOOKUP.get(" ".join(key.split()))
+
+
+def extract_sections_from_pdf(source):
+    """
+    Ordered [section, text] pairs from the PDF's block layout. A short line
+    is a heading when it names a known section and stands out from body text
+    (bold, larger, upper-case, or alone in its block). Text before the first
+    heading is the "header" (name and contact details).
+    """
+    try:
+        pdf = fitz.open(stream=source, filetype="pdf") if isinstance(source, (bytes, bytearray)) else fitz.open(source)
+        with pdf:
+            blocks = [b for page in pdf for b in page.get_text("dict")["blocks"] if b.get("type") == 0]
+    except Exception as e:
+        print(f"Error extracting sections from PDF: {e}")
+        return []
+
+    sizes = [span["size"] for b in blocks for line in b["lines"] for span in line["spans"] if span["text"].strip()]
+    body_size = median(sizes) if sizes else 0
+
+    sections = [["header", []]]
+    for block in blocks:
+        for line in block["lines"]:
+            spans = [s for s in line["spans"] if s["text"].strip()]
+            text = " ".join(s["text"].strip() for s in spans)
+            if not text:
+                continue
+
+            name = _heading_name(text) if len(text.split()) <= 4 else None
+            stands_out = (
+                any(s["flags"] & 16 for s in spans)  # bold
+                or max(s["size"] for s in spans) > body_size * 1.05
+                or text.isupper()
+                or len(block["lines"]) == 1
+            )
+            if name and stands_out:
+                sections.append([name, []])
+            else:
+                sections[-1][1].append(text)
+
+    return [[name, "\n".join(lines)] for name, lines in sections if lines]
+
+
 # Step 2: Clean and validate JSON response
 def clean_json_response(response):
     """
@@ -39,6 +106,18 @@ def clean_json_response(response):
     return response.strip()
 
 
+def _parses_as_json(response):
+    try:
+        json.loads(clean_json_response(getattr(response, "content", response)))
+        return True
+    except json.JSONDecodeError:
+        return False
+
+
+# Same resume text → same prompt; unparseable responses are not cached so retries still reach the LLM
+resume_llm = cached(llm, site="resume_parse", ttl=30 * 24 * 3600, validate=_parses_as_json)
+
+
 # Step 3: Define the LangChain LLM + Prompt
 def setup_llm_chain():
     """
@@ -90,7 +169,7 @@ Resume Text:
             template=template
         )
 
-        chain = prompt | llm
+        chain = prompt | RunnableLambda(resume_llm.invoke)
         return chain
     
     except Exception as e:
@@ -101,16 +180,166 @@ Resume Text:
 
 
 
+# Step 3b: Smaller per-section prompts, each returning one slice of the schema.
+# Text longer than this is split into chunks that are parsed separately and merged, never cut off.
+SECTION_CHAR_LIMIT = 4000
+# Chunk parses run on the shared "resume" pool (RESUME_PARSE_WORKERS), so concurrent uploads share one
+# budget; callers with their own budget (backend/bulk_ingest.py) pass their executor as `pool`
+
+SECTION_SCHEMAS = {
+    "header": '{"name": "Full Name", "email": "email@example.com", "phone": "phone number"}',
+    "education": '{"education": [{"degree": "degree name", "institution": "school name", "year": "graduation year"}]}',
+    "experience": '{"experience": [{"title": "job title", "company": "company name", "duration": "time period", "description": "job description"}]}',
+    "projects": '{"projects": [{"title": "project name", "tech": ["technology1", "technology2"], "description": "project description"}]}',
+    "skills": '{"skills": ["skill1", "skill2", "skill3"]}',
+}
+
+EMPTY_RESUME = {"name": "", "email": "", "phone": "", "education": [], "skills": [], "experience": [], "projects": []}
+
+section_prompt = PromptTemplate(
+    input_variables=["section", "schema", "text"],
+    template="""
+You are an intelligent resume parser. Below is the {section} part of a resume. Extract it and return ONLY valid JSON in this exact format:
+
+{schema}
+
+Important: Return ONLY the JSON object, no additional text or explanation. Use empty values for anything not present.
+
+Resume {section} text:
+{text}
+"""
+)
+
+
+def split_chunks(text, limit=SECTION_CHAR_LIMIT):
+    """Split `text` on line boundaries into pieces of at most `limit` characters (a longer line is cut)."""
+    chunks, current = [], ""
+    for line in text.splitlines(keepends=True):
+        while len(line) > limit:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(line[:limit])
+            line = line[limit:]
+        if len(current) + len(line) > limit:
+            chunks.append(current)
+            current = ""
+        current += line
+    if current.strip():
+        chunks.append(current)
+    return [chunk for chunk in chunks if chunk.strip()]
+
+
+def _parse_section(section, text, max_retries):
+    prompt = section_prompt.format(section=section, schema=SECTION_SCHEMAS[section], text=text)
+    for attempt in range(max_retries):
+        try:
+            response = resume_llm.invoke(prompt)
+            return json.loads(clean_json_response(getattr(response, "content", response)))
+        except Exception as e:
+            print(f"❌ {section} section error on attempt {attempt + 1}: {e}")
+    return None
+
+
+def _merge_into(result, parsed):
+    for key, value in parsed.items():
+        if key not in result or not value:
+            continue
+        if isinstance(result[key], list):
+            # Chunks of one section can repeat an entry (a skill listed twice, an overlapping role)
+            result[key].extend(item for item in (value if isinstance(value, list) else [value]) if item not in result[key])
+        elif not result[key]:
+            result[key] = value
+
+
+def _empty_resume():
+    return {k: (list(v) if isinstance(v, list) else v) for k, v in EMPTY_RESUME.items()}
+
+
+def sections_to_text(sections):
+    return "\n".join(text for _, text in sections).strip()
+
+
+def parse_resume_sections(sections, max_retries=3, pool=None):
+    """
+    Parse each known section with its own prompt, all in parallel on `pool`
+    (the shared "resume" pool by default), and merge the results into the
+    full resume schema. Resumes without at least two recognizable sections go
+    through the single full-text prompt instead, as do the fields of any
+    section whose parse failed. If nothing could be parsed, the full-text
+    parse's error is returned.
+    """
+    pool = pool or get_pool("resume")
+    resume_text = sections_to_text(sections)
+    grouped = {}
+    for name, text in sections:
+        if name in SECTION_SCHEMAS:
+            grouped[name] = (grouped[name] + "\n" + text) if name in grouped else text
+
+    if len(grouped.keys() - {"header"}) < 2:
+        return parse_resume_text(resume_text, max_retries, pool)
+
+    # Contact details sit at the top of the page when there's no preamble block
+    grouped.setdefault("header", resume_text[:1000])
+
+    # Long sections become several chunks; every chunk is its own call and the results are merged in order
+    jobs = [(name, chunk) for name, text in grouped.items() for chunk in split_chunks(text)]
+    futures = [pool.submit(_parse_section, name, chunk, max_retries) for name, chunk in jobs]
+    results = [future.result() for future in futures]
+
+    merged = _empty_resume()
+    for parsed in results:
+        if isinstance(parsed, dict):
+            _merge_into(merged, parsed)
+
+    if any(not isinstance(parsed, dict) for parsed in results):
+        fallback = parse_resume_text(resume_text, max_retries, pool)
+        if "error" not in fallback:
+            _merge_into(merged, {k: v for k, v in fallback.items() if not merged.get(k)})
+        elif not any(isinstance(parsed, dict) for parsed in results):
+            # An all-empty resume would look like a successful parse and be cached
+            return fallback
+
+    return merged
+
+
 # Step 4: Parse resume with error handling
-def parse_resume_with_llm(pdf_path, max_retries=3):
+def parse_resume_with_llm(source, max_retries=3):
     """
-    Parse resume with retry logic and error handling
+    Parse resume with retry logic and error handling. `source` is a PDF path or its bytes.
     """
-    # Extract text from PDF
-    resume_text = extract_text_from_pdf(pdf_path)
-    if not resume_text:
+    # Extract sections from PDF
+    sections = extract_sections_from_pdf(source)
+    if not sections_to_text(sections):
         return {"error": "Could not extract text from PDF"}
-    
+
+    return parse_resume_sections(sections, max_retries)
+
+
+def parse_resume_text(resume_text, max_retries=3, pool=None):
+    """
+    Run the LLM parse on already-extracted resume text. Text longer than
+    SECTION_CHAR_LIMIT is parsed chunk by chunk on `pool` and merged.
+    """
+    chunks = split_chunks(resume_text) or [resume_text]
+    if len(chunks) == 1:
+        return _parse_text_chunk(chunks[0], max_retries)
+
+    pool = pool or get_pool("resume")
+    results = list(pool.map(lambda chunk: _parse_text_chunk(chunk, max_retries), chunks))
+
+    parsed = [r for r in results if "error" not in r]
+    if not parsed:
+        return results[0]
+
+    merged = _empty_resume()
+    for r in parsed:
+        _merge_into(merged, r)
+    return merged
+
+
+def _parse_text_chunk(resume_text, max_retries=3):
+    """Full-schema prompt on one chunk of resume text"""
     # Setup LLM chain
     chain = setup_llm_chain()
     if not chain:
@@ -122,7 +351,8 @@ def parse_resume_with_llm(pdf_path, max_retries=3):
             
             
             # Get response from LLM
-            response = chain.invoke({"text":resume_text[:4000]})  # Limit text length
+            response = chain.invoke({"text": resume_text})
+            response = getattr(response, "content", response)  # chat models return a message
             
             # Clean and parse JSON
             cleaned_response = clean_json_response(response)
@@ -0,0 +1,30 @@
+# backend/routes/metrics.py
+import os
+
+from fastapi import APIRouter, Depends, HTTPException
+from backend import metrics
+from backend.auth import get_current_user
+from backend.executor import pool_stats
+from backend.llm_cache import cache_stats
+
+router = APIRouter(prefix="/api/metrics", tags=["metrics"])
+
+# Clerk ids allowed to read internal metrics (comma-separated); the endpoint is off when empty
+METRICS_ADMIN_IDS = {i.strip() for i in os.getenv("METRICS_ADMIN_IDS", "").split(",") if i.strip()}
+
+
+def require_metrics_admin(user: str = Depends(get_current_user)):
+    if user not in METRICS_ADMIN_IDS:
+        # 404 rather than 403 so the endpoint is not advertised to regular users
+        raise HTTPException(status_code=404, detail="Not Found")
+    return user
+
+
+@router.get("")
+def get_metrics(user: str = Depends(require_metrics_admin)):
+    """Process-local counters, gauges and latency histograms (admins only)"""
+    return {
+        **metrics.snapshot(),
+        "pools": pool_stats(),
+        "llm_cache": cache_stats(),
+    }
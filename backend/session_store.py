@@ -0,0 +1,241 @@
+# backend/session_store.py
+#
+# Where live interviews are kept between requests.
+#   memory → this worker's heap (single worker, lost on restart)
+#   redis  → any Redis-compatible server; every worker/replica sees the same sessions
+#   mongo  → the "sessions" collection of the app database
+#
+# Sessions are stored in a compact form: the plain-data snapshot from each
+# session's to_dict(), as minified JSON, zlib-compressed.
+
+import json
+import os
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from datetime import datetime
+
+from backend import metrics
+from backend.coding_session import CodingSession
+from backend.hr_session import HRInterviewSession
+from backend.interview_session import InterviewSession
+
+SESSION_BACKEND = os.getenv("SESSION_BACKEND", "memory")
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+# Idle interviews are dropped after this long without a request
+SESSION_TTL_SECONDS = int(os.getenv("SESSION_TTL_SECONDS", 2 * 60 * 60))
+# In-memory backend only: least-recently-used sessions beyond this are evicted
+MAX_LIVE_SESSIONS = int(os.getenv("MAX_LIVE_SESSIONS", 500))
+# In-memory backend only: where evicted sessions go so they can still be resumed (none | redis | mongo)
+SESSION_EVICT_TO = os.getenv("SESSION_EVICT_TO", "none")
+# In-memory backend only: measure the serialized size of one put in this many for the size gauge (0 = never)
+SESSION_SIZE_SAMPLE_EVERY = int(os.getenv("SESSION_SIZE_SAMPLE_EVERY", 100))
+
+SESSION_KINDS = {
+    "technical": InterviewSession,
+    "hr": HRInterviewSession,
+    "coding": CodingSession,
+}
+FULL_MODE_PARTS = ("tech", "hr", "code")
+FORMAT_VERSION = 1
+
+
+def _encode(session_info):
+    # Full interviews are a dict of round sessions plus routing fields
+    if isinstance(session_info, dict):
+        data = {k: v for k, v in session_info.items() if k not in FULL_MODE_PARTS}
+        data["kind"] = "full"
+        data["parts"] = {k: session_info[k].to_dict() for k in FULL_MODE_PARTS if k in session_info}
+        return data
+    return session_info.to_dict()
+
+
+def _decode(data):
+    if data["kind"] == "full":
+        parts = data.pop("parts")
+        data.pop("kind")
+        data.update({k: _decode(v) for k, v in parts.items()})
+        return data
+    return SESSION_KINDS[data["kind"]].from_dict(data)
+
+
+def _json_default(value):
+    # numpy scalars/arrays sneak in through the audio metrics
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def serialize_session(session_info):
+    payload = {"v": FORMAT_VERSION, "s": _encode(session_info)}
+    return zlib.compress(json.dumps(payload, separators=(",", ":"), default=_json_default).encode("utf-8"))
+
+
+def deserialize_session(blob):
+    payload = json.loads(zlib.decompress(blob).decode("utf-8"))
+    if payload.get("v") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported session format version: {payload.get('v')}")
+    return _decode(payload["s"])
+
+
+class SessionStore:
+    """get/put/delete of one live interview per user."""
+
+    def get(self, user_id):
+        raise NotImplementedError
+
+    def put(self, user_id, session_info):
+        raise NotImplementedError
+
+    def delete(self, user_id):
+        raise NotImplementedError
+
+    def sweep(self):
+        """Drop expired sessions. Backends with native expiry have nothing to do."""
+        return 0
+
+
+class InMemorySessionStore(SessionStore):
+    """
+    Keeps the live objects, ordered by last access. Sessions idle for longer
+    than `ttl` and the least-recently-used ones beyond `max_sessions` are
+    evicted, optionally into a `fallback` store they are resumed from.
+    """
+
+    def __init__(self, ttl=SESSION_TTL_SECONDS, max_sessions=MAX_LIVE_SESSIONS, fallback=None, clock=time.monotonic,
+                 size_sample_every=SESSION_SIZE_SAMPLE_EVERY):
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self.fallback = fallback
+        self.clock = clock
+        self.size_sample_every = size_sample_every
+        self._sessions = OrderedDict()  # user_id -> (session_info, last_access), oldest first
+        self._puts = 0
+        self._lock = threading.RLock()
+
+    def get(self, user_id):
+        with self._lock:
+            evicted = self._evict()
+            entry = self._sessions.get(user_id)
+            if entry is not None:
+                self._touch(user_id, entry[0])
+        self._spill(evicted)
+        if entry is not None:
+            return entry[0]
+
+        if self.fallback is not None:
+            session_info = self.fallback.get(user_id)
+            if session_info is not None:
+                metrics.inc("sessions.resumed")
+                self.put(user_id, session_info)
+            return session_info
+        return None
+
+    def put(self, user_id, session_info):
+        with self._lock:
+            self._touch(user_id, session_info)
+            evicted = self._evict()
+            self._puts += 1
+            sample = self.size_sample_every and self._puts % self.size_sample_every == 0
+            metrics.set_gauge("sessions.live", len(self._sessions))
+        self._spill(evicted)
+        if sample:
+            # Serializing is only needed for the size gauge, so it is sampled rather than done on every turn
+            metrics.set_gauge("sessions.est_bytes_per_session", len(serialize_session(session_info)))
+
+    def delete(self, user_id):
+        with self._lock:
+            self._sessions.pop(user_id, None)
+            metrics.set_gauge("sessions.live", len(self._sessions))
+        if self.fallback is not None:
+            self.fallback.delete(user_id)
+
+    def sweep(self):
+        with self._lock:
+            evicted = self._evict()
+            metrics.set_gauge("sessions.live", len(self._sessions))
+        self._spill(evicted)
+        return len(evicted)
+
+    def _touch(self, user_id, session_info):
+        self._sessions[user_id] = (session_info, self.clock())
+        self._sessions.move_to_end(user_id)
+
+    def _evict(self):
+        """Drop expired and over-capacity entries (lock held); returns them for _spill."""
+        # Oldest first, so expiry stops at the first live entry
+        evicted = []
+        now = self.clock()
+        while self._sessions:
+            user_id, (session_info, last_access) = next(iter(self._sessions.items()))
+            expired = now - last_access > self.ttl
+            if not expired and len(self._sessions) <= self.max_sessions:
+                break
+            self._sessions.popitem(last=False)
+            metrics.inc("sessions.expired" if expired else "sessions.evicted_lru")
+            evicted.append((user_id, session_info))
+        return evicted
+
+    def _spill(self, evicted):
+        # Network writes happen outside the lock so other requests are not blocked on Redis/Mongo
+        if self.fallback is None:
+            return
+        for user_id, session_info in evicted:
+            self.fallback.put(user_id, session_info)
+
+
+class RedisSessionStore(SessionStore):
+    def __init__(self, client=None, url=REDIS_URL, prefix="session:"):
+        if client is None:
+            import redis
+            client = redis.Redis.from_url(url)
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, user_id):
+        blob = self.client.get(self.prefix + user_id)
+        return deserialize_session(blob) if blob else None
+
+    def put(self, user_id, session_info):
+        # Redis expires idle sessions itself; every turn re-puts, which slides the TTL
+        self.client.set(self.prefix + user_id, serialize_session(session_info), ex=SESSION_TTL_SECONDS)
+
+    def delete(self, user_id):
+        self.client.delete(self.prefix + user_id)
+
+
+class MongoSessionStore(SessionStore):
+    def __init__(self, collection=None):
+        if collection is None:
+            from backend.database import db
+            collection = db["sessions"]
+        self.collection = collection
+        # Mongo's TTL monitor deletes sessions whose last write is older than the TTL
+        self.collection.create_index("updatedAt", expireAfterSeconds=SESSION_TTL_SECONDS)
+
+    def get(self, user_id):
+        doc = self.collection.find_one({"_id": user_id})
+        return deserialize_session(doc["blob"]) if doc else None
+
+    def put(self, user_id, session_info):
+        self.collection.replace_one(
+            {"_id": user_id},
+            {"_id": user_id, "blob": serialize_session(session_info), "updatedAt": datetime.utcnow()},
+            upsert=True,
+        )
+
+    def delete(self, user_id):
+        self.collection.delete_one({"_id": user_id})
+
+
+def create_session_store(backend=SESSION_BACKEND):
+    if backend == "memory":
+        fallback = None if SESSION_EVICT_TO == "none" else create_session_store(SESSION_EVICT_TO)
+        return InMemorySessionStore(fallback=fallback)
+    if backend == "redis":
+        return RedisSessionStore()
+    if backend == "mongo":
+        return MongoSessionStore()
+    raise ValueError(f"Unknown SESSION_BACKEND '{backend}'. Choose memory, redis or mongo.")
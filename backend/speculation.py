@@ -0,0 +1,41 @@
+# backend/speculation.py
+
+import os
+import re
+from difflib import SequenceMatcher
+
+from backend import metrics
+
+# Speculative next-question drafting on the /ws/audio stream (off by default: it spends extra LLM calls)
+SPECULATIVE_QUESTIONS = os.getenv("SPECULATIVE_QUESTIONS", "0") == "1"
+
+# A draft is reused only if the partial it was built from covers most of the final answer
+MIN_COVERAGE = float(os.getenv("SPECULATIVE_MIN_COVERAGE", 0.8))
+MIN_SIMILARITY = float(os.getenv("SPECULATIVE_MIN_SIMILARITY", 0.85))
+
+
+def _words(text):
+    return re.findall(r"[a-z0-9']+", (text or "").lower())
+
+
+def draft_matches(draft_answer, final_answer):
+    draft_words, final_words = _words(draft_answer), _words(final_answer)
+    if not final_words:
+        return not draft_words
+    if len(draft_words) / len(final_words) < MIN_COVERAGE:
+        return False
+
+    # Whisper may revise the last few words of a partial; compare the overlapping prefix
+    prefix = final_words[: len(draft_words)]
+    return SequenceMatcher(None, draft_words, prefix, autojunk=False).ratio() >= MIN_SIMILARITY
+
+
+def use_draft(draft, final_answer, current_round):
+    """True if a speculative draft built for this round is still valid for the final answer."""
+    if not draft:
+        return False
+    if draft.get("round") == current_round and draft_matches(draft.get("answer"), final_answer):
+        metrics.inc("speculation.hit")
+        return True
+    metrics.inc("speculation.miss")
+    return False
@@ -1,8 +1,140 @@
 # speech_to_text.py
-import whisper
 
-model = whisper.load_model('base')
+import os
+import queue
+import threading
 
-def transcribe(audio_path):
-    result = model.transcribe(audio_path)
-    return result['text']
+from backend import metrics
+from backend.audio_decode import SAMPLE_RATE
+from backend.executor import CPU_COUNT, POOL_SIZES
+from backend.vad import has_speech, trim_silence
+
+# Engine selection
+#   whisper        → openai-whisper, fp32 on CPU (original behaviour)
+#   faster-whisper → CTranslate2 backend, int8 on CPU by default
+STT_ENGINE = os.getenv("STT_ENGINE", "whisper")
+STT_MODEL_SIZE = os.getenv("STT_MODEL_SIZE", "base")
+STT_COMPUTE_TYPE = os.getenv("STT_COMPUTE_TYPE", "int8")
+
+# One warm model per stt worker thread, so parallel answers never wait on a shared model
+STT_POOL_SIZE = int(os.getenv("STT_POOL_SIZE", POOL_SIZES["stt"]))
+
+
+class TranscriptionEngine:
+    """Common interface: audio is a file path or a 16 kHz mono float32 buffer."""
+    name = "base"
+
+    @classmethod
+    def configure_threads(cls, threads):
+        """Process-wide thread setup, applied once before any instance is loaded."""
+
+    def transcribe(self, audio):
+        raise NotImplementedError
+
+
+class WhisperEngine(TranscriptionEngine):
+    name = "whisper"
+
+    @classmethod
+    def configure_threads(cls, threads):
+        import torch
+
+        # Global to the process: every concurrent inference gets this many intra-op threads
+        torch.set_num_threads(threads)
+
+    def __init__(self, model_size=STT_MODEL_SIZE, threads=None):
+        import whisper
+
+        self.model = whisper.load_model(model_size)
+        self.fp16 = self.model.device.type == "cuda"
+
+    def transcribe(self, audio):
+        return self.model.transcribe(audio, fp16=self.fp16)["text"]
+
+
+class FasterWhisperEngine(TranscriptionEngine):
+    name = "faster-whisper"
+
+    def __init__(self, model_size=STT_MODEL_SIZE, threads=None, compute_type=STT_COMPUTE_TYPE):
+        from faster_whisper import WhisperModel
+
+        self.model = WhisperModel(
+            model_size,
+            device="cpu",
+            compute_type=compute_type,
+            cpu_threads=threads or 0,
+        )
+
+    def transcribe(self, audio):
+        segments, _ = self.model.transcribe(audio, beam_size=5)
+        return "".join(segment.text for segment in segments)
+
+
+ENGINES = {
+    WhisperEngine.name: WhisperEngine,
+    FasterWhisperEngine.name: FasterWhisperEngine,
+}
+
+
+def _engine_class(name):
+    if name not in ENGINES:
+        raise ValueError(f"Unknown STT_ENGINE '{name}'. Choose one of: {', '.join(ENGINES)}")
+    return ENGINES[name]
+
+
+def create_engine(name=STT_ENGINE, model_size=STT_MODEL_SIZE, threads=None):
+    return _engine_class(name)(model_size=model_size, threads=threads)
+
+
+class EnginePool:
+    """
+    N warm engine instances loaded up front. Each transcription checks one
+    out, so concurrent answers decode in parallel without sharing model state.
+    """
+
+    def __init__(self, name=STT_ENGINE, model_size=STT_MODEL_SIZE, size=STT_POOL_SIZE):
+        self.size = max(1, size)
+        # Split the cores between instances instead of letting each one grab all of them
+        threads = max(1, CPU_COUNT // self.size)
+        _engine_class(name).configure_threads(threads)
+        self._idle = queue.Queue()
+        for _ in range(self.size):
+            self._idle.put(create_engine(name, model_size, threads=threads))
+
+    def transcribe(self, audio):
+        engine = self._idle.get()
+        try:
+            return engine.transcribe(audio)
+        finally:
+            self._idle.put(engine)
+
+
+_engine_pool = None
+_engine_pool_lock = threading.Lock()
+
+
+def get_engine_pool():
+    """Load the pool once; app startup calls this so the first answer hits warm models."""
+    global _engine_pool
+    with _engine_pool_lock:
+        if _engine_pool is None:
+            _engine_pool = EnginePool()
+        return _engine_pool
+
+
+def transcribe(audio):
+    # audio: a file path or a 16 kHz mono float32 buffer from backend.audio_decode
+    return get_engine_pool().transcribe(audio)
+
+
+def transcribe_speech(pcm, sr=SAMPLE_RATE):
+    """
+    Transcribe only the voiced part of a decoded answer, so Whisper's work
+    scales with speech length rather than recording length. Returns "" without
+    running Whisper when there is no speech at all.
+    """
+    if len(pcm) == 0 or not has_speech(pcm, sr):
+        return ""
+    speech = trim_silence(pcm, sr)
+    metrics.observe("vad.speech_ratio", len(speech) / len(pcm))
+    return transcribe(speech)
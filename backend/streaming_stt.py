@@ -0,0 +1,113 @@
+# backend/streaming_stt.py
+
+import subprocess
+import threading
+
+import numpy as np
+
+from backend.audio_decode import SAMPLE_RATE
+from backend.speech_to_text import transcribe_speech
+from backend.vad import last_pause
+
+# Whisper's receptive field is 30 s; never let the open window grow past it
+MAX_WINDOW_S = 25
+MIN_PAUSE_MS = 500
+
+
+class StreamingTranscriber:
+    """
+    Incremental transcription for one answer.
+
+    Encoded chunks (webm/opus from MediaRecorder) are written to a single
+    long-lived ffmpeg process, so the container header only has to arrive
+    once. Decoded PCM accumulates in memory. Each `step()` closes every VAD
+    segment that ends in a pause, transcribes it once and commits the text;
+    only the still-open tail is re-transcribed as the partial.
+    """
+
+    def __init__(self, sr=SAMPLE_RATE):
+        self.sr = sr
+        self.proc = subprocess.Popen(
+            [
+                "ffmpeg", "-nostdin", "-loglevel", "error",
+                "-i", "pipe:0",
+                "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(sr),
+                "pipe:1",
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        self._pcm = bytearray()
+        self._pcm_lock = threading.Lock()
+        self._reader = threading.Thread(target=self._read_pcm, daemon=True)
+        self._reader.start()
+
+        self.committed = []      # text of closed segments, in order
+        self.committed_until = 0  # sample offset of the end of the last closed segment
+        self.partial = ""
+        self.bytes_received = 0
+
+    def _read_pcm(self):
+        while True:
+            data = self.proc.stdout.read(4096)
+            if not data:
+                break
+            with self._pcm_lock:
+                self._pcm.extend(data)
+
+    def feed(self, chunk):
+        self.bytes_received += len(chunk)
+        self.proc.stdin.write(chunk)
+        self.proc.stdin.flush()
+
+    def pcm(self):
+        with self._pcm_lock:
+            raw = bytes(self._pcm[: len(self._pcm) - len(self._pcm) % 2])
+        return np.frombuffer(raw, np.int16).astype(np.float32) / 32768.0
+
+    def _commit(self, segment):
+        text = transcribe_speech(segment, self.sr).strip()
+        if text:
+            self.committed.append(text)
+        self.committed_until += len(segment)
+
+    def step(self):
+        """Commit closed segments and return the current partial transcript."""
+        tail = self.pcm()[self.committed_until:]
+
+        cut = last_pause(tail, self.sr, MIN_PAUSE_MS)
+        if cut:
+            self._commit(tail[:cut])
+            tail = tail[cut:]
+
+        # No pause for too long: force a boundary so the window stays bounded
+        max_window = MAX_WINDOW_S * self.sr
+        while len(tail) > max_window:
+            self._commit(tail[:max_window])
+            tail = tail[max_window:]
+
+        self.partial = transcribe_speech(tail, self.sr).strip()
+        return self.text()
+
+    def text(self):
+        return " ".join(self.committed + ([self.partial] if self.partial else []))
+
+    def close(self):
+        """Flush ffmpeg and return the full decoded answer."""
+        if self.proc.stdin and not self.proc.stdin.closed:
+            self.proc.stdin.close()
+        self._reader.join(timeout=10)
+        self.proc.wait(timeout=10)
+        return self.pcm()
+
+    def finish(self):
+        """Transcribe only what is left after the last committed segment."""
+        tail = self.pcm()[self.committed_until:]
+        self.partial = ""
+        self._commit(tail)
+        return " ".join(self.committed)
+
+    def abort(self):
+        if self.proc.poll() is None:
+            self.proc.kill()
@@ -0,0 +1,135 @@
+import asyncio
+import os
+
+os.environ.setdefault("DEFAULT_GROQ_API_KEY", "test-key")
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from backend import app as app_module
+from backend.auth import get_current_user
+
+SR = 16000
+
+
+class FakeRound:
+    """A round session with canned questions and no LLM."""
+
+    def __init__(self, questions, role="Backend Developer"):
+        self.role = role
+        self.questions = list(questions)
+        self.history = [{"question": self.questions.pop(0), "answer": None}]
+        self.current_round = 1
+        self.meta = {"greeting_sent": True}
+
+    def provide_answer(self, answer):
+        self.history[-1]["answer"] = answer
+
+    def ask_question(self, draft=None):
+        if not self.questions:
+            return None
+        self.history.append({"question": self.questions.pop(0), "answer": None})
+        return self.history[-1]["question"]
+
+
+def _no_whisper(pcm):
+    raise AssertionError("Whisper ran on a silent answer")
+
+
+def _silent_pcm(contents):
+    return (0.0005 * np.random.default_rng(0).standard_normal(5 * SR)).astype(np.float32)
+
+
+def _post_silent_answer(monkeypatch, session_info):
+    started = []
+    monkeypatch.setattr(app_module, "decode_audio", _silent_pcm)
+    monkeypatch.setattr(app_module, "_start_feedback", lambda user, info: started.append(user))
+    monkeypatch.setattr(app_module, "transcribe_speech", _no_whisper)
+    app_module.app.dependency_overrides[get_current_user] = lambda: "user_silent"
+    app_module.session_store.put("user_silent", session_info)
+    try:
+        response = TestClient(app_module.app).post(
+            "/api/audio",
+            files={"audio": ("answer.webm", b"\x1a" * 4000, "audio/webm")},
+            data={"focus_score": "0.8"},
+        )
+    finally:
+        app_module.app.dependency_overrides.clear()
+        app_module.session_store.delete("user_silent")
+    return response, started
+
+
+def test_silent_answer_in_full_mode_advances_the_interview(monkeypatch):
+    tech = FakeRound(["Describe a project.", "How did you test it?"])
+    session_info = {"mode": "full", "current": "tech", "role": "Backend Developer", "tech": tech, "hr": FakeRound(["Tell me about yourself."])}
+
+    response, started = _post_silent_answer(monkeypatch, session_info)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["answer"] == ""
+    assert body["text"] == "How did you test it?"
+    assert tech.history[0]["answer"] == ""
+    assert tech.meta["focus_scores"] == [0.8]
+    assert len(tech.meta["confidence_scores"]) == 1
+    assert not started
+
+
+def test_silent_last_answer_completes_and_starts_feedback(monkeypatch):
+    hr = FakeRound(["Any questions for us?"])
+    session_info = {"mode": "full", "current": "hr", "role": "Backend Developer", "tech": FakeRound(["Q"]), "hr": hr}
+
+    response, started = _post_silent_answer(monkeypatch, session_info)
+
+    assert response.json()["complete"] is True
+    assert started == ["user_silent"]
+
+
+class FakeStreamingRound(FakeRound):
+    """FakeRound whose next question is streamed word by word; `fail_after` words are sent before an error."""
+
+    def __init__(self, questions, fail_after=None):
+        super().__init__(questions)
+        self.fail_after = fail_after
+
+    def stream_question(self, answer):
+        for i, word in enumerate(self.questions[0].split(" ")):
+            if i == self.fail_after:
+                raise RuntimeError("LLM connection dropped")
+            yield word if i == 0 else " " + word
+
+    def commit_turn(self, answer, question):
+        self.provide_answer(answer)
+        self.ask_question()
+
+
+def _stream_turn(session):
+    sent = []
+
+    async def on_token(token, replace=False):
+        sent.append(token)
+
+    return asyncio.run(app_module._advance_interview(session, "I built a queue.", 0.7, 0.9, on_token=on_token)), sent
+
+
+def test_streamed_turn_records_the_answer_after_the_last_token():
+    session = FakeStreamingRound(["Describe a project.", "How did you scale it?"])
+
+    result, sent = _stream_turn(session)
+
+    assert result["text"] == "How did you scale it?"
+    assert "".join(sent) == "How did you scale it?"
+    assert session.history[0]["answer"] == "I built a queue."
+    assert session.meta["confidence_scores"] == [0.7]
+
+
+def test_failed_stream_leaves_the_answer_unrecorded():
+    session = FakeStreamingRound(["Describe a project.", "How did you scale it?"], fail_after=2)
+
+    with pytest.raises(RuntimeError):
+        _stream_turn(session)
+
+    assert session.history[0]["answer"] is None
+    assert len(session.history) == 1
+    assert "confidence_scores" not in session.meta
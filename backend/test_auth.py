@@ -0,0 +1,78 @@
+import os
+
+os.environ.setdefault("DEFAULT_GROQ_API_KEY", "test-key")
+
+import pytest
+
+from backend import auth
+
+
+class FakeUsers:
+    """The users collection queries auth makes, with email matched case-insensitively like EMAIL_COLLATION."""
+
+    def __init__(self, *docs):
+        self.docs = [dict(doc) for doc in docs]
+
+    def _matches(self, doc, query):
+        for field, expected in query.items():
+            if isinstance(expected, dict) and "$exists" in expected:
+                if (field in doc) != expected["$exists"]:
+                    return False
+            elif field == "email":
+                if doc.get("email", "").lower() != expected.lower():
+                    return False
+            elif doc.get(field) != expected:
+                return False
+        return True
+
+    def find_one(self, query, projection=None, collation=None):
+        return next((doc for doc in self.docs if self._matches(doc, query)), None)
+
+    def find_one_and_update(self, query, update, collation=None, return_document=None):
+        doc = self.find_one(query)
+        if doc:
+            doc.update(update["$set"])
+        return doc
+
+    def insert_one(self, doc):
+        self.docs.append(doc)
+
+
+INGESTED = {"_id": "ingested", "email": "jane@example.com", "name": "Jane Doe", "skills": ["Python"]}
+
+
+@pytest.fixture
+def users(monkeypatch):
+    collection = FakeUsers(INGESTED)
+    monkeypatch.setattr(auth, "users_collection", collection)
+    return collection
+
+
+def test_verified_email_claims_the_ingested_profile(users, monkeypatch):
+    monkeypatch.setattr(auth, "_clerk_verified_emails", lambda clerk_id: {"jane@example.com"})
+
+    assert auth.get_current_user(x_user_id="user_jane", x_user_email="Jane@Example.com") == "user_jane"
+    assert users.docs[0]["clerkId"] == "user_jane"
+    assert len(users.docs) == 1
+
+
+def test_unverified_email_does_not_claim_the_profile(users, monkeypatch):
+    monkeypatch.setattr(auth, "_clerk_verified_emails", lambda clerk_id: set())
+
+    assert auth.get_current_user(x_user_id="user_mallory", x_user_email="jane@example.com") == "user_mallory"
+    assert "clerkId" not in users.docs[0]
+    assert users.docs[1]["clerkId"] == "user_mallory"
+
+
+def test_new_users_are_stored_with_a_lower_cased_email(users, monkeypatch):
+    monkeypatch.setattr(auth, "_clerk_verified_emails", lambda clerk_id: {"sam@example.com"})
+
+    auth.get_current_user(x_user_id="user_sam", x_user_email="Sam@Example.com")
+
+    assert users.docs[-1]["email"] == "sam@example.com"
+
+
+def test_without_a_clerk_secret_nothing_is_verified(monkeypatch):
+    monkeypatch.setattr(auth, "CLERK_SECRET_KEY", None)
+
+    assert auth._clerk_verified_emails("user_jane") == set()
@@ -0,0 +1,64 @@
+import time
+
+import pytest
+
+from backend.batching import MicroBatcher
+
+
+class FakeBatchFn:
+    """Doubles every item and records the batches it was called with."""
+
+    def __init__(self, error=None):
+        self.calls = []
+        self.error = error
+
+    def __call__(self, items):
+        self.calls.append(list(items))
+        if self.error:
+            raise self.error
+        return [item * 2 for item in items]
+
+
+def test_full_batch_runs_in_one_call_without_waiting():
+    batch_fn = FakeBatchFn()
+    batcher = MicroBatcher(batch_fn, name="test_full", max_batch_size=4, max_wait_ms=5000)
+
+    started = time.monotonic()
+    futures = [batcher.submit(i) for i in range(4)]
+
+    assert [f.result(timeout=2) for f in futures] == [0, 2, 4, 6]
+    assert batch_fn.calls == [[0, 1, 2, 3]]
+    assert time.monotonic() - started < 2
+
+
+def test_partial_batch_is_flushed_after_max_wait():
+    batch_fn = FakeBatchFn()
+    batcher = MicroBatcher(batch_fn, name="test_wait", max_batch_size=100, max_wait_ms=50)
+
+    futures = [batcher.submit(i) for i in range(3)]
+
+    assert [f.result(timeout=2) for f in futures] == [0, 2, 4]
+    assert batch_fn.calls == [[0, 1, 2]]
+
+
+def test_requests_beyond_max_batch_size_go_to_the_next_batch():
+    batch_fn = FakeBatchFn()
+    batcher = MicroBatcher(batch_fn, name="test_split", max_batch_size=2, max_wait_ms=5000)
+
+    futures = [batcher.submit(i) for i in range(4)]
+
+    assert [f.result(timeout=2) for f in futures] == [0, 2, 4, 6]
+    assert batch_fn.calls == [[0, 1], [2, 3]]
+
+
+def test_batch_error_reaches_every_caller_and_the_batcher_keeps_running():
+    batch_fn = FakeBatchFn(error=RuntimeError("model not loaded"))
+    batcher = MicroBatcher(batch_fn, name="test_error", max_batch_size=2, max_wait_ms=100)
+
+    futures = [batcher.submit(i) for i in range(2)]
+    for future in futures:
+        with pytest.raises(RuntimeError, match="model not loaded"):
+            future.result(timeout=2)
+
+    batch_fn.error = None
+    assert batcher(5) == 10
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from backend.benchmarks.bench_confidence import legacy_confidence_score, synthetic_answer
+from backend.confidence_utils import (
+    extract_features,
+    frame_features,
+    get_confidence_score,
+    score_features,
+    summarize_frames,
+)
+
+SR = 16000
+
+
+def test_short_answer_scores_low():
+    assert get_confidence_score(np.zeros(SR // 2, dtype=np.float32), SR) == 0.2
+
+
+def test_syllable_rate_tracks_envelope():
+    t = np.arange(10 * SR) / SR
+    pcm = (0.2 * np.abs(np.sin(np.pi * 4 * t)) ** 2 * np.sin(2 * np.pi * 150 * t)).astype(np.float32)
+    assert extract_features(pcm, SR)["syllable_rate"] == pytest.approx(4.0, abs=0.5)
+
+
+def test_stored_frames_rescore_to_the_same_value():
+    pcm = synthetic_answer(15, seed=3)
+    frames = frame_features(pcm, SR, pitch=False)
+    assert score_features(summarize_frames(frames)) == get_confidence_score(pcm, SR)
+
+
+def test_pitch_feature_is_optional():
+    pcm = synthetic_answer(15, seed=4)
+    assert "pitch_std" not in extract_features(pcm, SR, pitch=False)
+    assert extract_features(pcm, SR, pitch=True)["pitch_std"] > 0
+
+
+def test_close_to_legacy_scores():
+    # CPU time is compared in backend/benchmarks/bench_confidence.py; timing here is flaky on shared runners
+    pytest.importorskip("librosa")
+    for seed in range(4):
+        pcm = synthetic_answer(20, seed=seed)
+        assert abs(get_confidence_score(pcm, SR) - legacy_confidence_score(pcm, SR)) <= 0.1
+
+
+def test_packed_feature_frames_rescore_like_the_live_score():
+    from backend.answer_store import pack_features, score_artifact
+
+    pcm = synthetic_answer(15, seed=5)
+    data = pack_features(frame_features(pcm, SR, pitch=False))
+    assert score_artifact("features", data) == pytest.approx(get_confidence_score(pcm, SR), abs=0.01)
@@ -0,0 +1,37 @@
+import os
+
+os.environ.setdefault("DEFAULT_GROQ_API_KEY", "test-key")
+
+import pytest
+
+from backend import controller_chain, controller_classifier
+
+
+def _broken_classifier(answer):
+    raise ValueError("6 labelled examples, need at least 200")
+
+
+def test_small_dataset_is_rejected():
+    with pytest.raises(ValueError):
+        controller_classifier.check_dataset([("User answer: I led the migration.", "example")] * 5)
+
+
+def test_single_label_dataset_is_rejected(monkeypatch):
+    monkeypatch.setattr(controller_classifier, "CONTROLLER_CLASSIFIER_MIN_EXAMPLES", 2)
+
+    with pytest.raises(ValueError):
+        controller_classifier.check_dataset([("User answer: yes", "probe")] * 3)
+
+
+def test_failing_backend_falls_back_to_the_llm(monkeypatch):
+    monkeypatch.setattr(controller_classifier, "get_controller_decision", _broken_classifier)
+    monkeypatch.setattr(controller_chain, "_llm_controller_decision", lambda question, answer: "clarify")
+
+    assert controller_chain.get_controller_decision("Tell me about yourself.", "I build APIs.", backend="classifier") == "clarify"
+
+
+def test_failing_backend_raises_without_fallback(monkeypatch):
+    monkeypatch.setattr(controller_classifier, "get_controller_decision", _broken_classifier)
+
+    with pytest.raises(ValueError):
+        controller_chain.get_controller_decision("Tell me about yourself.", "I build APIs.", backend="classifier", fallback=False)
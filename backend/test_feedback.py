@@ -0,0 +1,96 @@
+import asyncio
+import os
+
+os.environ.setdefault("DEFAULT_GROQ_API_KEY", "test-key")
+
+from fastapi.testclient import TestClient
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from backend import app as app_module
+from backend import feedback_utils
+from backend.auth import get_current_user
+from backend.coding_session import CodingSession
+
+
+class FakeCollection:
+    """update_one/find_one of the interviews collection, backed by a dict keyed on (userId, sessionId)."""
+
+    def __init__(self):
+        self.docs = {}
+
+    def update_one(self, query, update, upsert=False):
+        key = (query["userId"], query["sessionId"])
+        self.docs.setdefault(key, dict(update["$setOnInsert"]))
+
+    def find_one(self, query):
+        return self.docs.get((query["userId"], query["sessionId"]))
+
+
+def _coding_session():
+    return CodingSession.from_dict({
+        "role": "Backend Developer",
+        "rounds": 1,
+        "current_round": 1,
+        "history": [{"problem": {"title": "Reverse a String"}, "code": "def f(s): return s[::-1]"}],
+        "explanation_history": [],
+        "meta": {"confidence_scores": [0.6], "focus_scores": [1.0]},
+        "problems": [{"title": "Reverse a String"}],
+    })
+
+
+def _compute(monkeypatch, session):
+    collection = FakeCollection()
+    monkeypatch.setattr(app_module, "interviews_collection", collection)
+    doc = asyncio.run(app_module._compute_feedback("user_1", session, "interview_1"))
+    return doc, collection
+
+
+def test_unparseable_llm_feedback_is_marked_as_failed(monkeypatch):
+    monkeypatch.setattr(feedback_utils, "llm", RunnableLambda(lambda _: AIMessage(content="Sure! Here is my evaluation.")))
+    feedback = feedback_utils.generate_hr_feedback([{"question": "Tell me about yourself.", "answer": "I build APIs."}])
+
+    assert feedback["overall"] == 0
+    assert "error" in feedback
+
+
+def test_zeroed_fallback_is_served_but_not_stored(monkeypatch):
+    monkeypatch.setattr(feedback_utils, "code_llm", RunnableLambda(lambda _: AIMessage(content="not json")))
+    doc, collection = _compute(monkeypatch, _coding_session())
+
+    assert "error" in doc["feedback"]
+    assert collection.docs == {}
+
+
+def test_coding_only_feedback_is_stored_with_its_transcript(monkeypatch):
+    reply = '{"correctness": 4, "clarity": 4, "edge_cases": 3, "efficiency": 4, "overall": 4, "summary": "Solid."}'
+    monkeypatch.setattr(feedback_utils, "code_llm", RunnableLambda(lambda _: AIMessage(content=reply)))
+    doc, collection = _compute(monkeypatch, _coding_session())
+
+    assert collection.docs[("user_1", "interview_1")] is not None
+    assert doc["feedback"]["overall"] == 4
+    assert "Problem: Reverse a String" in doc["transcript"]
+    assert "return s[::-1]" in doc["transcript"]
+    assert doc["feedback_etag"]
+
+
+def test_coding_feedback_is_served_from_the_store_on_the_next_request(monkeypatch):
+    reply = '{"correctness": 4, "clarity": 4, "edge_cases": 3, "efficiency": 4, "overall": 4, "summary": "Solid."}'
+    monkeypatch.setattr(feedback_utils, "code_llm", RunnableLambda(lambda _: AIMessage(content=reply)))
+    monkeypatch.setattr(app_module, "interviews_collection", FakeCollection())
+    app_module.app.dependency_overrides[get_current_user] = lambda: "user_coder"
+    app_module.session_store.put("user_coder", _coding_session())
+    try:
+        client = TestClient(app_module.app)
+        first = client.get("/api/feedback")
+        # The interview key given to the coding-only session was persisted, so the stored copy is found
+        second = client.get("/api/feedback", headers={"If-None-Match": first.headers["etag"]})
+    finally:
+        app_module.app.dependency_overrides.clear()
+        stored = app_module.session_store.get("user_coder")
+        app_module.session_store.delete("user_coder")
+
+    assert first.status_code == 200
+    assert first.json()["overall"] == 4
+    assert second.status_code == 304
+    assert stored.meta["interview_key"]
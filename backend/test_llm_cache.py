@@ -0,0 +1,98 @@
+from types import SimpleNamespace
+
+from backend.llm_cache import CachedLLM, LLMCacheStore
+
+
+class FakeLLM:
+    """Counts calls and echoes the prompt back, like a chat model returning a message."""
+
+    def __init__(self, model_name="fake-model", temperature=0.7):
+        self.model_name = model_name
+        self.temperature = temperature
+        self.calls = 0
+
+    def invoke(self, prompt, **kwargs):
+        self.calls += 1
+        return SimpleNamespace(content=f"reply {self.calls}: {prompt}")
+
+    def stream(self, prompt, **kwargs):
+        self.calls += 1
+        for word in ["probe", " me"]:
+            yield word
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_repeat_prompt_is_served_from_cache():
+    llm = FakeLLM()
+    cached = CachedLLM(llm, site="test", store=LLMCacheStore())
+
+    first = cached.invoke("Candidate answer:   \n\"\"\"\"\"\"")
+    second = cached.invoke("Candidate answer: \"\"\"\"\"\"")  # same prompt after whitespace normalization
+
+    assert llm.calls == 1
+    assert second.content == first.content
+
+
+def test_model_params_and_site_are_part_of_the_key():
+    store = LLMCacheStore()
+    CachedLLM(FakeLLM(), site="test", store=store).invoke("hello")
+
+    cooler = FakeLLM(temperature=0.0)
+    CachedLLM(cooler, site="test", store=store).invoke("hello")
+    other_site = FakeLLM()
+    CachedLLM(other_site, site="other", store=store).invoke("hello")
+
+    assert cooler.calls == 1
+    assert other_site.calls == 1
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    llm = FakeLLM()
+    cached = CachedLLM(llm, site="test", ttl=60, store=LLMCacheStore(clock=clock))
+
+    cached.invoke("hello")
+    clock.now = 30
+    cached.invoke("hello")
+    clock.now = 61
+    cached.invoke("hello")
+
+    assert llm.calls == 2
+
+
+def test_invalid_results_are_not_cached():
+    llm = FakeLLM()
+    cached = CachedLLM(llm, site="test", validate=lambda r: False, store=LLMCacheStore())
+
+    cached.invoke("hello")
+    cached.invoke("hello")
+
+    assert llm.calls == 2
+
+
+def test_sqlite_tier_survives_a_new_process(tmp_path):
+    path = str(tmp_path / "llm_cache.sqlite")
+    CachedLLM(FakeLLM(), site="test", store=LLMCacheStore(sqlite_path=path)).invoke("hello")
+
+    # A fresh store has an empty LRU, so this hit can only come from SQLite
+    llm = FakeLLM()
+    reply = CachedLLM(llm, site="test", store=LLMCacheStore(sqlite_path=path)).invoke("hello")
+
+    assert llm.calls == 0
+    assert reply.content == "reply 1: hello"
+
+
+def test_stream_hit_replays_joined_chunks():
+    llm = FakeLLM()
+    cached = CachedLLM(llm, site="test", store=LLMCacheStore())
+
+    assert list(cached.stream("hello")) == ["probe", " me"]
+    assert list(cached.stream("hello")) == ["probe me"]
+    assert llm.calls == 1
@@ -0,0 +1,103 @@
+import os
+
+os.environ.setdefault("DEFAULT_GROQ_API_KEY", "test-key")
+
+import pytest
+
+from backend import resume_cache
+from backend.resume_cache import RESUME_PARSER_VERSION, parse_resume_cached, resume_digest
+
+PDF = b"%PDF-1.4 Jane Doe resume"
+SECTIONS = [("header", "Jane Doe\njane@example.com"), ("skills", "Python\nRedis")]
+PARSED = {"name": "Jane Doe", "email": "jane@example.com", "skills": ["Python", "Redis"]}
+
+
+class FakeCollection:
+    """find_one/update_one of the resume cache, keyed on _id."""
+
+    def __init__(self):
+        self.docs = {}
+
+    def find_one(self, query):
+        return self.docs.get(query["_id"])
+
+    def update_one(self, query, update, upsert=False):
+        self.docs.setdefault(query["_id"], {"_id": query["_id"]}).update(update["$set"])
+
+
+class FakeParser:
+    """Stands in for PDF extraction and the LLM parse, counting calls."""
+
+    def __init__(self, parsed=PARSED, sections=SECTIONS):
+        self.parsed = parsed
+        self.sections = sections
+        self.extracted = 0
+        self.parsed_calls = 0
+
+    def extract(self, contents):
+        self.extracted += 1
+        return self.sections
+
+    def parse(self, sections):
+        self.parsed_calls += 1
+        return self.parsed
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    collection = FakeCollection()
+    monkeypatch.setattr(resume_cache, "resume_cache_collection", collection)
+    return collection
+
+
+def _use(monkeypatch, parser):
+    monkeypatch.setattr(resume_cache, "extract_sections_from_pdf", parser.extract)
+    monkeypatch.setattr(resume_cache, "parse_resume_sections", parser.parse)
+    return parser
+
+
+def test_same_file_is_parsed_once(cache, monkeypatch):
+    parser = _use(monkeypatch, FakeParser())
+
+    assert parse_resume_cached(PDF) == PARSED
+    assert parse_resume_cached(PDF) == PARSED
+    assert parser.extracted == 1 and parser.parsed_calls == 1
+    assert cache.docs[resume_digest(PDF)]["version"] == RESUME_PARSER_VERSION
+
+
+def test_different_file_is_a_miss(cache, monkeypatch):
+    parser = _use(monkeypatch, FakeParser())
+
+    parse_resume_cached(PDF)
+    parse_resume_cached(PDF + b" v2")
+
+    assert parser.parsed_calls == 2
+    assert len(cache.docs) == 2
+
+
+def test_older_parser_version_is_reparsed_from_stored_sections(cache, monkeypatch):
+    digest = resume_digest(PDF)
+    cache.docs[digest] = {"_id": digest, "sections": SECTIONS, "parsed": {"name": "Old"}, "version": RESUME_PARSER_VERSION - 1}
+    parser = _use(monkeypatch, FakeParser())
+
+    assert parse_resume_cached(PDF) == PARSED
+    assert parser.extracted == 0 and parser.parsed_calls == 1
+    assert cache.docs[digest]["version"] == RESUME_PARSER_VERSION
+    assert cache.docs[digest]["parsed"] == PARSED
+
+
+def test_parse_errors_are_never_stored(cache, monkeypatch):
+    parser = _use(monkeypatch, FakeParser(parsed={"error": "Failed to parse resume"}))
+
+    assert "error" in parse_resume_cached(PDF)
+    assert "error" in parse_resume_cached(PDF)
+    assert cache.docs == {}
+    assert parser.parsed_calls == 2
+
+
+def test_pdf_without_text_is_not_parsed_or_stored(cache, monkeypatch):
+    parser = _use(monkeypatch, FakeParser(sections=[]))
+
+    assert parse_resume_cached(PDF) == {"error": "Could not extract text from PDF"}
+    assert parser.parsed_calls == 0
+    assert cache.docs == {}
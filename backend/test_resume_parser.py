@@ -0,0 +1,84 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+os.environ.setdefault("DEFAULT_GROQ_API_KEY", "test-key")
+
+from backend import resume_parser
+from backend.resume_parser import SECTION_CHAR_LIMIT, parse_resume_sections, split_chunks
+
+
+def test_split_chunks_keeps_every_character():
+    text = "\n".join(f"- Built service {i} with Python and Kafka" for i in range(400))
+    chunks = split_chunks(text)
+
+    assert len(chunks) > 1
+    assert all(len(chunk) <= SECTION_CHAR_LIMIT for chunk in chunks)
+    assert "".join(chunks) == text
+
+
+def test_long_sections_are_parsed_in_chunks_and_merged(monkeypatch):
+    skills = [f"skill{i}" for i in range(900)]
+    sections = [
+        ("header", "Jane Doe\njane@example.com"),
+        ("skills", "\n".join(skills)),
+        ("experience", "Engineer at Acme"),
+    ]
+
+    def fake_parse(section, text, max_retries):
+        if section == "skills":
+            return {"skills": text.split()}
+        if section == "header":
+            return {"name": "Jane Doe", "email": "jane@example.com", "phone": ""}
+        return {"experience": [{"title": "Engineer", "company": "Acme", "duration": "", "description": ""}]}
+
+    monkeypatch.setattr(resume_parser, "_parse_section", fake_parse)
+    parsed = parse_resume_sections(sections)
+
+    assert parsed["skills"] == skills
+    assert parsed["name"] == "Jane Doe"
+    assert len(parsed["experience"]) == 1
+
+
+class RecordingPool(ThreadPoolExecutor):
+    """A caller-supplied executor that counts the parses submitted to it."""
+
+    def __init__(self):
+        super().__init__(max_workers=2)
+        self.submitted = 0
+
+    def submit(self, fn, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(fn, *args, **kwargs)
+
+
+SECTIONS = [("header", "Jane Doe"), ("skills", "Python"), ("experience", "Engineer at Acme")]
+
+
+def test_every_section_failing_returns_the_fallback_error(monkeypatch):
+    monkeypatch.setattr(resume_parser, "_parse_section", lambda section, text, max_retries: None)
+    monkeypatch.setattr(resume_parser, "_parse_text_chunk", lambda text, max_retries: {"error": "Failed to process resume: 429"})
+
+    assert parse_resume_sections(SECTIONS) == {"error": "Failed to process resume: 429"}
+
+
+def test_failed_fallback_keeps_the_sections_that_parsed(monkeypatch):
+    def fake_parse(section, text, max_retries):
+        return {"skills": ["Python"]} if section == "skills" else None
+
+    monkeypatch.setattr(resume_parser, "_parse_section", fake_parse)
+    monkeypatch.setattr(resume_parser, "_parse_text_chunk", lambda text, max_retries: {"error": "Failed to process resume: 429"})
+
+    parsed = parse_resume_sections(SECTIONS)
+
+    assert "error" not in parsed
+    assert parsed["skills"] == ["Python"]
+
+
+def test_section_parses_run_on_the_callers_pool(monkeypatch):
+    monkeypatch.setattr(resume_parser, "_parse_section", lambda section, text, max_retries: {})
+    pool = RecordingPool()
+
+    with pool:
+        parse_resume_sections(SECTIONS, pool=pool)
+
+    assert pool.submitted == len(SECTIONS)
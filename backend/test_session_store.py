@@ -0,0 +1,123 @@
+import os
+
+os.environ.setdefault("DEFAULT_GROQ_API_KEY", "test-key")
+
+from backend.coding_session import CodingSession
+from backend.hr_session import HRInterviewSession
+from backend.session_store import (
+    InMemorySessionStore,
+    RedisSessionStore,
+    deserialize_session,
+    serialize_session,
+)
+
+
+class FakeRedis:
+    """The slice of the redis-py client the store uses, backed by a dict."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+def _hr_session():
+    session = HRInterviewSession(role="Backend Developer", session_id="abc_hr", rounds=3)
+    session.ask_question()
+    session.provide_answer("I like building APIs.")
+    session.meta = {"confidence_scores": [0.7], "focus_scores": [1.0], "greeting_sent": True}
+    return session
+
+
+def _coding_session():
+    return CodingSession.from_dict({
+        "role": "Backend Developer",
+        "rounds": 2,
+        "current_round": 1,
+        "history": [{"problem": {"title": "Reverse a String"}, "code": "def f(s): return s[::-1]"}],
+        "explanation_history": [{"user": "I slice it backwards"}],
+        "meta": {},
+        "problems": [{"title": "Reverse a String"}, {"title": "Find Max in List"}],
+    })
+
+
+def test_in_memory_store_returns_live_object():
+    store = InMemorySessionStore()
+    session = _hr_session()
+    store.put("user_1", session)
+    assert store.get("user_1") is session
+    store.delete("user_1")
+    assert store.get("user_1") is None
+
+
+def test_hr_session_round_trip():
+    session = _hr_session()
+    restored = deserialize_session(serialize_session(session))
+
+    assert isinstance(restored, HRInterviewSession)
+    assert restored.history == session.history
+    assert restored.current_round == session.current_round
+    assert restored.meta == session.meta
+
+
+def test_full_mode_round_trip_keeps_routing_fields():
+    session_info = {"mode": "full", "current": "code", "role": "Backend Developer", "hr": _hr_session(), "code": _coding_session()}
+    restored = deserialize_session(serialize_session(session_info))
+
+    assert restored["mode"] == "full"
+    assert restored["current"] == "code"
+    assert isinstance(restored["code"], CodingSession)
+    assert restored["code"].get_next_problem() == {"title": "Find Max in List"}
+
+
+def test_redis_store_resumes_on_another_worker():
+    client = FakeRedis()
+    RedisSessionStore(client=client).put("user_1", _hr_session())
+
+    # A second store instance stands in for a different worker sharing the same Redis
+    restored = RedisSessionStore(client=client).get("user_1")
+    assert restored.history[0]["answer"] == "I like building APIs."
+
+    RedisSessionStore(client=client).delete("user_1")
+    assert RedisSessionStore(client=client).get("user_1") is None
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_idle_sessions_expire_after_ttl():
+    clock = FakeClock()
+    store = InMemorySessionStore(ttl=60, max_sessions=10, clock=clock)
+    store.put("user_1", _hr_session())
+
+    clock.now = 30
+    assert store.get("user_1") is not None  # access refreshes the idle timer
+
+    clock.now = 100
+    assert store.sweep() == 1
+    assert store.get("user_1") is None
+
+
+def test_lru_eviction_persists_to_fallback_and_resumes():
+    fallback = RedisSessionStore(client=FakeRedis())
+    store = InMemorySessionStore(ttl=3600, max_sessions=2, fallback=fallback, clock=FakeClock())
+    store.put("user_1", _hr_session())
+    store.put("user_2", _hr_session())
+    store.get("user_1")  # user_2 is now least recently used
+    store.put("user_3", _hr_session())
+
+    assert set(store._sessions) == {"user_1", "user_3"}
+    resumed = store.get("user_2")
+    assert resumed.history[0]["answer"] == "I like building APIs."
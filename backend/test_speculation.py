@@ -0,0 +1,41 @@
+import pytest
+
+from backend.speculation import draft_matches, use_draft
+
+FINAL = "I used Redis for caching the session data in our API layer"
+
+
+@pytest.mark.parametrize(
+    "draft_answer, final_answer, expected",
+    [
+        # match
+        (FINAL, FINAL, True),
+        ("I used Redis for caching the session data in our API", FINAL, True),
+        ("i used redis, for caching the session data in our api layer!", FINAL, True),
+        ("", "", True),
+        # near match: Whisper revised the last word of the partial
+        ("I used Redis for caching the session data in our APIs", FINAL, True),
+        # near miss: two of eight words changed
+        ("I used Postgres for storing the session data", "I used Redis for caching the session data", False),
+        # mismatch
+        ("We deployed everything to Kubernetes with Helm charts and Argo", FINAL, False),
+        ("I used Redis for caching", FINAL, False),  # partial covers too little of the answer
+        ("I used Redis", "", False),
+        ("", FINAL, False),
+    ],
+)
+def test_draft_matches(draft_answer, final_answer, expected):
+    assert draft_matches(draft_answer, final_answer) is expected
+
+
+@pytest.mark.parametrize(
+    "draft, current_round, expected",
+    [
+        ({"answer": FINAL, "round": 3, "question": "Why Redis?"}, 3, True),
+        ({"answer": FINAL, "round": 2, "question": "Why Redis?"}, 3, False),  # drafted for an earlier turn
+        ({"answer": "I mostly wrote frontend code in React", "round": 3, "question": "Why React?"}, 3, False),
+        (None, 3, False),
+    ],
+)
+def test_use_draft(draft, current_round, expected):
+    assert use_draft(draft, FINAL, current_round) is expected
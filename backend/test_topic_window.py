@@ -0,0 +1,59 @@
+import os
+
+os.environ.setdefault("DEFAULT_GROQ_API_KEY", "test-key")
+
+from backend.interview_session import RECENT_TOPIC_WINDOW, InterviewSession
+
+OPENER_KEYWORDS = ["briefly", "describe", "technical"]
+
+
+def _session(*questions):
+    session = InterviewSession(resume_obj={"skills": ["Python"]}, role="Backend Developer")
+    for question in questions:
+        session._append_question(question)
+    return session
+
+
+def test_opener_keywords_are_the_first_topics():
+    assert _session()._extract_recent_topics() == OPENER_KEYWORDS
+
+
+def test_frequent_topics_rank_first_then_most_recent():
+    session = _session(
+        "Explain redis caching strategy",
+        "Explain kafka partitions",
+        "Compare redis kafka",
+    )
+
+    topics = session._extract_recent_topics()
+
+    # redis, kafka and explain appear twice; ties (and the rest) keep the newest first
+    assert topics[:3] == ["redis", "kafka", "explain"]
+    assert topics[3:] == ["compare", "partitions", "caching"] + OPENER_KEYWORDS
+
+
+def test_window_keeps_only_the_last_questions():
+    session = _session(*[f"Explain topic{i} deeply" for i in range(RECENT_TOPIC_WINDOW + 2)])
+
+    topics = session._extract_recent_topics()
+
+    assert "topic0" not in topics and "topic1" not in topics
+    assert "briefly" not in topics
+    assert len(session._topic_window) == RECENT_TOPIC_WINDOW
+
+
+def test_refcounts_drop_keywords_that_leave_the_window():
+    session = _session("Explain redis caching", *["Describe kafka consumers"] * RECENT_TOPIC_WINDOW)
+
+    assert "redis" not in session._topic_counts
+    assert session._topic_counts["kafka"] == RECENT_TOPIC_WINDOW
+    assert all(count > 0 for count in session._topic_counts.values())
+
+
+def test_restored_session_rebuilds_the_same_window():
+    session = _session(*[f"Explain topic{i} with redis" for i in range(RECENT_TOPIC_WINDOW + 1)])
+
+    restored = InterviewSession.from_dict(session.to_dict())
+
+    assert restored._extract_recent_topics() == session._extract_recent_topics()
+    assert restored._topic_counts == session._topic_counts
@@ -0,0 +1,43 @@
+import numpy as np
+
+from backend.vad import has_speech, speech_segments, trim_silence
+
+SR = 16000
+
+
+def _tone(seconds, amplitude=0.2):
+    t = np.arange(int(seconds * SR)) / SR
+    return (amplitude * np.sin(2 * np.pi * 180 * t)).astype(np.float32)
+
+
+def _silence(seconds, seed=0, level=0.001):
+    return (level * np.random.default_rng(seed).standard_normal(int(seconds * SR))).astype(np.float32)
+
+
+def test_silence_is_not_speech():
+    pcm = _silence(5)
+    assert not has_speech(pcm, SR)
+    assert speech_segments(pcm, SR) == []
+    assert len(trim_silence(pcm, SR)) == 0
+
+
+def test_trim_drops_leading_trailing_and_long_pauses():
+    pcm = np.concatenate([_silence(3), _tone(1), _silence(4, seed=1), _tone(1.5), _silence(3, seed=2)])
+    segments = speech_segments(pcm, SR)
+
+    assert len(segments) == 2
+    assert segments[0][0] < 3 * SR < segments[0][1]
+    # 2.5 s of speech plus padding survives out of 12.5 s
+    assert 2.5 * SR <= len(trim_silence(pcm, SR)) <= 3.2 * SR
+
+
+def test_short_pauses_are_bridged():
+    pcm = np.concatenate([_silence(1), _tone(1), _silence(0.15), _tone(1), _silence(1, seed=1)])
+    assert len(speech_segments(pcm, SR)) == 1
+
+
+def test_low_gain_microphone_is_still_speech():
+    # Speech around -46 dBFS over a -66 dBFS noise floor, as from a quiet laptop mic
+    pcm = np.concatenate([_silence(1, level=0.0005), _tone(1.5, amplitude=0.007), _silence(1, seed=1, level=0.0005)])
+    assert has_speech(pcm, SR)
+    assert len(speech_segments(pcm, SR)) == 1
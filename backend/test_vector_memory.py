@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from backend import vector_memory
+from backend.vector_memory import VectorMemory
+
+VOCAB = ["redis", "caching", "kafka", "queue", "react", "hooks", "testing", "scaling"]
+
+
+class StubEmbeddings:
+    """Unit-norm bag of VOCAB words, so similarities are known in advance."""
+
+    dimension = len(VOCAB)
+
+    def embed(self, text):
+        words = text.lower().replace("?", "").split()
+        vector = np.array([words.count(word) for word in VOCAB], dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def embed_many(self, texts):
+        return np.stack([self.embed(text) for text in texts]) if texts else np.zeros((0, self.dimension), np.float32)
+
+
+@pytest.fixture
+def memory(monkeypatch):
+    monkeypatch.setattr(vector_memory, "get_embedding_service", lambda model_name: StubEmbeddings())
+    return VectorMemory()
+
+
+def test_empty_memory_has_no_similar_question(memory):
+    assert memory.max_similarity("Why redis caching?") == 0.0
+    assert not memory.is_duplicate_topic("Why redis caching?")
+
+
+def test_index_grows_past_its_initial_capacity(memory):
+    questions = [f"{VOCAB[i % len(VOCAB)]} question {i}" for i in range(40)]
+    for question in questions:
+        memory.add_qa(question, "answer")
+
+    assert memory._count == 40
+    assert len(memory._vectors) >= 40
+    np.testing.assert_allclose(memory._vectors[:40], memory.embeddings.embed_many(questions))
+
+
+@pytest.mark.parametrize(
+    "question, expected",
+    [
+        ("Why redis caching?", 1.0),
+        ("Why redis?", np.sqrt(0.5)),
+        ("How do react hooks work?", 0.0),
+    ],
+)
+def test_max_similarity_is_the_best_cosine(memory, question, expected):
+    memory.add_qa("How did you use redis caching?", "For sessions.")
+    memory.add_qa("How did you use kafka queue?", "For events.")
+
+    assert memory.max_similarity(question) == pytest.approx(expected, abs=1e-6)
+
+
+@pytest.mark.parametrize(
+    "question, threshold, expected",
+    [
+        ("Why redis caching?", 0.85, True),
+        ("Why redis?", 0.85, False),  # 0.71: related, not a repeat
+        ("Why redis?", 0.7, True),
+        ("How do react hooks work?", 0.85, False),
+    ],
+)
+def test_duplicate_threshold(memory, question, threshold, expected):
+    memory.add_qa("How did you use redis caching?", "For sessions.")
+
+    assert memory.is_duplicate_topic(question, threshold=threshold) is expected
+
+
+def test_pending_questions_count_as_asked(memory):
+    assert not memory.is_duplicate_topic("Why redis caching?")
+    assert memory.is_duplicate_topic("Why redis caching?", pending=["How did you use redis caching?"])
+    assert memory.qa_pairs == []
+
+
+def test_restored_memory_re_embeds_on_first_use(memory):
+    memory.add_qa("How did you use redis caching?", "For sessions.")
+    restored = VectorMemory.from_dict(memory.to_dict())
+
+    assert restored._count == 0
+    assert restored.is_duplicate_topic("Why redis caching?")
+    assert restored._count == 1
@@ -0,0 +1,105 @@
+# backend/vad.py
+
+import os
+
+import numpy as np
+
+from backend.audio_decode import SAMPLE_RATE
+
+FRAME_MS = 30
+
+# Absolute floor for "speech" RMS on [-1, 1] audio; the adaptive threshold never goes below it.
+# 0.003 (about -50 dBFS) still catches low-gain laptop and headset mics, whose speech can sit
+# around -45 dBFS; raise it for noisy rooms where the noise-relative rule is not enough.
+# Only speech detection uses it: the confidence scorer keeps its own floor.
+VAD_ENERGY_FLOOR = float(os.getenv("VAD_ENERGY_FLOOR", 0.003))
+# Speech frames must be this many times louder than the estimated noise floor
+NOISE_RATIO = 3.0
+
+
+def frame_rms(pcm, sr=SAMPLE_RATE, frame_ms=FRAME_MS):
+    """RMS energy of non-overlapping frames (a trailing partial frame is dropped)."""
+    frame_len = int(sr * frame_ms / 1000)
+    n_frames = len(pcm) // frame_len
+    if n_frames == 0:
+        return np.zeros(0, dtype=np.float32)
+    frames = np.asarray(pcm[: n_frames * frame_len], dtype=np.float32).reshape(n_frames, frame_len)
+    return np.sqrt(np.mean(frames * frames, axis=1))
+
+
+def speech_mask(pcm, sr=SAMPLE_RATE, frame_ms=FRAME_MS):
+    """Boolean per-frame speech decision using an adaptive energy threshold."""
+    rms = frame_rms(pcm, sr, frame_ms)
+    if rms.size == 0:
+        return np.zeros(0, dtype=bool)
+    noise_floor = np.percentile(rms, 10)
+    threshold = max(VAD_ENERGY_FLOOR, noise_floor * NOISE_RATIO)
+    return rms > threshold
+
+
+def has_speech(pcm, sr=SAMPLE_RATE, min_speech_ms=250, frame_ms=FRAME_MS):
+    return int(speech_mask(pcm, sr, frame_ms).sum()) * frame_ms >= min_speech_ms
+
+
+def last_pause(pcm, sr=SAMPLE_RATE, min_silence_ms=500, frame_ms=FRAME_MS):
+    """
+    Sample index in the middle of the last pause of at least `min_silence_ms`
+    that follows speech, or None. Cutting there never splits a word.
+    """
+    mask = speech_mask(pcm, sr, frame_ms)
+    if not mask.any():
+        return None
+
+    min_frames = max(1, min_silence_ms // frame_ms)
+    frame_len = int(sr * frame_ms / 1000)
+    first_speech = int(np.argmax(mask))
+
+    # Walk silent runs from the end; the first long-enough one after speech wins
+    end = len(mask)
+    while end > first_speech:
+        silent = np.flatnonzero(~mask[first_speech:end])
+        if silent.size == 0:
+            return None
+        run_end = first_speech + int(silent[-1]) + 1
+        run_start = run_end
+        while run_start > first_speech and not mask[run_start - 1]:
+            run_start -= 1
+        if run_end - run_start >= min_frames:
+            return ((run_start + run_end) // 2) * frame_len
+        end = run_start
+    return None
+
+
+def speech_segments(pcm, sr=SAMPLE_RATE, min_silence_ms=300, pad_ms=150, frame_ms=FRAME_MS):
+    """
+    [(start, end)] sample ranges containing speech. Gaps shorter than
+    `min_silence_ms` are bridged and every range is widened by `pad_ms` so
+    word onsets and tails survive; keep min_silence_ms >= 2 * pad_ms so padded
+    ranges never overlap.
+    """
+    mask = speech_mask(pcm, sr, frame_ms)
+    if not mask.any():
+        return []
+
+    edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+    starts, ends = np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+    # Drop the short gaps: a run only starts/ends where the silence around it is long enough
+    long_gap = (starts[1:] - ends[:-1]) >= max(1, min_silence_ms // frame_ms)
+    starts = np.concatenate((starts[:1], starts[1:][long_gap]))
+    ends = np.concatenate((ends[:-1][long_gap], ends[-1:]))
+
+    frame_len = int(sr * frame_ms / 1000)
+    pad = pad_ms // frame_ms
+    return [
+        (max(0, (s - pad) * frame_len), min(len(pcm), (e + pad) * frame_len))
+        for s, e in zip(starts.tolist(), ends.tolist())
+    ]
+
+
+def trim_silence(pcm, sr=SAMPLE_RATE, min_silence_ms=300, pad_ms=150, frame_ms=FRAME_MS):
+    """Speech segments joined back to back: leading/trailing silence and long pauses are cut out."""
+    segments = speech_segments(pcm, sr, min_silence_ms, pad_ms, frame_ms)
+    if not segments:
+        return np.asarray(pcm[:0], dtype=np.float32)
+    return np.concatenate([pcm[s:e] for s, e in segments]).astype(np.float32, copy=False)
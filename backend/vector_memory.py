@@ -1,38 +1,105 @@
 # vector_memory.py
 
-from langchain_community.vectorstores.faiss import FAISS
-from langchain_community.docstore.in_memory import InMemoryDocstore
-from langchain_community.vectorstores.faiss import dependable_faiss_import
-from langchain_community.embeddings import HuggingFaceEmbeddings
+import os
+import threading
+from functools import lru_cache
+
+import numpy as np
+
+from backend.embedding_service import EMBEDDING_MODEL, get_embedding_service
+
+# Cosine similarity at or above which a new question counts as a repeat of an earlier one
+TOPIC_DUPLICATE_THRESHOLD = float(os.getenv("TOPIC_DUPLICATE_THRESHOLD", 0.85))
+
+STOPWORDS = frozenset({
+    'the', 'and', 'for', 'you', 'your', 'can', 'with', 'that', 'this',
+    'from', 'have', 'had', 'been', 'they', 'their', 'what', 'when', 'how',
+    'why', 'are', 'was', 'will', 'would', 'could', 'should', 'about',
+    'also', 'there', 'which', 'more', 'than', 'such', 'those', 'these',
+    'were', 'while', 'where', 'into', 'onto', 'over', 'under'
+})
+
+
+@lru_cache(maxsize=4096)
+def extract_keywords(text):
+    """
+    Keywords of `text` in order of first appearance, deduplicated.
+    Cached, so fixed questions shared by every session (like the opener) are processed once.
+    """
+    keywords = {}
+    for word in text.lower().split():
+        word = word.strip(".,!?()[]\"'")
+        if len(word) > 3 and word not in STOPWORDS:
+            keywords.setdefault(word, None)
+    return tuple(keywords)
+
 
 class VectorMemory:
-    def __init__(self, model_name="all-MiniLM-L6-v2"):
-        self.embeddings = HuggingFaceEmbeddings(model_name=model_name)
+    def __init__(self, model_name=EMBEDDING_MODEL):
+        # Shared across sessions and loaded on first encode, so creating a session costs nothing
+        self.embeddings = get_embedding_service(model_name)
         self.qa_pairs = []  # List of {"question": q, "answer": a}
-        self.stopwords = {
-            'the', 'and', 'for', 'you', 'your', 'can', 'with', 'that', 'this',
-            'from', 'have', 'had', 'been', 'they', 'their', 'what', 'when', 'how',
-            'why', 'are', 'was', 'will', 'would', 'could', 'should', 'about',
-            'also', 'there', 'which', 'more', 'than', 'such', 'those', 'these',
-            'were', 'while', 'where', 'into', 'onto', 'over', 'under'
-        }
+        # Unit-norm question embeddings, one row per qa_pairs entry; rows past _count are spare capacity
+        self._vectors = None
+        self._count = 0
+        # The speculative draft and the live turn can both touch the index from different llm-pool threads
+        self._lock = threading.Lock()
+        self.stopwords = STOPWORDS
+
+    def to_dict(self):
+        # Vectors are not stored; they are re-embedded on first use after a restore
+        return {"qa_pairs": self.qa_pairs}
+
+    @classmethod
+    def from_dict(cls, data):
+        memory = cls()
+        memory.qa_pairs = data.get("qa_pairs", [])
+        return memory
 
     def add_qa(self, question, answer):
-        self.qa_pairs.append({"question": question, "answer": answer})
+        with self._lock:
+            self.qa_pairs.append({"question": question, "answer": answer})
+            self._sync_index()
+
+    def _sync_index(self):
+        """Embed any questions not yet in the matrix (normally just the one added). Caller holds _lock."""
+        missing = [pair["question"] for pair in self.qa_pairs[self._count:]]
+        if not missing:
+            return
+        vectors = self.embeddings.embed_many(missing)
+
+        needed = self._count + len(vectors)
+        if self._vectors is None or needed > len(self._vectors):
+            # Grow geometrically so appends stay amortized O(1)
+            capacity = max(16, needed, 2 * (0 if self._vectors is None else len(self._vectors)))
+            grown = np.empty((capacity, vectors.shape[1]), dtype=np.float32)
+            if self._vectors is not None:
+                grown[: self._count] = self._vectors[: self._count]
+            self._vectors = grown
+
+        self._vectors[self._count:needed] = vectors
+        self._count = needed
 
-    def is_duplicate_topic(self, new_question):
-        new_keywords = self._extract_keywords(new_question)
+    def max_similarity(self, question, pending=()):
+        """
+        Highest cosine similarity between `question` and any past question.
+        `pending` are questions not added yet (e.g. the one still being answered) to compare against as well.
+        """
+        with self._lock:
+            self._sync_index()
+            # Rows below _count are never rewritten, so this view stays valid once the lock is released
+            past = self._vectors[: self._count] if self._count else None
+        if pending:
+            pending = self.embeddings.embed_many(list(pending))
+            past = pending if past is None else np.vstack([past, pending])
+        if past is None:
+            return 0.0
+        # Rows are unit-norm, so one matrix-vector product gives every cosine similarity
+        return float(np.max(past @ self.embeddings.embed(question)))
 
-        for past in self.qa_pairs:
-            past_keywords = self._extract_keywords(past["question"])
-            overlap = len(new_keywords.intersection(past_keywords))
-            if overlap >= 3:
-                return True  # Considered duplicate
-        return False
+    def is_duplicate_topic(self, new_question, threshold=None, pending=()):
+        threshold = TOPIC_DUPLICATE_THRESHOLD if threshold is None else threshold
+        return self.max_similarity(new_question, pending) >= threshold
 
     def _extract_keywords(self, text):
-        words = text.lower().split()
-        return set(
-            word.strip(".,!?()[]\"'") for word in words
-            if len(word) > 3 and word not in self.stopwords
-        )
+        return set(extract_keywords(text))
@@ -15,6 +15,25 @@ import { useUser } from "@clerk/clerk-react";
 const API_BASE_URL =
   import.meta.env.VITE_API_URL || "http://localhost:8000";
 
+// Stream answers over /ws/audio (partial transcripts, streamed questions).
+// Set VITE_STREAM_AUDIO=false to upload each answer to /api/audio instead.
+const STREAM_AUDIO = import.meta.env.VITE_STREAM_AUDIO !== "false";
+// Let the server draft the next question while the candidate pauses
+const SPECULATIVE_QUESTIONS =
+  import.meta.env.VITE_SPECULATIVE_QUESTIONS === "true";
+// Chunk size while streaming; smaller = earlier partials, more messages
+const STREAM_TIMESLICE_MS = 250;
+
+// Browsers cannot set headers on a WebSocket, so the Clerk ids go in the query
+const audioStreamUrl = (headers) => {
+  const url = new URL("/ws/audio", API_BASE_URL);
+  url.protocol = url.protocol === "https:" ? "wss:" : "ws:";
+  url.searchParams.set("user_id", headers["X-User-Id"] || "");
+  url.searchParams.set("user_email", headers["X-User-Email"] || "");
+  if (SPECULATIVE_QUESTIONS) url.searchParams.set("speculative", "1");
+  return url.toString();
+};
+
 /**
  * Build auth headers for the backend.
  * Your FastAPI auth dependency expects Clerk headers:
@@ -48,12 +67,49 @@ const useAutoDetectRecorder = () => {
   const chunksRef = useRef([]);
   const recordingTimerRef = useRef(null);
   const animationFrameRef = useRef(null);
+  const socketRef = useRef(null);
+  const streamResultRef = useRef(null);
+  const streamHandlersRef = useRef({});
 
   const [isRecording, setIsRecording] = useState(false);
   const [frequency, setFrequency] = useState([]);
   const [recordingTime, setRecordingTime] = useState(0);
 
-  const startAudioCapture = async () => {
+  // Open the answer socket before recording so no chunk is lost.
+  // Resolves false (and the answer is uploaded instead) if it cannot connect.
+  const openAudioStream = (url) =>
+    new Promise((resolveOpen) => {
+      const socket = new WebSocket(url);
+
+      streamResultRef.current = new Promise((resolve, reject) => {
+        socket.onmessage = (event) => {
+          const message = JSON.parse(event.data);
+          const { onPartial, onToken } = streamHandlersRef.current;
+          if (message.type === "partial") onPartial?.(message.text);
+          else if (message.type === "token") onToken?.(message.text, message.replace);
+          else if (message.type === "final") resolve(message);
+          else if (message.type === "error")
+            reject(new Error(message.detail || "Audio stream failed"));
+        };
+        socket.onclose = (event) => {
+          if (event.code !== 1000)
+            reject(new Error(`Audio stream closed (${event.code})`));
+        };
+      });
+      // Unhandled until an answer is actually sent
+      streamResultRef.current.catch(() => {});
+
+      socket.onopen = () => {
+        socketRef.current = socket;
+        resolveOpen(true);
+      };
+      socket.onerror = () => {
+        socketRef.current = null;
+        resolveOpen(false);
+      };
+    });
+
+  const startAudioCapture = async ({ streamUrl = null, onPartial, onToken } = {}) => {
     try {
       const stream = await navigator.mediaDevices.getUserMedia({
         audio: true,
@@ -80,11 +136,18 @@ const useAutoDetectRecorder = () => {
       mediaRecorderRef.current = mediaRecorder;
       chunksRef.current = [];
 
+      streamHandlersRef.current = { onPartial, onToken };
+      const streaming = streamUrl ? await openAudioStream(streamUrl) : false;
+
       mediaRecorder.ondataavailable = (e) => {
-        if (e.data.size > 0) chunksRef.current.push(e.data);
+        if (e.data.size > 0) {
+          chunksRef.current.push(e.data);
+          if (socketRef.current?.readyState === WebSocket.OPEN)
+            socketRef.current.send(e.data);
+        }
       };
 
-      mediaRecorder.start();
+      mediaRecorder.start(streaming ? STREAM_TIMESLICE_MS : undefined);
       setIsRecording(true);
       return analyser;
     } catch (err) {
@@ -130,6 +193,22 @@ const useAutoDetectRecorder = () => {
     });
   };
 
+  // After stopAudioCapture: ask the server for the final payload of a streamed answer.
+  // Returns null when the answer was not streamed.
+  const finishAudioStream = (focusScore, { onToken } = {}) => {
+    const socket = socketRef.current;
+    socketRef.current = null;
+    if (!socket || socket.readyState !== WebSocket.OPEN) return null;
+    streamHandlersRef.current = { ...streamHandlersRef.current, onToken };
+    socket.send(JSON.stringify({ type: "end", focus_score: focusScore }));
+    return streamResultRef.current;
+  };
+
+  const abortAudioStream = () => {
+    socketRef.current?.close();
+    socketRef.current = null;
+  };
+
   const detectSpeech = (analyser, onSpeechStart, onSpeechEnd) => {
     let isSpeaking = false;
     let silenceCounter = 0;
@@ -171,6 +250,8 @@ const useAutoDetectRecorder = () => {
   return {
     startAudioCapture,
     stopAudioCapture,
+    finishAudioStream,
+    abortAudioStream,
     detectSpeech,
     frequency,
     recordingTime,
@@ -241,6 +322,8 @@ const InterviewSession = ({ sessionConfig: sessionConfigProp, onComplete }) => {
   const {
     startAudioCapture,
     stopAudioCapture,
+    finishAudioStream,
+    abortAudioStream,
     detectSpeech,
     frequency,
     recordingTime,
@@ -283,7 +366,14 @@ const InterviewSession = ({ sessionConfig: sessionConfigProp, onComplete }) => {
   // Start listening
   const startListening = async () => {
     setIsCapturing(true);
-    const analyser = await startAudioCapture();
+    const analyser = await startAudioCapture(
+      STREAM_AUDIO
+        ? {
+            streamUrl: audioStreamUrl(getAuthHeaders()),
+            onPartial: (text) => setTranscript(text),
+          }
+        : {}
+    );
     if (!analyser) {
       setError("Microphone permission denied or unavailable.");
       setIsCapturing(false);
@@ -307,26 +397,41 @@ const InterviewSession = ({ sessionConfig: sessionConfigProp, onComplete }) => {
       if (!audioBlob || audioBlob.size === 0)
         throw new Error("No audio captured");
 
-      const formData = new FormData();
-      formData.append("audio", audioBlob, "recording.webm");
-      formData.append("focus_score", focusScore.toString());
-
-      const res = await fetch(`${API_BASE_URL}/api/audio`, {
-        method: "POST",
-        headers: {
-          ...getAuthHeaders(),
+      // Streamed answer: the next question is shown as its tokens arrive
+      let streamedQuestion = "";
+      const streamed = finishAudioStream(focusScore, {
+        onToken: (token, replace) => {
+          // `replace`: the server rejected what it streamed so far (repeated topic)
+          streamedQuestion = replace ? token : streamedQuestion + token;
+          setCurrentQuestion(streamedQuestion);
         },
-        body: formData,
       });
 
-      if (!res.ok) {
-        const err = await res.json().catch(() => ({}));
-        throw new Error(
-          err.detail || `Audio upload failed (${res.status})`
-        );
-      }
+      let data;
+      if (streamed) {
+        data = await streamed;
+      } else {
+        const formData = new FormData();
+        formData.append("audio", audioBlob, "recording.webm");
+        formData.append("focus_score", focusScore.toString());
+
+        const res = await fetch(`${API_BASE_URL}/api/audio`, {
+          method: "POST",
+          headers: {
+            ...getAuthHeaders(),
+          },
+          body: formData,
+        });
 
-      const data = await res.json();
+        if (!res.ok) {
+          const err = await res.json().catch(() => ({}));
+          throw new Error(
+            err.detail || `Audio upload failed (${res.status})`
+          );
+        }
+
+        data = await res.json();
+      }
       setTranscript(data.answer || "[Answer recorded]");
       setCurrentConfidence(data.confidence || 0);
 
@@ -342,7 +447,7 @@ const InterviewSession = ({ sessionConfig: sessionConfigProp, onComplete }) => {
       setQuestionsRemaining((p) => Math.max(0, p - 1));
 
       // Complete or next
-      if (data.text && /(complete|thank you)/i.test(data.text)) {
+      if (data.complete || (data.text && /(complete|thank you)/i.test(data.text))) {
         setSessionComplete(true);
         return;
       }
@@ -368,6 +473,7 @@ const InterviewSession = ({ sessionConfig: sessionConfigProp, onComplete }) => {
     try {
       window.speechSynthesis?.cancel();
       if (isCapturing) await stopAudioCapture();
+      abortAudioStream();
       if (timerIntervalRef.current)
         clearInterval(timerIntervalRef.current);
       if (videoRef.current?.srcObject)